@@ -5,3 +5,7 @@ class AccountsConfig(AppConfig):
     # Django 6: DEFAULT_AUTO_FIELD is BigAutoField by default — no need to set it.
     name = "apps.accounts"
     verbose_name = "Accounts"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.accounts.signals  # noqa: F401
@@ -0,0 +1,147 @@
+"""
+Capability profile for permission checks.
+
+A user's capabilities (role, member status, diaspora flag, and the leader
+positions they hold with their territories) are computed at most once per
+request and memoized on the user instance, so repeated permission checks in
+one request share a single lookup.
+
+When JWT_CAPABILITY_CLAIMS is enabled, access tokens also carry the profile as
+a signed "cap" claim. Held positions are then read from the token instead of
+the governance roster. Claims are trusted only while they still match the user
+row loaded by authentication:
+
+- role / member_status / is_diaspora must equal the current values
+- "v" must equal User.capability_version, which is bumped whenever the user's
+  roster entries change (apps.governance.roster)
+
+Stale claims are ignored and the profile is rebuilt from the database.
+"""
+
+from django.conf import settings
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+CAPABILITY_CLAIM = "cap"
+
+
+class CapabilityProfile:
+    """What the user is allowed to do, as seen by permission classes."""
+
+    def __init__(self, role, member_status, is_diaspora, positions, version):
+        """
+        Args:
+            role: User.Role value
+            member_status: User.MemberStatus value
+            is_diaspora: Diaspora flag
+            positions: (tier, group_id, precinct_id, district_id) tuples of held positions
+            version: User.capability_version the positions were read at
+        """
+        self.role = role
+        self.member_status = member_status
+        self.is_diaspora = is_diaspora
+        self.positions = [tuple(position) for position in positions]
+        self.version = version
+
+    @property
+    def tiers(self):
+        """Set of tiers at which the user holds an active position."""
+        return {position[0] for position in self.positions}
+
+    def holds_tier(self, tier):
+        """Check if the user holds a position at exactly this tier."""
+        return tier in self.tiers
+
+    def is_leader_at_least(self, min_tier):
+        """Check if the user holds a position at min_tier or higher."""
+        return any(tier >= min_tier for tier in self.tiers)
+
+    def to_claims(self):
+        """Return the compact token claim for this profile."""
+        return {
+            "v": self.version,
+            "role": self.role,
+            "ms": self.member_status,
+            "dia": self.is_diaspora,
+            "pos": [list(position) for position in self.positions],
+        }
+
+
+def _profile_from_claims(user, claims):
+    """Return a profile from token claims, or None if they are stale or malformed."""
+    try:
+        if (
+            claims["v"] != user.capability_version
+            or claims["role"] != user.role
+            or claims["ms"] != user.member_status
+            or claims["dia"] != user.is_diaspora
+        ):
+            return None
+        return CapabilityProfile(
+            user.role, user.member_status, user.is_diaspora, claims["pos"], claims["v"]
+        )
+    except (KeyError, TypeError):
+        return None
+
+
+def build_capabilities(user):
+    """Compute a user's capability profile from the governance roster."""
+    from apps.governance.models import RosterEntry
+
+    positions = (
+        RosterEntry.objects.filter(user_id=user.pk)
+        .order_by("tier", "position_id")
+        .values_list("tier", "group_id", "precinct_id", "district_id")
+        if user.pk
+        else []
+    )
+    return CapabilityProfile(
+        user.role, user.member_status, user.is_diaspora, positions, user.capability_version
+    )
+
+
+def get_capabilities(user, token=None):
+    """
+    Return the user's capability profile, computed at most once per user instance.
+
+    Args:
+        user: Authenticated user
+        token: Validated access token (request.auth), if any
+    """
+    profile = getattr(user, "_capabilities", None)
+    if profile is None:
+        claims = token.get(CAPABILITY_CLAIM) if token is not None and hasattr(token, "get") else None
+        if claims:
+            profile = _profile_from_claims(user, claims)
+        if profile is None:
+            profile = build_capabilities(user)
+        user._capabilities = profile
+    return profile
+
+
+class CapabilityRefreshToken(RefreshToken):
+    """Refresh token whose access tokens carry the user's current capability claim."""
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        if settings.JWT_CAPABILITY_CLAIMS:
+            from .models import User
+
+            user = User.objects.filter(pk=self.payload.get(api_settings.USER_ID_CLAIM)).first()
+            if user is not None:
+                access[CAPABILITY_CLAIM] = build_capabilities(user).to_claims()
+        return access
+
+
+class CapabilityTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Token obtain serializer issuing access tokens with capability claims."""
+
+    token_class = CapabilityRefreshToken
+
+
+class CapabilityTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh serializer re-reading capabilities for each new access token."""
+
+    token_class = CapabilityRefreshToken
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_precinct_user_accounts_us_precinc_4d2098_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='capability_version',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
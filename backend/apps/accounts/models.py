@@ -73,6 +73,9 @@ class User(AbstractUser):
     # Phone verification
     is_phone_verified = models.BooleanField(default=False)
 
+    # Bumped when held leader positions change; invalidates capability token claims
+    capability_version = models.PositiveIntegerField(default=0)
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -88,10 +91,25 @@ class User(AbstractUser):
             models.Index(fields=["precinct", "role"]),
         ]
 
+    # Role as last loaded from or saved to the database (None for new users);
+    # used to detect role transitions (apps.accounts.roles)
+    _loaded_role = None
+
     def __str__(self):
         name = self.get_full_name() or self.phone_number
         return f"{name} ({self.role})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_role = instance.__dict__.get("role")
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, from_queryset=None):
+        super().refresh_from_db(using=using, fields=fields, from_queryset=from_queryset)
+        if fields is None or "role" in fields:
+            self._loaded_role = self.__dict__.get("role")
+
     @property
     def is_council_member(self):
         """
@@ -102,9 +120,9 @@ class User(AbstractUser):
         """
         from apps.governance.models import GovernanceTier
 
-        return self.held_positions.filter(
-            tier=GovernanceTier.THOUSAND, is_active=True
-        ).exists()
+        from .capabilities import get_capabilities
+
+        return get_capabilities(self).holds_tier(GovernanceTier.THOUSAND)
 
     @classmethod
     def get_council_members(cls):
@@ -114,9 +132,8 @@ class User(AbstractUser):
         Returns:
             QuerySet: Users who are council members (hold active tier=1000 positions)
         """
-        from apps.governance.models import GovernanceTier
+        from apps.governance.models import GovernanceTier, RosterEntry
 
         return cls.objects.filter(
-            held_positions__tier=GovernanceTier.THOUSAND,
-            held_positions__is_active=True,
-        ).distinct()
+            id__in=RosterEntry.objects.filter(tier=GovernanceTier.THOUSAND).values("user_id")
+        )
@@ -0,0 +1,37 @@
+"""
+Role transitions.
+
+A User's role is compared with the role it was loaded with (None for new
+users) and only actual changes are announced, through the role_changed
+signal. The signal carries a batch of RoleTransition tuples so receivers can
+apply their side effects with bulk statements:
+
+- apps.communities: endorsement quotas for new GeDers, membership cleanup on
+  demotion to unverified
+- apps.governance: hierarchy cache invalidation when a leader's role changes
+
+Saves dispatch a one-element batch from post_save (apps.accounts.signals).
+Code that changes many roles at once can update them in one statement and
+announce all transitions with a single dispatch_role_transitions() call.
+"""
+
+from collections import namedtuple
+
+from django.dispatch import Signal
+
+RoleTransition = namedtuple("RoleTransition", ["user_id", "old_role", "new_role"])
+
+# Sent with sender=User and transitions=[RoleTransition, ...]
+role_changed = Signal()
+
+
+def dispatch_role_transitions(transitions):
+    """Announce role transitions to the side-effect receivers."""
+    from .models import User
+
+    transitions = [
+        transition for transition in transitions if transition.old_role != transition.new_role
+    ]
+    if transitions:
+        role_changed.send(sender=User, transitions=transitions)
+    return transitions
@@ -85,6 +85,16 @@ class OnboardingSerializer(serializers.Serializer):
     join_reason = serializers.CharField(required=True)
     member_status = serializers.ChoiceField(choices=User.MemberStatus.choices)
     constitution_accepted = serializers.BooleanField()
+    # Optional GPS position; assigns the containing precinct if none is set
+    latitude = serializers.FloatField(required=False, min_value=-90, max_value=90)
+    longitude = serializers.FloatField(required=False, min_value=-180, max_value=180)
+
+    def validate(self, attrs):
+        if ("latitude" in attrs) != ("longitude" in attrs):
+            raise serializers.ValidationError(
+                "Both latitude and longitude are required to locate your precinct."
+            )
+        return attrs
 
     def validate_constitution_accepted(self, value):
         if not value:
@@ -99,14 +109,24 @@ class OnboardingSerializer(serializers.Serializer):
         user.constitution_accepted = True
         user.constitution_accepted_at = timezone.now()
         user.onboarding_completed = True
+        update_fields = [
+            "join_reason",
+            "member_status",
+            "constitution_accepted",
+            "constitution_accepted_at",
+            "onboarding_completed",
+        ]
+
+        if user.precinct_id is None and "latitude" in self.validated_data:
+            from apps.territories.spatial import locate_precinct
+
+            precinct_id = locate_precinct(
+                self.validated_data["latitude"], self.validated_data["longitude"]
+            )
+            if precinct_id is not None:
+                user.precinct_id = precinct_id
+                update_fields.append("precinct")
+
         # Django 6: keyword-only args for save()
-        user.save(
-            update_fields=[
-                "join_reason",
-                "member_status",
-                "constitution_accepted",
-                "constitution_accepted_at",
-                "onboarding_completed",
-            ]
-        )
+        user.save(update_fields=update_fields)
         return user
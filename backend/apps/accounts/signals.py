@@ -0,0 +1,24 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import User
+from .roles import RoleTransition, dispatch_role_transitions
+
+
+@receiver(post_save, sender=User)
+def announce_role_change(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Dispatch a role transition when a save actually changed the user's role.
+
+    Saves that don't write the role (update_fields without "role") or keep it
+    unchanged fire nothing.
+    """
+    if not created and update_fields is not None and "role" not in update_fields:
+        return
+
+    old_role = instance._loaded_role
+    instance._loaded_role = instance.role
+    if old_role != instance.role:
+        # The memoized capability profile was built for the old role
+        instance.__dict__.pop("_capabilities", None)
+        dispatch_role_transitions([RoleTransition(instance.id, old_role, instance.role)])
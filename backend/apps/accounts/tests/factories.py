@@ -0,0 +1,17 @@
+import factory
+
+from apps.accounts.models import User
+
+
+class UserFactory(factory.django.DjangoModelFactory):
+    """Onboarded, phone-verified GeDer."""
+
+    class Meta:
+        model = User
+
+    phone_number = factory.Sequence(lambda n: f"+995500{n:06d}")
+    password = factory.django.Password("password")
+    role = User.Role.GEDER
+    member_status = User.MemberStatus.ACTIVE
+    onboarding_completed = True
+    is_phone_verified = True
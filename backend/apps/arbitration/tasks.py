@@ -16,11 +16,11 @@ def apply_endorsement_penalties(case_id: int):
     2. Revoke the endorsement
     3. Suspend guarantor's EndorsementQuota
     4. Revert supporter's role to 'unverified'
-    5. Deactivate supporter's group membership
+    5. Deactivate supporter's group membership (via the role transition)
 
     Called after a decision on an 'endorsement_fraud' case.
     """
-    from apps.communities.models import Endorsement, EndorsementQuota, Membership
+    from apps.communities.models import Endorsement, EndorsementQuota
 
     from .models import ArbitrationCase
 
@@ -41,9 +41,14 @@ def apply_endorsement_penalties(case_id: int):
     guarantor = endorsement.guarantor
     supporter = endorsement.supporter
 
-    # 1. Revoke the endorsement
+    # 1. Revoke the endorsement (and free its slot if it was still active)
+    if Endorsement.objects.filter(
+        id=endorsement.id, status=Endorsement.Status.ACTIVE
+    ).update(status=Endorsement.Status.PENALIZED):
+        EndorsementQuota.release_slot(guarantor.id)
+    else:
+        Endorsement.objects.filter(id=endorsement.id).update(status=Endorsement.Status.PENALIZED)
     endorsement.status = Endorsement.Status.PENALIZED
-    endorsement.save(update_fields=["status"])
 
     # 2. Suspend guarantor's endorsement quota
     EndorsementQuota.objects.filter(geder=guarantor).update(
@@ -52,16 +57,11 @@ def apply_endorsement_penalties(case_id: int):
         suspended_reason=f"Arbitration case #{case_id} — fraudulent endorsement.",
     )
 
-    # 3. Revert supporter role to 'unverified'
+    # 3. Revert supporter role to 'unverified'; the role transition also
+    # deactivates their group membership (frees the group seat)
     supporter.role = "unverified"
     supporter.save(update_fields=["role"])
 
-    # 4. Deactivate supporter's group membership
-    Membership.objects.filter(user=supporter, is_active=True).update(
-        is_active=False,
-        left_at=timezone.now(),
-    )
-
     logger.info(
         f"Endorsement fraud penalties applied for Case #{case_id}: "
         f"Endorsement #{endorsement.id} penalized, "
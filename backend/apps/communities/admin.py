@@ -1,6 +1,7 @@
 from django.contrib import admin
+from django.utils import timezone
 
-from .models import Endorsement, EndorsementQuota, GroupOfTen, Membership
+from .models import Endorsement, EndorsementQuota, FraudCluster, GroupOfTen, Membership
 
 
 @admin.register(GroupOfTen)
@@ -11,9 +12,10 @@ class GroupOfTenAdmin(admin.ModelAdmin):
         "precinct",
         "get_member_count",
         "is_full",
+        "is_active",
         "created_at",
     ]
-    list_filter = ["is_full", "precinct__district__region", "created_at"]
+    list_filter = ["is_full", "is_active", "precinct__district__region", "created_at"]
     search_fields = ["name", "precinct__name", "precinct__name_ka"]
     readonly_fields = ["created_at"]
     raw_id_fields = ["precinct"]
@@ -94,3 +96,44 @@ class EndorsementQuotaAdmin(admin.ModelAdmin):
         return obj.remaining_slots
 
     get_remaining_slots.short_description = "Remaining"
+
+
+@admin.action(description="Mark selected clusters as confirmed")
+def mark_confirmed(modeladmin, request, queryset):
+    queryset.update(
+        status=FraudCluster.Status.CONFIRMED, reviewed_by=request.user, reviewed_at=timezone.now()
+    )
+
+
+@admin.action(description="Mark selected clusters as dismissed")
+def mark_dismissed(modeladmin, request, queryset):
+    queryset.update(
+        status=FraudCluster.Status.DISMISSED, reviewed_by=request.user, reviewed_at=timezone.now()
+    )
+
+
+@admin.register(FraudCluster)
+class FraudClusterAdmin(admin.ModelAdmin):
+    list_display = [
+        "id",
+        "score",
+        "size",
+        "status",
+        "signals",
+        "last_detected_at",
+        "reviewed_by",
+    ]
+    list_filter = ["status", "last_detected_at"]
+    readonly_fields = [
+        "cluster_key",
+        "score",
+        "size",
+        "signals",
+        "member_ids",
+        "guarantor_ids",
+        "first_detected_at",
+        "last_detected_at",
+        "reviewed_by",
+        "reviewed_at",
+    ]
+    actions = [mark_confirmed, mark_dismissed]
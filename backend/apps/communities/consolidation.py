@@ -0,0 +1,208 @@
+"""
+Consolidation of underfilled groups of ten.
+
+Leaves, revocations and penalties leave partially filled groups behind. Each
+keeps a vacant atistavi position and dilutes the precinct's atistavi count.
+Consolidation merges them per precinct with a best-fit-decreasing bin-packing
+pass over whole groups (members of a group stay together):
+
+- groups whose atistavi position is held are anchors: never dissolved, only
+  receive members
+- other underfilled groups, largest first, move into the fullest group that
+  still has room for all of their members; otherwise they stay and can
+  receive later groups
+- empty groups without a held position are dissolved
+
+Execution is batched per set of precincts: one transaction locks the
+underfilled groups of the batch, moves memberships with a CASE UPDATE, writes the
+new seat counts with one bulk_update, and deactivates the dissolved groups and
+their atistavi positions with one UPDATE each. Atistavi elections still in
+nomination or voting for a dissolved group's position are cancelled first: the
+group's members now vote in their new group, so a result could never be seated.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Case, IntegerField, Value, When
+
+from .models import GROUP_CAPACITY, GroupOfTen, Membership
+
+# Precincts planned and executed per transaction
+CONSOLIDATION_PRECINCT_BATCH = 200
+
+# Source groups per membership-moving UPDATE (bounds the CASE expression size)
+MOVE_BATCH_SIZE = 500
+
+
+def plan_precinct(groups, anchored):
+    """
+    Compute merges for the underfilled groups of one precinct.
+
+    Args:
+        groups: (group_id, active_member_count) pairs of underfilled active groups
+        anchored: ids of groups whose atistavi position is held
+
+    Returns:
+        tuple: (moves: source id → target id,
+                dissolved: ids of groups to deactivate (sources and empty groups),
+                counts: kept group id → new active member count)
+    """
+    bins = {group_id: count for group_id, count in groups if group_id in anchored}
+    movable = sorted(
+        ((group_id, count) for group_id, count in groups if group_id not in anchored),
+        key=lambda group: -group[1],
+    )
+
+    moves = {}
+    dissolved = []
+    for group_id, count in movable:
+        if count == 0:
+            dissolved.append(group_id)
+            continue
+
+        # Best fit: the fullest group that can still take all of these members
+        target = max(
+            (bin_id for bin_id, filled in bins.items() if filled + count <= GROUP_CAPACITY),
+            key=lambda bin_id: bins[bin_id],
+            default=None,
+        )
+        if target is None:
+            bins[group_id] = count
+        else:
+            moves[group_id] = target
+            bins[target] += count
+            dissolved.append(group_id)
+
+    targets = set(moves.values())
+    counts = {group_id: filled for group_id, filled in bins.items() if group_id in targets}
+    return moves, dissolved, counts
+
+
+def consolidate_precincts(precinct_ids, dry_run=False):
+    """
+    Plan and (unless dry_run) execute consolidation for a batch of precincts.
+
+    Returns:
+        dict: {"plans": {precinct_id: [(source, target, members), ...]},
+               "groups_dissolved": int, "members_moved": int,
+               "elections_cancelled": int}
+    """
+    from apps.governance.hierarchy import invalidate_hierarchy_cache
+    from apps.governance.models import Election, ElectionStatus, GovernanceTier, LeaderPosition
+
+    report = {"plans": {}, "groups_dissolved": 0, "members_moved": 0, "elections_cancelled": 0}
+
+    with transaction.atomic():
+        groups_by_precinct = defaultdict(list)
+        sizes = {}
+        for group_id, precinct_id, count in (
+            GroupOfTen.objects.select_for_update()
+            .filter(
+                precinct_id__in=precinct_ids,
+                is_active=True,
+                active_member_count__lt=GROUP_CAPACITY,
+            )
+            .values_list("id", "precinct_id", "active_member_count")
+        ):
+            groups_by_precinct[precinct_id].append((group_id, count))
+            sizes[group_id] = count
+
+        anchored = set(
+            LeaderPosition.objects.filter(
+                tier=GovernanceTier.ATISTAVI,
+                group_id__in=sizes,
+                is_active=True,
+                holder__isnull=False,
+            ).values_list("group_id", flat=True)
+        )
+
+        moves = {}
+        dissolved = []
+        counts = {}
+        for precinct_id, groups in groups_by_precinct.items():
+            precinct_moves, precinct_dissolved, precinct_counts = plan_precinct(groups, anchored)
+            if not precinct_dissolved:
+                continue
+            moves.update(precinct_moves)
+            dissolved.extend(precinct_dissolved)
+            counts.update(precinct_counts)
+            report["plans"][precinct_id] = [
+                (source, target, sizes[source]) for source, target in precinct_moves.items()
+            ] + [(group_id, None, 0) for group_id in precinct_dissolved if group_id not in moves]
+
+        report["groups_dissolved"] = len(dissolved)
+        report["members_moved"] = sum(sizes[source] for source in moves)
+        if not dissolved:
+            return report
+
+        in_progress = list(
+            Election.objects.select_for_update()
+            .filter(
+                position__tier=GovernanceTier.ATISTAVI,
+                position__group_id__in=dissolved,
+                status__in=[ElectionStatus.NOMINATION, ElectionStatus.VOTING],
+            )
+            .values_list("id", flat=True)
+        )
+        report["elections_cancelled"] = len(in_progress)
+        if dry_run:
+            return report
+
+        if moves:
+            sources = list(moves.items())
+            for start in range(0, len(sources), MOVE_BATCH_SIZE):
+                chunk = dict(sources[start : start + MOVE_BATCH_SIZE])
+                Membership.objects.filter(group_id__in=chunk, is_active=True).update(
+                    group_id=Case(
+                        *[When(group_id=source, then=Value(target)) for source, target in chunk.items()],
+                        output_field=IntegerField(),
+                    )
+                )
+            GroupOfTen.objects.bulk_update(
+                [
+                    GroupOfTen(
+                        id=group_id,
+                        active_member_count=count,
+                        is_full=count >= GROUP_CAPACITY,
+                    )
+                    for group_id, count in counts.items()
+                ],
+                ["active_member_count", "is_full"],
+            )
+
+        if in_progress:
+            Election.objects.filter(id__in=in_progress).update(status=ElectionStatus.CANCELLED)
+            transaction.on_commit(lambda: Election.unschedule_transitions(in_progress))
+
+        GroupOfTen.objects.filter(id__in=dissolved).update(
+            is_active=False, active_member_count=0, is_full=False
+        )
+        LeaderPosition.objects.filter(
+            tier=GovernanceTier.ATISTAVI, group_id__in=dissolved
+        ).update(is_active=False)
+
+    # The position update bypasses post_save; dissolved positions were vacant,
+    # so only the hierarchy cache needs refreshing
+    invalidate_hierarchy_cache()
+    return report
+
+
+def consolidate_groups(precinct_ids=None, dry_run=False, batch_size=CONSOLIDATION_PRECINCT_BATCH):
+    """
+    Consolidate underfilled groups across all (or the given) precincts.
+
+    Yields one report per batch of precincts (see consolidate_precincts).
+    """
+    candidates = (
+        GroupOfTen.objects.filter(is_active=True, active_member_count__lt=GROUP_CAPACITY)
+        .values_list("precinct_id", flat=True)
+        .distinct()
+        .order_by("precinct_id")
+    )
+    if precinct_ids:
+        candidates = candidates.filter(precinct_id__in=precinct_ids)
+
+    candidates = list(candidates)
+    for start in range(0, len(candidates), batch_size):
+        yield consolidate_precincts(candidates[start : start + batch_size], dry_run=dry_run)
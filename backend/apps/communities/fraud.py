@@ -0,0 +1,353 @@
+"""
+Endorsement graph fraud-ring analysis.
+
+Loads the whole guarantor → supporter graph into flat arrays (no per-edge
+Python objects) and looks for clusters that combine several signals:
+
+- shared devices: one fingerprint hash used by members of different
+  guarantor trees (or by several members of one tree)
+- shared IPs: small groups of users behind one address (large groups are
+  treated as carrier NAT / public Wi-Fi and ignored)
+- fast-tracking: supporters who became GeDers and started endorsing within
+  FAST_TRACK_WINDOW of being endorsed themselves
+- density: extra links on top of the endorsement tree
+
+Memory layout (n users in the graph, e endorsements):
+
+- nodes: sorted user ids (array 'q', 8n bytes); a user's index is found by
+  binary search instead of an id → index dict
+- sources / targets / endorsed_at: one entry per endorsement (20e bytes)
+- two union-find parent arrays (array 'i', 8n bytes): endorsement trees, and
+  trees merged through device / IP links
+
+Device and IP rows are streamed ordered by hash / address and grouped on the
+fly; only groups shared by several graph users are kept.
+
+Results are written to FraudCluster for admin review (store_clusters).
+"""
+
+import hashlib
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import groupby
+
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Endorsement, FraudCluster
+
+# Endorsing within this many seconds of being endorsed counts as fast-tracking
+FAST_TRACK_WINDOW = 7 * 24 * 60 * 60
+
+# IP groups larger than this are treated as shared infrastructure (NAT, Wi-Fi)
+MAX_IP_GROUP = 20
+
+# Clusters scoring below this are not reported
+FRAUD_MIN_SCORE = 3.0
+
+# Member ids stored per cluster row
+MAX_STORED_MEMBERS = 500
+
+# Rows fetched per database round trip while loading
+LOAD_CHUNK_SIZE = 10000
+
+# Signal weights
+SCORE_WEIGHTS = {
+    "trees_bridged": 3.0,
+    "shared_devices": 2.0,
+    "fast_tracked": 1.0,
+    "shared_ips": 0.5,
+}
+
+
+class DisjointSet:
+    """Union-find over dense indices backed by an int array."""
+
+    def __init__(self, size):
+        self.parent = array("i", range(size))
+
+    def copy(self):
+        clone = DisjointSet(0)
+        clone.parent = array("i", self.parent)
+        return clone
+
+    def find(self, index):
+        parent = self.parent
+        while parent[index] != index:
+            # Path halving
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+        return root_a != root_b
+
+
+class EndorsementGraph:
+    """Compact in-memory guarantor → supporter graph."""
+
+    def __init__(self, nodes, sources, targets, endorsed_at):
+        """
+        Args:
+            nodes: Sorted user ids (array 'q')
+            sources: Guarantor index per endorsement (array 'i')
+            targets: Supporter index per endorsement (array 'i')
+            endorsed_at: Endorsement timestamp per endorsement (array 'd')
+        """
+        self.nodes = nodes
+        self.sources = sources
+        self.targets = targets
+        self.endorsed_at = endorsed_at
+
+    @classmethod
+    def load(cls, chunk_size=LOAD_CHUNK_SIZE):
+        """Load active and penalized endorsements from the database."""
+        guarantors = array("q")
+        supporters = array("q")
+        endorsed_at = array("d")
+        for guarantor_id, supporter_id, created_at in (
+            Endorsement.objects.filter(
+                status__in=[Endorsement.Status.ACTIVE, Endorsement.Status.PENALIZED]
+            )
+            .order_by()
+            .values_list("guarantor_id", "supporter_id", "created_at")
+            .iterator(chunk_size=chunk_size)
+        ):
+            guarantors.append(guarantor_id)
+            supporters.append(supporter_id)
+            endorsed_at.append(created_at.timestamp())
+        return cls.from_edges(guarantors, supporters, endorsed_at)
+
+    @classmethod
+    def from_edges(cls, guarantors, supporters, endorsed_at):
+        """Build the graph from parallel arrays of user ids and timestamps."""
+        nodes = array("q", sorted(set(guarantors).union(supporters)))
+        graph = cls(nodes, array("i"), array("i"), endorsed_at)
+        graph.sources = array("i", (graph.index(user_id) for user_id in guarantors))
+        graph.targets = array("i", (graph.index(user_id) for user_id in supporters))
+        return graph
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def index(self, user_id):
+        """Return the dense index of a user, or -1 if they are not in the graph."""
+        position = bisect_left(self.nodes, user_id)
+        if position < len(self.nodes) and self.nodes[position] == user_id:
+            return position
+        return -1
+
+    def trees(self):
+        """Union-find of the endorsement trees."""
+        forest = DisjointSet(len(self))
+        for source, target in zip(self.sources, self.targets):
+            forest.union(source, target)
+        return forest
+
+    def fast_tracked(self, window=FAST_TRACK_WINDOW):
+        """Flags (bytearray) of users who endorsed within window of being endorsed."""
+        became_supporter = array("d", [-1.0]) * len(self)
+        for target, timestamp in zip(self.targets, self.endorsed_at):
+            became_supporter[target] = timestamp
+
+        flags = bytearray(len(self))
+        for source, timestamp in zip(self.sources, self.endorsed_at):
+            since = became_supporter[source]
+            if since >= 0 and timestamp - since <= window:
+                flags[source] = 1
+        return flags
+
+
+def _shared_groups(graph, rows, max_group=None):
+    """
+    Group (key, user_id) rows ordered by key into tuples of graph indices.
+
+    Only keys shared by two or more distinct graph users are returned.
+    """
+    for _, group in groupby(rows, key=lambda row: row[0]):
+        members = {graph.index(user_id) for _, user_id in group}
+        members.discard(-1)
+        if len(members) < 2 or (max_group is not None and len(members) > max_group):
+            continue
+        yield tuple(sorted(members))
+
+
+def _device_rows(chunk_size):
+    from apps.verification.models import DeviceFingerprint
+
+    return (
+        DeviceFingerprint.objects.order_by("fingerprint_hash")
+        .values_list("fingerprint_hash", "user_id")
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def _ip_rows(chunk_size):
+    from apps.verification.models import DeviceFingerprint
+
+    return (
+        DeviceFingerprint.objects.filter(ip_address__isnull=False)
+        .order_by("ip_address")
+        .values_list("ip_address", "user_id")
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def find_clusters(graph, device_rows, ip_rows, min_score=FRAUD_MIN_SCORE):
+    """
+    Score clusters of the graph.
+
+    Args:
+        graph: EndorsementGraph
+        device_rows: (fingerprint_hash, user_id) rows ordered by hash
+        ip_rows: (ip_address, user_id) rows ordered by address
+        min_score: Minimum score to report
+
+    Returns:
+        list[dict]: Clusters ordered by score, with keys "member_ids",
+                    "guarantor_ids", "size", "score" and "signals"
+    """
+    trees = graph.trees()
+    clusters = trees.copy()
+    fast = graph.fast_tracked()
+
+    device_groups = list(_shared_groups(graph, device_rows))
+    ip_groups = list(_shared_groups(graph, ip_rows, max_group=MAX_IP_GROUP))
+    for members in device_groups + ip_groups:
+        for member in members[1:]:
+            clusters.union(members[0], member)
+
+    signals = defaultdict(lambda: defaultdict(float))
+    for members in device_groups:
+        root = clusters.find(members[0])
+        signals[root]["shared_devices"] += 1
+        signals[root]["links"] += len(members) - 1
+        bridged = len({trees.find(member) for member in members})
+        if bridged > 1:
+            signals[root]["trees_bridged"] += bridged - 1
+    for members in ip_groups:
+        root = clusters.find(members[0])
+        signals[root]["shared_ips"] += 1
+        signals[root]["links"] += len(members) - 1
+    for index, flagged in enumerate(fast):
+        if flagged:
+            signals[clusters.find(index)]["fast_tracked"] += 1
+
+    # Only clusters with at least one signal are sized and scored
+    candidates = {
+        root
+        for root, values in signals.items()
+        if sum(SCORE_WEIGHTS[name] * values.get(name, 0) for name in SCORE_WEIGHTS) >= min_score
+    }
+    if not candidates:
+        return []
+
+    members_by_root = defaultdict(list)
+    sizes = defaultdict(int)
+    for index in range(len(graph)):
+        root = clusters.find(index)
+        if root in candidates:
+            sizes[root] += 1
+            members_by_root[root].append(graph.nodes[index])
+
+    guarantors_by_root = defaultdict(set)
+    edges = defaultdict(int)
+    for source in graph.sources:
+        root = clusters.find(source)
+        if root in candidates:
+            edges[root] += 1
+            guarantors_by_root[root].add(graph.nodes[source])
+
+    result = []
+    for root in candidates:
+        values = signals[root]
+        size = sizes[root]
+        density = (edges[root] + values["links"]) / size
+        score = sum(SCORE_WEIGHTS[name] * values.get(name, 0) for name in SCORE_WEIGHTS)
+        # Links beyond a tree (density > 1) make the ring denser than a
+        # plain endorsement hierarchy
+        score += max(0.0, density - 1.0) * size
+        result.append(
+            {
+                "member_ids": members_by_root[root],
+                "guarantor_ids": sorted(guarantors_by_root[root]),
+                "size": size,
+                "score": round(score, 2),
+                "signals": {
+                    "shared_devices": int(values.get("shared_devices", 0)),
+                    "shared_ips": int(values.get("shared_ips", 0)),
+                    "trees_bridged": int(values.get("trees_bridged", 0)),
+                    "fast_tracked": int(values.get("fast_tracked", 0)),
+                    "edges": edges[root],
+                    "density": round(density, 3),
+                },
+            }
+        )
+    result.sort(key=lambda cluster: -cluster["score"])
+    return result
+
+
+def analyze_endorsement_graph(min_score=FRAUD_MIN_SCORE, chunk_size=LOAD_CHUNK_SIZE):
+    """Load the endorsement graph and device data and return scored clusters."""
+    graph = EndorsementGraph.load(chunk_size=chunk_size)
+    if not len(graph):
+        return []
+    return find_clusters(
+        graph, _device_rows(chunk_size), _ip_rows(chunk_size), min_score=min_score
+    )
+
+
+def store_clusters(clusters):
+    """
+    Write analysis results to the FraudCluster review table.
+
+    Known clusters get their signals refreshed (review status is kept); new
+    ones are created as pending; pending clusters missing from this run are
+    deleted.
+
+    Returns:
+        dict: {"stored": int, "removed": int}
+    """
+    now = timezone.now()
+    rows = []
+    for cluster in clusters:
+        member_ids = sorted(cluster["member_ids"])
+        key = hashlib.sha256(",".join(map(str, member_ids)).encode()).hexdigest()
+        rows.append(
+            FraudCluster(
+                cluster_key=key,
+                score=cluster["score"],
+                size=cluster["size"],
+                signals=cluster["signals"],
+                member_ids=member_ids[:MAX_STORED_MEMBERS],
+                guarantor_ids=cluster["guarantor_ids"][:MAX_STORED_MEMBERS],
+                last_detected_at=now,
+            )
+        )
+
+    with transaction.atomic():
+        removed, _ = (
+            FraudCluster.objects.filter(status=FraudCluster.Status.PENDING)
+            .exclude(cluster_key__in=[row.cluster_key for row in rows])
+            .delete()
+        )
+        FraudCluster.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["cluster_key"],
+            update_fields=[
+                "score",
+                "size",
+                "signals",
+                "member_ids",
+                "guarantor_ids",
+                "last_detected_at",
+            ],
+        )
+
+    return {"stored": len(rows), "removed": removed}
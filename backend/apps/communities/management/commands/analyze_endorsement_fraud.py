@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+
+from apps.communities.fraud import FRAUD_MIN_SCORE, analyze_endorsement_graph, store_clusters
+
+
+class Command(BaseCommand):
+    """
+    Analyze the endorsement graph for fraud rings.
+
+    Usage:
+        python manage.py analyze_endorsement_fraud
+        python manage.py analyze_endorsement_fraud --dry-run
+        python manage.py analyze_endorsement_fraud --min-score 5
+    """
+
+    help = "Find suspicious endorsement clusters and store them for admin review."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the top clusters without writing the review table",
+        )
+        parser.add_argument(
+            "--min-score",
+            type=float,
+            default=FRAUD_MIN_SCORE,
+            help="Minimum cluster score to report",
+        )
+
+    def handle(self, *args, **options):
+        clusters = analyze_endorsement_graph(min_score=options["min_score"])
+
+        for cluster in clusters[:20]:
+            signals = cluster["signals"]
+            self.stdout.write(
+                f"  score {cluster['score']:.1f}: {cluster['size']} users, "
+                f"{signals['shared_devices']} shared devices, "
+                f"{signals['trees_bridged']} trees bridged, "
+                f"{signals['fast_tracked']} fast-tracked, "
+                f"density {signals['density']}"
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"[DRY RUN] Found {len(clusters)} suspicious clusters.")
+            )
+            return
+
+        summary = store_clusters(clusters)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {summary['stored']} suspicious clusters "
+                f"({summary['removed']} stale pending clusters removed)."
+            )
+        )
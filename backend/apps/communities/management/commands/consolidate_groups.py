@@ -0,0 +1,67 @@
+from django.core.management.base import BaseCommand
+
+from apps.communities.consolidation import CONSOLIDATION_PRECINCT_BATCH, consolidate_groups
+
+
+class Command(BaseCommand):
+    """
+    Merge underfilled groups of ten within each precinct.
+
+    Usage:
+        python manage.py consolidate_groups --dry-run
+        python manage.py consolidate_groups
+        python manage.py consolidate_groups --precinct-id 12 --precinct-id 13
+    """
+
+    help = "Consolidate underfilled groups (bin-packing per precinct) and deactivate emptied ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--precinct-id",
+            type=int,
+            action="append",
+            dest="precinct_ids",
+            help="Only consolidate this precinct (repeatable)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the merge plan without writing anything",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=CONSOLIDATION_PRECINCT_BATCH,
+            help="Precincts per transaction",
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        precincts = dissolved = moved = cancelled = 0
+
+        for report in consolidate_groups(
+            precinct_ids=options.get("precinct_ids"),
+            dry_run=dry_run,
+            batch_size=options["batch_size"],
+        ):
+            for precinct_id, plan in report["plans"].items():
+                precincts += 1
+                self.stdout.write(f"  Precinct #{precinct_id}:")
+                for source, target, members in plan:
+                    if target is None:
+                        self.stdout.write(f"    [DISSOLVE] Group #{source} (empty)")
+                    else:
+                        self.stdout.write(
+                            f"    [MERGE] Group #{source} ({members} members) → Group #{target}"
+                        )
+            dissolved += report["groups_dissolved"]
+            moved += report["members_moved"]
+            cancelled += report["elections_cancelled"]
+
+        prefix = "[DRY RUN] Would dissolve" if dry_run else "Dissolved"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {dissolved} groups in {precincts} precincts, moving {moved} members "
+                f"and cancelling {cancelled} elections in progress."
+            )
+        )
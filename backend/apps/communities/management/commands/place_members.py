@@ -0,0 +1,72 @@
+from itertools import groupby
+
+from django.core.management.base import BaseCommand
+
+from apps.accounts.models import User
+from apps.communities.placement import place_precinct_members
+
+
+class Command(BaseCommand):
+    """
+    Place verified members without a group into groups of their precinct.
+
+    Fills the fullest open groups first and creates new groups as needed,
+    one transaction per precinct.
+
+    Usage:
+        python manage.py place_members
+        python manage.py place_members --precinct-id 12
+        python manage.py place_members --dry-run
+    """
+
+    help = "Bulk-place verified, onboarded members without an active group membership."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--precinct-id",
+            type=int,
+            help="Only place members of this precinct",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report the placement without writing anything",
+        )
+
+    def handle(self, *args, **options):
+        users = (
+            User.objects.filter(
+                role__in=[User.Role.GEDER, User.Role.SUPPORTER],
+                onboarding_completed=True,
+                is_diaspora=False,
+                precinct__isnull=False,
+            )
+            .exclude(membership__is_active=True)
+            .only("id", "precinct_id")
+            .order_by("precinct_id", "id")
+        )
+        if options.get("precinct_id"):
+            users = users.filter(precinct_id=options["precinct_id"])
+
+        totals = {"placed": 0, "groups_filled": 0, "groups_created": 0}
+        precincts = 0
+        for precinct_id, precinct_users in groupby(users.iterator(), key=lambda u: u.precinct_id):
+            summary = place_precinct_members(
+                precinct_id, precinct_users, dry_run=options["dry_run"]
+            )
+            precincts += 1
+            for key in totals:
+                totals[key] += summary[key]
+            self.stdout.write(
+                f"  Precinct #{precinct_id}: {summary['placed']} placed, "
+                f"{summary['groups_filled']} groups filled, "
+                f"{summary['groups_created']} groups created"
+            )
+
+        prefix = "[DRY RUN] Would place" if options["dry_run"] else "Placed"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{prefix} {totals['placed']} members across {precincts} precincts "
+                f"({totals['groups_filled']} groups filled, {totals['groups_created']} created)."
+            )
+        )
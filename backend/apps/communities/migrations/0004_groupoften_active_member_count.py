@@ -0,0 +1,36 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:28
+
+from django.db import migrations, models
+
+
+def backfill_active_member_count(apps, schema_editor):
+    """Seed each group's seat counter (and is_full) from its active memberships."""
+    from django.db.models import Count, Q
+
+    GroupOfTen = apps.get_model("communities", "GroupOfTen")
+
+    groups = list(
+        GroupOfTen.objects.annotate(
+            counted=Count("members", filter=Q(members__is_active=True))
+        ).filter(counted__gt=0)
+    )
+    for group in groups:
+        group.active_member_count = group.counted
+        group.is_full = group.counted >= 10
+    GroupOfTen.objects.bulk_update(groups, ["active_member_count", "is_full"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0003_endorsementquota_endorsement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupoften',
+            name='active_member_count',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of active members (seats taken)'),
+        ),
+        migrations.RunPython(backfill_active_member_count, migrations.RunPython.noop),
+    ]
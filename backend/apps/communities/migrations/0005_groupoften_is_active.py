@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0004_groupoften_active_member_count'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='groupoften',
+            name='is_active',
+            field=models.BooleanField(default=True, help_text='False once the group has been merged into another'),
+        ),
+    ]
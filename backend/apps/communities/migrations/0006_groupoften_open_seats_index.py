@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0005_groupoften_is_active'),
+        ('territories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='groupoften',
+            index=models.Index(condition=models.Q(('is_active', True), ('is_full', False)), fields=['precinct', '-active_member_count'], name='communities_group_open_idx'),
+        ),
+    ]
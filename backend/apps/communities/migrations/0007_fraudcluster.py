@@ -0,0 +1,39 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0006_groupoften_open_seats_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FraudCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_key', models.CharField(help_text='SHA-256 of the sorted member ids', max_length=64, unique=True)),
+                ('status', models.CharField(choices=[('pending', 'Pending Review'), ('confirmed', 'Confirmed'), ('dismissed', 'Dismissed')], db_index=True, default='pending', max_length=20)),
+                ('score', models.FloatField(db_index=True)),
+                ('size', models.PositiveIntegerField(help_text='Number of users in the cluster')),
+                ('signals', models.JSONField(default=dict, help_text='shared_devices, shared_ips, trees_bridged, fast_tracked, edges, density')),
+                ('member_ids', models.JSONField(default=list, help_text='User ids (truncated for huge clusters)')),
+                ('guarantor_ids', models.JSONField(default=list, help_text='Members who endorsed others')),
+                ('first_detected_at', models.DateTimeField(auto_now_add=True)),
+                ('last_detected_at', models.DateTimeField()),
+                ('reviewed_at', models.DateTimeField(blank=True, null=True)),
+                ('review_notes', models.TextField(blank=True)),
+                ('reviewed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reviewed_fraud_clusters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Fraud Cluster',
+                'verbose_name_plural': 'Fraud Clusters',
+                'ordering': ['-score'],
+            },
+        ),
+    ]
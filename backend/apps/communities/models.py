@@ -53,6 +53,10 @@ class EndorsementQuota(models.Model):
     Tracks a GeDer's endorsement capacity and usage.
     Automatically created when user becomes GeDer.
     Can be suspended as penalty for endorsing fraudulent users.
+
+    used_slots is only changed through conditional UPDATEs (reserve_slot /
+    release_slot); reconcile_used_slots() repairs any drift from the active
+    Endorsement rows.
     """
 
     geder = models.OneToOneField(
@@ -89,11 +93,99 @@ class EndorsementQuota(models.Model):
         """Check if GeDer can endorse more users."""
         return not self.is_suspended and self.remaining_slots > 0
 
+    @classmethod
+    def reserve_slot(cls, geder_id):
+        """
+        Take one endorsement slot if the quota is not suspended and has room.
+
+        A single conditional UPDATE both checks the quota and increments the
+        counter, so concurrent endorsements cannot exceed max_slots.
+
+        Returns:
+            bool: True if a slot was reserved
+        """
+        from django.db.models import F
+
+        return (
+            cls.objects.filter(
+                geder_id=geder_id, is_suspended=False, used_slots__lt=F("max_slots")
+            ).update(used_slots=F("used_slots") + 1)
+            == 1
+        )
+
+    @classmethod
+    def release_slot(cls, geder_id, count=1):
+        """Free endorsement slots (never below zero)."""
+        from django.db.models import F, Value
+        from django.db.models.functions import Greatest
+
+        cls.objects.filter(geder_id=geder_id).update(
+            used_slots=Greatest(F("used_slots") - count, Value(0))
+        )
+
+    @classmethod
+    def reconcile_used_slots(cls, batch_size=1000):
+        """
+        Recompute used_slots from active endorsements for all GeDers.
+
+        Drift is detected with one GROUP BY over active endorsements. Drifted
+        quotas are then rewritten with a correlated count, so an endorsement
+        committed between the two reads is not lost.
+
+        Returns:
+            int: Number of quotas corrected
+        """
+        from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+        from django.db.models.functions import Coalesce
+
+        active_counts = dict(
+            Endorsement.objects.filter(status=Endorsement.Status.ACTIVE)
+            .values_list("guarantor_id")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        drifted = [
+            quota_id
+            for quota_id, geder_id, used_slots in cls.objects.values_list(
+                "id", "geder_id", "used_slots"
+            ).iterator()
+            if active_counts.get(geder_id, 0) != used_slots
+        ]
+
+        active_count = (
+            Endorsement.objects.filter(
+                guarantor_id=OuterRef("geder_id"), status=Endorsement.Status.ACTIVE
+            )
+            .values("guarantor_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        corrected = 0
+        for start in range(0, len(drifted), batch_size):
+            corrected += cls.objects.filter(id__in=drifted[start : start + batch_size]).update(
+                used_slots=Coalesce(
+                    Subquery(active_count, output_field=IntegerField()), Value(0)
+                )
+            )
+        return corrected
+
+
+# Maximum active members per group of ten
+GROUP_CAPACITY = 10
+
+
+class GroupFullError(ValueError):
+    """Raised when a seat cannot be reserved because the group is full."""
+
 
 class GroupOfTen(models.Model):
     """
     Group of up to 10 members (ateuli) within a precinct.
     The basic unit of community organization.
+
+    Seats are accounted for in active_member_count, which is only changed
+    through conditional UPDATEs (reserve_seat / release_seat) so concurrent
+    joins can never overfill a group.
     """
 
     precinct = models.ForeignKey(
@@ -103,6 +195,12 @@ class GroupOfTen(models.Model):
     )
     name = models.CharField(max_length=200, blank=True)
     is_full = models.BooleanField(default=False)
+    active_member_count = models.PositiveSmallIntegerField(
+        default=0, help_text="Number of active members (seats taken)"
+    )
+    is_active = models.BooleanField(
+        default=True, help_text="False once the group has been merged into another"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -111,6 +209,12 @@ class GroupOfTen(models.Model):
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["precinct", "is_full"]),
+            # Open seats: fullest non-full group in a precinct (placement)
+            models.Index(
+                fields=["precinct", "-active_member_count"],
+                condition=models.Q(is_full=False, is_active=True),
+                name="communities_group_open_idx",
+            ),
         ]
 
     def __str__(self):
@@ -120,13 +224,91 @@ class GroupOfTen(models.Model):
     @property
     def member_count(self):
         """Return the count of active members."""
-        return self.members.filter(is_active=True).count()
+        return self.active_member_count
 
     def update_full_status(self):
-        """Update is_full based on active member count."""
-        count = self.member_count
-        self.is_full = count >= 10
-        self.save(update_fields=["is_full"])
+        """Reload the seat counter and is_full, which are maintained atomically."""
+        self.refresh_from_db(fields=["active_member_count", "is_full"])
+
+    @classmethod
+    def reserve_seat(cls, group_id):
+        """
+        Take one seat in a group if it has room.
+
+        A single conditional UPDATE both checks capacity and increments the
+        counter, so concurrent callers cannot overfill the group.
+
+        Returns:
+            bool: True if a seat was reserved, False if the group is full
+        """
+        from django.db.models import Case, F, Value, When
+
+        return (
+            cls.objects.filter(
+                id=group_id, is_active=True, active_member_count__lt=GROUP_CAPACITY
+            ).update(
+                active_member_count=F("active_member_count") + 1,
+                is_full=Case(
+                    When(active_member_count__gte=GROUP_CAPACITY - 1, then=Value(True)),
+                    default=Value(False),
+                ),
+            )
+            == 1
+        )
+
+    @classmethod
+    def release_seat(cls, group_id, count=1):
+        """Free seats in a group (never below zero)."""
+        from django.db.models import F, Value
+        from django.db.models.functions import Greatest
+
+        cls.objects.filter(id=group_id).update(
+            active_member_count=Greatest(F("active_member_count") - count, Value(0)),
+            is_full=False,
+        )
+
+    def add_member(self, user):
+        """
+        Seat user in this group, creating or reactivating their membership.
+
+        The seat reservation and the membership write happen in one transaction.
+
+        Raises:
+            GroupFullError: If the group is full
+            ValueError: If the group is inactive or the user already has an active membership
+
+        Returns:
+            Membership: The active membership
+        """
+        from django.db import IntegrityError, transaction
+
+        if not self.is_active:
+            raise ValueError("This group has been merged into another group.")
+
+        try:
+            with transaction.atomic():
+                if not GroupOfTen.reserve_seat(self.id):
+                    raise GroupFullError("This group is full and cannot accept new members.")
+
+                membership = Membership.objects.select_for_update().filter(user=user).first()
+                if membership is None:
+                    membership = Membership.objects.create(user=user, group=self, is_active=True)
+                elif membership.is_active:
+                    raise ValueError(
+                        "You are already a member of another group. Leave it first."
+                    )
+                else:
+                    # Reactivate existing membership
+                    membership.group = self
+                    membership.is_active = True
+                    membership.left_at = None
+                    membership.save(update_fields=["group", "is_active", "left_at"])
+        except IntegrityError:
+            # A concurrent request created this user's membership first
+            raise ValueError("You are already a member of another group. Leave it first.")
+
+        self.update_full_status()
+        return membership
 
 
 class Membership(models.Model):
@@ -159,3 +341,118 @@ class Membership(models.Model):
 
     def __str__(self):
         return f"{self.user.phone_number} → {self.group}"
+
+    def deactivate(self):
+        """
+        Mark the membership inactive and free its seat in the group.
+
+        Returns:
+            bool: False if the membership was already inactive
+        """
+        from django.db import transaction
+        from django.utils import timezone
+
+        left_at = timezone.now()
+        with transaction.atomic():
+            updated = Membership.objects.filter(pk=self.pk, is_active=True).update(
+                is_active=False, left_at=left_at
+            )
+            if not updated:
+                return False
+            GroupOfTen.release_seat(self.group_id)
+
+        self.is_active = False
+        self.left_at = left_at
+        return True
+
+    @classmethod
+    def deactivate_for_users(cls, user_ids):
+        """
+        Deactivate the active memberships of many users and free their seats.
+
+        Seats are released with one UPDATE per distinct number of departures
+        per group (usually one).
+
+        Returns:
+            int: Number of memberships deactivated
+        """
+        from collections import Counter, defaultdict
+
+        from django.db import transaction
+        from django.db.models import F, Value
+        from django.db.models.functions import Greatest
+        from django.utils import timezone
+
+        with transaction.atomic():
+            memberships = cls.objects.select_for_update().filter(
+                user_id__in=user_ids, is_active=True
+            )
+            departures = Counter(memberships.values_list("group_id", flat=True))
+            if not departures:
+                return 0
+            cls.objects.filter(user_id__in=user_ids, is_active=True).update(
+                is_active=False, left_at=timezone.now()
+            )
+
+            groups_by_count = defaultdict(list)
+            for group_id, count in departures.items():
+                groups_by_count[count].append(group_id)
+            for count, group_ids in groups_by_count.items():
+                GroupOfTen.objects.filter(id__in=group_ids).update(
+                    active_member_count=Greatest(F("active_member_count") - count, Value(0)),
+                    is_full=False,
+                )
+
+        return sum(departures.values())
+
+
+class FraudCluster(models.Model):
+    """
+    Suspicious cluster found by the endorsement graph analysis (apps.communities.fraud).
+
+    Rows are keyed by their sorted member set, so re-running the analysis
+    refreshes the signals of known clusters without touching their review
+    status. Pending clusters that no longer qualify are removed by the next run.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending Review"
+        CONFIRMED = "confirmed", "Confirmed"
+        DISMISSED = "dismissed", "Dismissed"
+
+    cluster_key = models.CharField(
+        max_length=64, unique=True, help_text="SHA-256 of the sorted member ids"
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        db_index=True,
+    )
+    score = models.FloatField(db_index=True)
+    size = models.PositiveIntegerField(help_text="Number of users in the cluster")
+    signals = models.JSONField(
+        default=dict,
+        help_text="shared_devices, shared_ips, trees_bridged, fast_tracked, edges, density",
+    )
+    member_ids = models.JSONField(default=list, help_text="User ids (truncated for huge clusters)")
+    guarantor_ids = models.JSONField(default=list, help_text="Members who endorsed others")
+    first_detected_at = models.DateTimeField(auto_now_add=True)
+    last_detected_at = models.DateTimeField()
+    reviewed_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="reviewed_fraud_clusters",
+    )
+    reviewed_at = models.DateTimeField(null=True, blank=True)
+    review_notes = models.TextField(blank=True)
+
+    class Meta:
+        verbose_name = "Fraud Cluster"
+        verbose_name_plural = "Fraud Clusters"
+        ordering = ["-score"]
+
+    def __str__(self):
+        return f"Cluster #{self.id} ({self.size} users, score {self.score:.1f}, {self.status})"
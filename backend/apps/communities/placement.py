@@ -0,0 +1,148 @@
+"""
+Automatic group placement for members without a group.
+
+Members are placed into the fullest non-full group of their precinct (found
+through the open-seats index), so groups reach ten members quickly instead of
+spreading thinly. A new GroupOfTen is created when the precinct has no open
+seat; its post_save signal creates the vacant atistavi position.
+
+- place_member(): single member, used by the place-me endpoint
+- place_precinct_members(): batch placement of many members of one precinct
+  under one lock, used by the place_members command
+"""
+
+import math
+
+from django.db import transaction
+
+from .models import GROUP_CAPACITY, GroupFullError, GroupOfTen, Membership
+
+# Open groups tried per placement before creating a new one (others may fill
+# them concurrently)
+PLACEMENT_CANDIDATES = 5
+
+
+def _open_groups(precinct_id):
+    """Return the precinct's non-full groups, fullest first."""
+    return GroupOfTen.objects.filter(
+        precinct_id=precinct_id, is_full=False, is_active=True
+    ).order_by(
+        "-active_member_count", "created_at"
+    )
+
+
+def place_member(user):
+    """
+    Seat user in the fullest open group of their precinct.
+
+    Raises:
+        ValueError: If the user has no precinct or already has an active membership
+
+    Returns:
+        Membership: The active membership
+    """
+    if user.precinct_id is None:
+        raise ValueError("You must have a precinct assigned to be placed in a group.")
+
+    for group in _open_groups(user.precinct_id)[:PLACEMENT_CANDIDATES]:
+        try:
+            return group.add_member(user)
+        except GroupFullError:
+            # Filled by a concurrent join; try the next one
+            continue
+
+    # No open seat in the precinct: start a new group
+    with transaction.atomic():
+        group = GroupOfTen.objects.create(precinct_id=user.precinct_id)
+        return group.add_member(user)
+
+
+def place_precinct_members(precinct_id, users, dry_run=False):
+    """
+    Place many members of one precinct in a single transaction.
+
+    Open groups of the precinct are locked, filled fullest first, and new
+    groups are created for the remainder. Memberships are written with one
+    bulk_create (plus one bulk_update for reactivated memberships) and seat
+    counters with one bulk_update.
+
+    Args:
+        precinct_id: Precinct all users belong to
+        users: Users without an active membership
+        dry_run: Compute the placement without writing
+
+    Returns:
+        dict: {"placed": int, "groups_filled": int, "groups_created": int}
+    """
+    users = list(users)
+    summary = {"placed": 0, "groups_filled": 0, "groups_created": 0}
+    if not users:
+        return summary
+
+    with transaction.atomic():
+        groups = list(_open_groups(precinct_id).select_for_update())
+        existing = {
+            membership.user_id: membership
+            for membership in Membership.objects.select_for_update().filter(
+                user_id__in=[user.id for user in users]
+            )
+        }
+        users = [
+            user for user in users if not (user.id in existing and existing[user.id].is_active)
+        ]
+
+        # Assign seats: fill the fullest groups first, then new groups
+        assignments = []
+        touched = []
+        queue = iter(users)
+        pending = next(queue, None)
+        for group in groups:
+            if pending is None:
+                break
+            seats = GROUP_CAPACITY - group.active_member_count
+            if seats <= 0:
+                continue
+            while seats and pending is not None:
+                assignments.append((pending, group))
+                group.active_member_count += 1
+                seats -= 1
+                pending = next(queue, None)
+            group.is_full = group.active_member_count >= GROUP_CAPACITY
+            touched.append(group)
+
+        remaining = ([pending] if pending is not None else []) + list(queue)
+        new_group_count = math.ceil(len(remaining) / GROUP_CAPACITY)
+
+        summary["placed"] = len(assignments) + len(remaining)
+        summary["groups_filled"] = len(touched)
+        summary["groups_created"] = new_group_count
+        if dry_run:
+            transaction.set_rollback(True)
+            return summary
+
+        for index in range(new_group_count):
+            # Created one by one so the atistavi position signal fires
+            group = GroupOfTen.objects.create(precinct_id=precinct_id)
+            chunk = remaining[index * GROUP_CAPACITY : (index + 1) * GROUP_CAPACITY]
+            assignments.extend((user, group) for user in chunk)
+            group.active_member_count = len(chunk)
+            group.is_full = len(chunk) >= GROUP_CAPACITY
+            touched.append(group)
+
+        new_memberships = []
+        reactivated = []
+        for user, group in assignments:
+            membership = existing.get(user.id)
+            if membership is None:
+                new_memberships.append(Membership(user=user, group=group, is_active=True))
+            else:
+                membership.group = group
+                membership.is_active = True
+                membership.left_at = None
+                reactivated.append(membership)
+
+        Membership.objects.bulk_create(new_memberships)
+        Membership.objects.bulk_update(reactivated, ["group", "is_active", "left_at"])
+        GroupOfTen.objects.bulk_update(touched, ["active_member_count", "is_full"])
+
+    return summary
@@ -1,22 +1,29 @@
-from django.db.models.signals import post_save
 from django.dispatch import receiver
 
 from apps.accounts.models import User
-from .models import EndorsementQuota
+from apps.accounts.roles import role_changed
+from .models import EndorsementQuota, Membership
 
 
-@receiver(post_save, sender=User)
-def create_endorsement_quota_for_geder(sender, instance, created, **kwargs):
+@receiver(role_changed, sender=User)
+def apply_role_transitions(sender, transitions, **kwargs):
     """
-    Auto-create EndorsementQuota when user becomes GeDer.
-    Triggered on User save if role is 'geder' and quota doesn't exist.
+    Community side effects of role changes, applied in bulk.
+
+    - Becoming GeDer: create the EndorsementQuota (existing quotas are kept)
+    - Demotion to unverified: deactivate group memberships and free their seats
     """
-    if instance.role == User.Role.GEDER:
-        # Create quota if it doesn't exist
-        EndorsementQuota.objects.get_or_create(
-            geder=instance,
-            defaults={
-                "max_slots": 10,
-                "used_slots": 0,
-            },
+    new_geders = [t.user_id for t in transitions if t.new_role == User.Role.GEDER]
+    if new_geders:
+        EndorsementQuota.objects.bulk_create(
+            [EndorsementQuota(geder_id=user_id, max_slots=10, used_slots=0) for user_id in new_geders],
+            ignore_conflicts=True,
         )
+
+    demoted = [
+        t.user_id
+        for t in transitions
+        if t.new_role == User.Role.UNVERIFIED and t.old_role is not None
+    ]
+    if demoted:
+        Membership.deactivate_for_users(demoted)
@@ -0,0 +1,39 @@
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def reconcile_endorsement_quotas():
+    """
+    Recompute EndorsementQuota.used_slots from active endorsements.
+
+    Periodic task (runs hourly via Celery Beat). Repairs counters left behind
+    by failed requests, penalties or manual edits.
+    """
+    from .models import EndorsementQuota
+
+    corrected = EndorsementQuota.reconcile_used_slots()
+    if corrected:
+        logger.warning(f"reconcile_endorsement_quotas: {corrected} quotas corrected.")
+    else:
+        logger.info("reconcile_endorsement_quotas: all quotas consistent.")
+
+
+@shared_task
+def analyze_endorsement_fraud():
+    """
+    Run the endorsement graph fraud-ring analysis and refresh the review table.
+
+    Periodic task (runs daily via Celery Beat).
+    """
+    from .fraud import analyze_endorsement_graph, store_clusters
+
+    clusters = analyze_endorsement_graph()
+    summary = store_clusters(clusters)
+    logger.info(
+        f"analyze_endorsement_fraud: {summary['stored']} suspicious clusters stored, "
+        f"{summary['removed']} stale pending clusters removed."
+    )
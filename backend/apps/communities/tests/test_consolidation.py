@@ -0,0 +1,60 @@
+"""
+Consolidation of underfilled groups of ten and the elections of their positions.
+"""
+
+import pytest
+from django_celery_beat.models import PeriodicTask
+
+from apps.accounts.tests.factories import UserFactory
+from apps.communities.consolidation import consolidate_groups
+from apps.communities.models import GroupOfTen
+from apps.governance.models import ElectionStatus, ElectionType, GovernanceTier, LeaderPosition
+from apps.governance.tests.factories import ElectionFactory
+from apps.territories.tests.factories import PrecinctFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def group_with(precinct, members):
+    group = GroupOfTen.objects.create(precinct=precinct)
+    for user in UserFactory.create_batch(members, precinct=precinct):
+        group.add_member(user)
+    return group
+
+
+def atistavi_position(group):
+    return LeaderPosition.objects.get(tier=GovernanceTier.ATISTAVI, group=group)
+
+
+def test_absorbed_group_elections_are_cancelled(django_capture_on_commit_callbacks):
+    precinct = PrecinctFactory()
+    kept = group_with(precinct, 6)
+    absorbed = group_with(precinct, 3)
+    with django_capture_on_commit_callbacks(execute=True):
+        nominating = ElectionFactory(
+            election_type=ElectionType.ATISTAVI,
+            status=ElectionStatus.NOMINATION,
+            position=atistavi_position(absorbed),
+        )
+        voting = ElectionFactory(election_type=ElectionType.ATISTAVI, position=atistavi_position(absorbed))
+        untouched = ElectionFactory(election_type=ElectionType.ATISTAVI, position=atistavi_position(kept))
+    assert PeriodicTask.objects.filter(name__startswith=f"election-{voting.id}-").exists()
+
+    [dry_run] = consolidate_groups(precinct_ids=[precinct.id], dry_run=True)
+    assert dry_run["elections_cancelled"] == 2
+    voting.refresh_from_db()
+    assert voting.status == ElectionStatus.VOTING
+
+    with django_capture_on_commit_callbacks(execute=True):
+        [report] = consolidate_groups(precinct_ids=[precinct.id])
+
+    assert report["groups_dissolved"] == 1
+    assert report["elections_cancelled"] == 2
+    for election in (nominating, voting, untouched):
+        election.refresh_from_db()
+    assert nominating.status == ElectionStatus.CANCELLED
+    assert voting.status == ElectionStatus.CANCELLED
+    assert untouched.status == ElectionStatus.VOTING
+    assert not PeriodicTask.objects.filter(name__startswith=f"election-{voting.id}-").exists()
+    assert PeriodicTask.objects.filter(name__startswith=f"election-{untouched.id}-").exists()
+    assert not atistavi_position(absorbed).is_active
@@ -0,0 +1,60 @@
+"""
+Seat accounting of GroupOfTen under concurrent joins.
+"""
+
+import threading
+
+import pytest
+from django.db import close_old_connections, connection
+
+from apps.accounts.tests.factories import UserFactory
+from apps.communities.models import GROUP_CAPACITY, GroupFullError, GroupOfTen, Membership
+from apps.territories.tests.factories import PrecinctFactory
+
+# Threads competing for the last seats of one group
+JOINERS = 8
+
+# Seats left when the joiners start
+OPEN_SEATS = 3
+
+
+# SQLite test databases lock whole tables, so concurrent writers fail outright
+@pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Concurrent row locking needs PostgreSQL"
+)
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_joins_never_overfill_group():
+    precinct = PrecinctFactory()
+    group = GroupOfTen.objects.create(precinct=precinct)
+    for user in UserFactory.create_batch(GROUP_CAPACITY - OPEN_SEATS, precinct=precinct):
+        group.add_member(user)
+    joiners = UserFactory.create_batch(JOINERS, precinct=precinct)
+
+    barrier = threading.Barrier(JOINERS)
+    results = [None] * JOINERS
+
+    def join(index):
+        try:
+            barrier.wait()
+            results[index] = GroupOfTen.objects.get(id=group.id).add_member(joiners[index])
+        except Exception as exc:
+            results[index] = exc
+        finally:
+            close_old_connections()
+
+    threads = [threading.Thread(target=join, args=(index,)) for index in range(JOINERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    seated = [result for result in results if isinstance(result, Membership)]
+    rejected = [result for result in results if isinstance(result, GroupFullError)]
+    assert len(seated) == OPEN_SEATS
+    assert len(rejected) == JOINERS - OPEN_SEATS
+    assert all(str(error) == "This group is full and cannot accept new members." for error in rejected)
+
+    group.refresh_from_db()
+    assert group.active_member_count == GROUP_CAPACITY
+    assert group.is_full
+    assert Membership.objects.filter(group=group, is_active=True).count() == GROUP_CAPACITY
@@ -1,5 +1,5 @@
-from django.db import models
-from django.db.models import Count, Q
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework import viewsets, status, serializers, generics
 from rest_framework.decorators import action
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
 from common.permissions import IsOnboarded, IsGeDer, IsVerifiedMember, IsNotDiaspora
+from common.throttling import EndorseRateThrottle
 from .models import Endorsement, EndorsementQuota, GroupOfTen, Membership
 from .serializers import (
     EndorsementSerializer,
@@ -25,7 +26,7 @@ class GroupOfTenViewSet(viewsets.ModelViewSet):
     Permissions:
     - List/Retrieve: IsAuthenticated + IsOnboarded + IsVerifiedMember
     - Create: IsAuthenticated + IsOnboarded + IsGeDer + IsNotDiaspora
-    - Join/Leave: IsAuthenticated + IsOnboarded + IsVerifiedMember + IsNotDiaspora
+    - Join/Leave/Place-me: IsAuthenticated + IsOnboarded + IsVerifiedMember + IsNotDiaspora
 
     Business Rules:
     - GeDers can create groups in their own precinct
@@ -38,12 +39,12 @@ class GroupOfTenViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """
-        Annotate with member count and optionally filter by precinct.
+        Return active groups, optionally filtered by precinct. member_count
+        is read from the group's maintained active_member_count column.
         Uses select_related for performance optimization.
         """
-        queryset = GroupOfTen.objects.select_related("precinct__district__region")
-        queryset = queryset.annotate(
-            member_count=Count("members", filter=Q(members__is_active=True))
+        queryset = GroupOfTen.objects.filter(is_active=True).select_related(
+            "precinct__district__region"
         )
 
         # Filter by precinct if provided
@@ -63,7 +64,7 @@ class GroupOfTenViewSet(viewsets.ModelViewSet):
         """Override permissions for create and action-specific endpoints."""
         if self.action == "create":
             return [IsAuthenticated(), IsOnboarded(), IsGeDer(), IsNotDiaspora()]
-        elif self.action in ["join", "leave"]:
+        elif self.action in ["join", "leave", "place_me"]:
             return [
                 IsAuthenticated(),
                 IsOnboarded(),
@@ -93,43 +94,37 @@ class GroupOfTenViewSet(viewsets.ModelViewSet):
         Join a group. Creates or reactivates membership.
 
         Business rules:
-        - Cannot join full groups (is_full=True)
+        - Cannot join full groups (seat reserved by a conditional UPDATE on active_member_count)
         - Can only be in one group at a time (OneToOne constraint)
         - GeDers join directly; Supporters need endorsement (enforced by IsVerifiedMember)
         """
         group = self.get_object()
-        user = request.user
 
-        # Check if group is full
-        if group.is_full:
-            return Response(
-                {"detail": "This group is full and cannot accept new members."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        # Reserve a seat and create/reactivate membership atomically
+        try:
+            membership = group.add_member(request.user)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Check if user already has active membership
-        if hasattr(user, "membership") and user.membership.is_active:
-            return Response(
-                {
-                    "detail": "You are already a member of another group. Leave it first."
-                },
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+        serializer = MembershipSerializer(membership)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-        # Create or reactivate membership
-        membership, created = Membership.objects.get_or_create(
-            user=user, defaults={"group": group, "is_active": True}
-        )
+    @action(detail=False, methods=["post"], url_path="place-me")
+    def place_me(self, request):
+        """
+        Place the user in a group of their precinct automatically.
 
-        if not created:
-            # Reactivate existing membership
-            membership.group = group
-            membership.is_active = True
-            membership.left_at = None
-            membership.save(update_fields=["group", "is_active", "left_at"])
+        POST /api/v1/communities/groups/place-me/
 
-        # Update group full status
-        group.update_full_status()
+        Joins the fullest non-full group in the user's precinct, or creates a
+        new group when none has a free seat.
+        """
+        from .placement import place_member
+
+        try:
+            membership = place_member(request.user)
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
         serializer = MembershipSerializer(membership)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
@@ -151,13 +146,8 @@ class GroupOfTenViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Mark as inactive
-        membership.is_active = False
-        membership.left_at = timezone.now()
-        membership.save(update_fields=["is_active", "left_at"])
-
-        # Update group full status
-        group.update_full_status()
+        # Mark as inactive and free the seat
+        membership.deactivate()
 
         return Response({"detail": "You have left the group."}, status=status.HTTP_200_OK)
 
@@ -177,6 +167,7 @@ class EndorsementViewSet(viewsets.ModelViewSet):
     """
 
     permission_classes = [IsAuthenticated, IsOnboarded]
+    throttle_classes = [EndorseRateThrottle]
     serializer_class = EndorsementSerializer
 
     def get_queryset(self):
@@ -203,34 +194,16 @@ class EndorsementViewSet(viewsets.ModelViewSet):
         - Check guarantor is not suspended
         - Promote supporter role from 'unverified' to 'supporter'
         - Increment used_slots
+
+        The slot reservation (one conditional UPDATE), the endorsement insert
+        and the role change happen in one transaction, so concurrent requests
+        cannot exceed max_slots.
         """
+        from apps.accounts.models import User
+
         guarantor = self.request.user
         supporter = serializer.validated_data["supporter"]
 
-        # Validate guarantor has quota
-        try:
-            quota = EndorsementQuota.objects.get(geder=guarantor)
-        except EndorsementQuota.DoesNotExist:
-            raise serializers.ValidationError(
-                {"detail": "Endorsement quota not found. Please contact support."}
-            )
-
-        # Check if suspended
-        if quota.is_suspended:
-            raise serializers.ValidationError(
-                {
-                    "detail": f"Your endorsement rights are suspended. Reason: {quota.suspended_reason}"
-                }
-            )
-
-        # Check remaining slots
-        if quota.remaining_slots <= 0:
-            raise serializers.ValidationError(
-                {
-                    "detail": f"You have reached your endorsement limit ({quota.max_slots})."
-                }
-            )
-
         # Check if supporter already endorsed
         if hasattr(supporter, "endorsement"):
             existing = supporter.endorsement
@@ -239,24 +212,40 @@ class EndorsementViewSet(viewsets.ModelViewSet):
                     {"supporter_id": "This user is already endorsed."}
                 )
 
-        # Check supporter is unverified
-        if supporter.role != "unverified":
-            raise serializers.ValidationError(
-                {
-                    "supporter_id": f"Can only endorse unverified users. This user's role is '{supporter.role}'."
-                }
-            )
+        with transaction.atomic():
+            # Lock the supporter so concurrent endorsements see the role change
+            supporter = User.objects.select_for_update().get(pk=supporter.pk)
 
-        # Create endorsement
-        endorsement = serializer.save(guarantor=guarantor, status=Endorsement.Status.ACTIVE)
+            # Check supporter is unverified
+            if supporter.role != "unverified":
+                raise serializers.ValidationError(
+                    {
+                        "supporter_id": f"Can only endorse unverified users. This user's role is '{supporter.role}'."
+                    }
+                )
+
+            # Reserve a slot (fails when suspended, full or missing)
+            if not EndorsementQuota.reserve_slot(guarantor.id):
+                raise serializers.ValidationError({"detail": self._quota_error(guarantor)})
+
+            # Create endorsement
+            serializer.save(
+                guarantor=guarantor, supporter=supporter, status=Endorsement.Status.ACTIVE
+            )
 
-        # Promote supporter role to 'supporter'
-        supporter.role = "supporter"
-        supporter.save(update_fields=["role"])
+            # Promote supporter role to 'supporter'
+            supporter.role = "supporter"
+            supporter.save(update_fields=["role"])
 
-        # Increment used_slots
-        quota.used_slots += 1
-        quota.save(update_fields=["used_slots"])
+    @staticmethod
+    def _quota_error(guarantor):
+        """Explain why a slot could not be reserved."""
+        quota = EndorsementQuota.objects.filter(geder=guarantor).first()
+        if quota is None:
+            return "Endorsement quota not found. Please contact support."
+        if quota.is_suspended:
+            return f"Your endorsement rights are suspended. Reason: {quota.suspended_reason}"
+        return f"You have reached your endorsement limit ({quota.max_slots})."
 
     def perform_destroy(self, instance):
         """
@@ -277,30 +266,27 @@ class EndorsementViewSet(viewsets.ModelViewSet):
                 {"detail": "You can only revoke your own endorsements."}
             )
 
-        # Revert supporter role to unverified
-        supporter = instance.supporter
-        supporter.role = "unverified"
-        supporter.save(update_fields=["role"])
-
-        # Remove from group if active member
-        if hasattr(supporter, "membership") and supporter.membership.is_active:
-            membership = supporter.membership
-            membership.is_active = False
-            membership.left_at = timezone.now()
-            membership.save(update_fields=["is_active", "left_at"])
-
-            # Update group full status
-            membership.group.update_full_status()
-
-        # Decrement used_slots
-        quota = EndorsementQuota.objects.get(geder=guarantor)
-        quota.used_slots = max(0, quota.used_slots - 1)
-        quota.save(update_fields=["used_slots"])
-
-        # Mark as revoked (soft delete - don't actually delete)
-        instance.status = Endorsement.Status.REVOKED
-        instance.revoked_at = timezone.now()
-        instance.save(update_fields=["status", "revoked_at"])
+        with transaction.atomic():
+            # Mark as revoked (soft delete - don't actually delete); the
+            # conditional UPDATE makes concurrent revokes release one slot
+            revoked_at = timezone.now()
+            if not Endorsement.objects.filter(
+                id=instance.id, status=Endorsement.Status.ACTIVE
+            ).update(status=Endorsement.Status.REVOKED, revoked_at=revoked_at):
+                raise serializers.ValidationError(
+                    {"detail": "This endorsement is no longer active."}
+                )
+            instance.status = Endorsement.Status.REVOKED
+            instance.revoked_at = revoked_at
+
+            # Revert supporter role to unverified; the role transition removes
+            # them from their group (apps.communities.signals)
+            supporter = instance.supporter
+            supporter.role = "unverified"
+            supporter.save(update_fields=["role"])
+
+            # Decrement used_slots
+            EndorsementQuota.release_slot(guarantor.id)
 
     def destroy(self, request, *args, **kwargs):
         """Override destroy to use soft delete."""
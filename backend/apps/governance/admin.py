@@ -1,6 +1,14 @@
 from django.contrib import admin, messages
 
-from .models import Candidacy, Election, GovernanceTier, LeaderPosition, Vote
+from .models import (
+    Candidacy,
+    Election,
+    ElectoralRollEntry,
+    GovernanceTier,
+    LeaderPosition,
+    RosterEntry,
+    Vote,
+)
 
 
 @admin.action(description="Create fifty-leader positions where eligible")
@@ -197,7 +205,7 @@ class ElectionAdmin(admin.ModelAdmin):
         "voting_end",
         "created_at",
     ]
-    list_filter = ["election_type", "status", "created_at"]
+    list_filter = ["election_type", "status", "buffered_ingestion", "created_at"]
     search_fields = [
         "position__group__name",
         "position__precinct__name",
@@ -211,6 +219,11 @@ class ElectionAdmin(admin.ModelAdmin):
         "is_nomination_period",
         "is_voting_period",
         "is_finished",
+        "candidate_roll_frozen_at",
+        "voter_roll_frozen_at",
+        "eligible_voter_count",
+        "results_computed_at",
+        "results_etag",
     ]
     raw_id_fields = ["position", "created_by"]
     date_hierarchy = "created_at"
@@ -219,7 +232,7 @@ class ElectionAdmin(admin.ModelAdmin):
         (
             "Election Info",
             {
-                "fields": ("election_type", "status", "position"),
+                "fields": ("election_type", "status", "position", "buffered_ingestion"),
             },
         ),
         (
@@ -241,6 +254,22 @@ class ElectionAdmin(admin.ModelAdmin):
                 "fields": ("is_finished",),
             },
         ),
+        (
+            "Electoral Roll",
+            {
+                "fields": (
+                    "candidate_roll_frozen_at",
+                    "voter_roll_frozen_at",
+                    "eligible_voter_count",
+                ),
+            },
+        ),
+        (
+            "Results Snapshot",
+            {
+                "fields": ("results_computed_at", "results_etag"),
+            },
+        ),
         (
             "Metadata",
             {
@@ -292,6 +321,10 @@ class CandidacyAdmin(admin.ModelAdmin):
     raw_id_fields = ["election", "candidate"]
     date_hierarchy = "registered_at"
 
+    def get_queryset(self, request):
+        """Annotate vote counts from the sharded counters."""
+        return super().get_queryset(request).with_vote_counts()
+
     def vote_count(self, obj):
         """Display vote count for this candidacy."""
         return obj.vote_count
@@ -314,3 +347,28 @@ class VoteAdmin(admin.ModelAdmin):
     readonly_fields = ["cast_at"]
     raw_id_fields = ["election", "voter", "candidacy"]
     date_hierarchy = "cast_at"
+
+
+@admin.register(ElectoralRollEntry)
+class ElectoralRollEntryAdmin(admin.ModelAdmin):
+    list_display = ["id", "election", "user", "roll_type"]
+    list_filter = ["roll_type", "election__election_type"]
+    search_fields = [
+        "user__phone_number",
+        "user__first_name",
+        "user__last_name",
+        "election__id",
+    ]
+    raw_id_fields = ["election", "user"]
+
+
+@admin.register(RosterEntry)
+class RosterEntryAdmin(admin.ModelAdmin):
+    list_display = ["id", "user", "tier", "position", "precinct", "district"]
+    list_filter = ["tier"]
+    search_fields = [
+        "user__phone_number",
+        "user__first_name",
+        "user__last_name",
+    ]
+    raw_id_fields = ["position", "user", "group", "precinct", "district"]
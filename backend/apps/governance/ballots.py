@@ -0,0 +1,357 @@
+"""
+Buffered ballot ingestion for high-turnout elections.
+
+Elections with buffered_ingestion=True don't insert a Vote per request.
+The vote endpoint validates the ballot cheaply (frozen roll lookup, candidacy
+check) and appends it to a Redis stream. The client gets a receipt right away.
+The ingest_buffered_ballots Celery task drains the stream in batches:
+one bulk_create of Vote rows per batch plus one counter increment per
+candidacy, all inside a single transaction.
+
+Guarantees:
+- One ballot per voter per election is enforced at enqueue time (SET NX) and
+  again at drain time against existing Vote rows / one_vote_per_user_per_election.
+  Only rows that were actually inserted are counted and reported ACCEPTED.
+- Entries are acknowledged only after their batch commits. Unacknowledged
+  entries from a crashed drain are reprocessed on the next run, and
+  reprocessing a committed ballot is idempotent.
+- Each election's queued-but-unacknowledged ballots are counted in Redis
+  (BALLOT_PENDING_KEY). Completion of a buffered election is held until the
+  count drops to zero (see governance.tasks), and entries whose election is no
+  longer VOTING are rejected, so no ballot lands after the results snapshot.
+"""
+
+import time
+import uuid
+from collections import Counter, defaultdict
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django_redis import get_redis_connection
+from redis.exceptions import ResponseError
+
+BALLOT_STREAM_KEY = "governance:ballots"
+BALLOT_CONSUMER_GROUP = "ballot-ingest"
+BALLOT_CONSUMER_NAME = "drainer"
+BALLOT_RECEIPT_KEY = "governance:ballots:receipt:{receipt}"
+BALLOT_VOTER_KEY = "governance:ballots:voted:{election_id}:{voter_id}"
+BALLOT_DRAIN_LOCK_KEY = "governance:ballots:drain-lock"
+BALLOT_PENDING_KEY = "governance:ballots:pending:{election_id}"
+
+BALLOT_BATCH_SIZE = 1000
+BALLOT_RECEIPT_TTL = 60 * 60 * 24 * 7  # Receipts can be checked for a week
+BALLOT_DRAIN_LOCK_TIMEOUT = 60 * 5
+
+# One drain run stops after this many batches or this many seconds, whichever
+# comes first, so it always finishes well within BALLOT_DRAIN_LOCK_TIMEOUT
+BALLOT_MAX_BATCHES = 50
+BALLOT_DRAIN_TIME_LIMIT = BALLOT_DRAIN_LOCK_TIMEOUT // 2
+
+
+class BallotStatus:
+    """Lifecycle of a buffered ballot receipt."""
+
+    PENDING = "pending"
+    ACCEPTED = "accepted"
+    REJECTED = "rejected"
+
+
+def _decode(value):
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def enqueue_ballot(election, voter, candidacy):
+    """
+    Append a validated ballot to the ingestion stream.
+
+    Eligibility and candidacy validity must already be checked by the caller.
+
+    Returns:
+        str | None: Receipt id, or None if the voter already submitted a
+        ballot for this election.
+    """
+    conn = get_redis_connection("default")
+
+    voter_key = BALLOT_VOTER_KEY.format(election_id=election.id, voter_id=voter.id)
+    receipt = uuid.uuid4().hex
+
+    # Claim the voter's single ballot for this election
+    if not conn.set(voter_key, receipt, nx=True, ex=BALLOT_RECEIPT_TTL):
+        return None
+
+    pipe = conn.pipeline()
+    pipe.hset(
+        BALLOT_RECEIPT_KEY.format(receipt=receipt),
+        mapping={
+            "status": BallotStatus.PENDING,
+            "election_id": election.id,
+            "voter_id": voter.id,
+        },
+    )
+    pipe.expire(BALLOT_RECEIPT_KEY.format(receipt=receipt), BALLOT_RECEIPT_TTL)
+    pending_key = BALLOT_PENDING_KEY.format(election_id=election.id)
+    pipe.incr(pending_key)
+    pipe.expire(pending_key, BALLOT_RECEIPT_TTL)
+    pipe.xadd(
+        BALLOT_STREAM_KEY,
+        {
+            "receipt": receipt,
+            "election_id": election.id,
+            "voter_id": voter.id,
+            "candidacy_id": candidacy.id,
+        },
+    )
+    pipe.execute()
+    return receipt
+
+
+def get_ballot_status(election, voter, receipt):
+    """
+    Return the status of a buffered ballot for its voter.
+
+    Falls back to the Vote table once the receipt has expired.
+
+    Returns:
+        str | None: BallotStatus value, or None if the receipt is unknown or
+        belongs to another voter/election.
+    """
+    from .models import Vote
+
+    conn = get_redis_connection("default")
+    data = {
+        _decode(key): _decode(value)
+        for key, value in conn.hgetall(BALLOT_RECEIPT_KEY.format(receipt=receipt)).items()
+    }
+
+    if data:
+        if data.get("election_id") != str(election.id) or data.get("voter_id") != str(voter.id):
+            return None
+        return data["status"]
+
+    if Vote.objects.filter(election=election, voter=voter).exists():
+        return BallotStatus.ACCEPTED
+    return None
+
+
+def elections_with_pending_ballots(election_ids):
+    """
+    Return the elections that still have queued, unacknowledged ballots.
+
+    Args:
+        election_ids: Elections to check
+
+    Returns:
+        set[int]: IDs of the elections with pending ballots
+    """
+    election_ids = list(election_ids)
+    if not election_ids:
+        return set()
+
+    conn = get_redis_connection("default")
+    counts = conn.mget(
+        [BALLOT_PENDING_KEY.format(election_id=election_id) for election_id in election_ids]
+    )
+    return {
+        election_id
+        for election_id, count in zip(election_ids, counts)
+        if count is not None and int(count) > 0
+    }
+
+
+def _parse_entries(entries):
+    """Decode stream entries into ballot dicts, skipping deleted entries."""
+    ballots = []
+    for _, fields in entries:
+        if not fields:
+            # Entry deleted before it was acknowledged
+            continue
+        fields = {_decode(key): _decode(value) for key, value in fields.items()}
+        ballots.append(
+            {
+                "receipt": fields["receipt"],
+                "election_id": int(fields["election_id"]),
+                "voter_id": int(fields["voter_id"]),
+                "candidacy_id": int(fields["candidacy_id"]),
+            }
+        )
+    return ballots
+
+
+def _insert_votes(votes):
+    """
+    Insert Vote rows, skipping those that conflict with a committed vote.
+
+    The whole batch is tried in one INSERT; only if that fails are the rows
+    retried one at a time, each in its own savepoint.
+
+    Returns:
+        list[Vote]: The votes that were inserted
+    """
+    from .models import Vote
+
+    try:
+        with transaction.atomic():
+            Vote.objects.bulk_create(votes)
+        return votes
+    except IntegrityError:
+        pass
+
+    inserted = []
+    for vote in votes:
+        try:
+            with transaction.atomic():
+                vote.save(force_insert=True)
+        except IntegrityError:
+            continue
+        inserted.append(vote)
+    return inserted
+
+
+def _ingest_batch(ballots):
+    """
+    Insert one batch of ballots as Vote rows.
+
+    Returns:
+        tuple: (statuses: receipt → BallotStatus for every ballot,
+                released: (election_id, voter_id) pairs free to vote again)
+    """
+    from .models import Candidacy, Election, ElectionStatus, Vote, VoteCountShard
+
+    statuses = {}
+    released = []
+    with transaction.atomic():
+        # Ballots still queued when their election left VOTING are too late
+        voting = set(
+            Election.objects.filter(
+                id__in={ballot["election_id"] for ballot in ballots},
+                status=ElectionStatus.VOTING,
+            ).values_list("id", flat=True)
+        )
+
+        # Candidacies may have been withdrawn or unapproved since enqueue
+        valid_candidacies = dict(
+            Candidacy.objects.filter(
+                id__in={ballot["candidacy_id"] for ballot in ballots}, is_approved=True
+            ).values_list("id", "election_id")
+        )
+
+        # Existing votes for the voters in this batch, one query per election
+        voters_by_election = defaultdict(set)
+        for ballot in ballots:
+            voters_by_election[ballot["election_id"]].add(ballot["voter_id"])
+        existing = {}
+        for election_id, voter_ids in voters_by_election.items():
+            for voter_id, candidacy_id in Vote.objects.filter(
+                election_id=election_id, voter_id__in=voter_ids
+            ).values_list("voter_id", "candidacy_id"):
+                existing[(election_id, voter_id)] = candidacy_id
+
+        new_ballots = []
+        for ballot in ballots:
+            key = (ballot["election_id"], ballot["voter_id"])
+            if key in existing:
+                # Reprocessed entry from a crashed drain, or a prior direct vote
+                same_choice = existing[key] == ballot["candidacy_id"]
+                statuses[ballot["receipt"]] = (
+                    BallotStatus.ACCEPTED if same_choice else BallotStatus.REJECTED
+                )
+            elif (
+                ballot["election_id"] not in voting
+                or valid_candidacies.get(ballot["candidacy_id"]) != ballot["election_id"]
+            ):
+                statuses[ballot["receipt"]] = BallotStatus.REJECTED
+                released.append(key)
+            else:
+                existing[key] = ballot["candidacy_id"]
+                new_ballots.append(ballot)
+
+        inserted = _insert_votes(
+            [
+                Vote(
+                    election_id=ballot["election_id"],
+                    voter_id=ballot["voter_id"],
+                    candidacy_id=ballot["candidacy_id"],
+                )
+                for ballot in new_ballots
+            ]
+        )
+        inserted_keys = {(vote.election_id, vote.voter_id) for vote in inserted}
+        for ballot in new_ballots:
+            key = (ballot["election_id"], ballot["voter_id"])
+            if key in inserted_keys:
+                statuses[ballot["receipt"]] = BallotStatus.ACCEPTED
+            else:
+                # Lost to a vote committed since the read above
+                statuses[ballot["receipt"]] = BallotStatus.REJECTED
+
+        for candidacy_id, amount in Counter(vote.candidacy_id for vote in inserted).items():
+            VoteCountShard.increment(
+                Candidacy(id=candidacy_id, election_id=valid_candidacies[candidacy_id]),
+                amount=amount,
+            )
+
+    return statuses, released
+
+
+def drain_ballot_stream(batch_size=BALLOT_BATCH_SIZE, max_batches=BALLOT_MAX_BATCHES):
+    """
+    Drain buffered ballots from the stream into Vote rows.
+
+    Only one drain runs at a time. Pending (unacknowledged) entries from a
+    previous crashed run are processed before new ones. A run stops after
+    max_batches batches or BALLOT_DRAIN_TIME_LIMIT seconds; the next run
+    picks up the rest.
+
+    Returns:
+        int: Number of stream entries processed
+    """
+    if not cache.add(BALLOT_DRAIN_LOCK_KEY, 1, timeout=BALLOT_DRAIN_LOCK_TIMEOUT):
+        return 0
+
+    try:
+        conn = get_redis_connection("default")
+        try:
+            conn.xgroup_create(BALLOT_STREAM_KEY, BALLOT_CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+        deadline = time.monotonic() + BALLOT_DRAIN_TIME_LIMIT
+        processed = 0
+        batches = 0
+        # "0" re-reads our unacknowledged entries; ">" reads new ones
+        for start_id in ("0", ">"):
+            while batches < max_batches and time.monotonic() < deadline:
+                response = conn.xreadgroup(
+                    BALLOT_CONSUMER_GROUP,
+                    BALLOT_CONSUMER_NAME,
+                    {BALLOT_STREAM_KEY: start_id},
+                    count=batch_size,
+                )
+                entries = response[0][1] if response else []
+                if not entries:
+                    break
+
+                ballots = _parse_entries(entries)
+                statuses, released = _ingest_batch(ballots)
+
+                entry_ids = [entry_id for entry_id, _ in entries]
+                pipe = conn.pipeline()
+                for receipt, ballot_status in statuses.items():
+                    pipe.hset(BALLOT_RECEIPT_KEY.format(receipt=receipt), "status", ballot_status)
+                for election_id, voter_id in released:
+                    pipe.delete(BALLOT_VOTER_KEY.format(election_id=election_id, voter_id=voter_id))
+                for election_id, count in Counter(
+                    ballot["election_id"] for ballot in ballots
+                ).items():
+                    pipe.decrby(BALLOT_PENDING_KEY.format(election_id=election_id), count)
+                pipe.xack(BALLOT_STREAM_KEY, BALLOT_CONSUMER_GROUP, *entry_ids)
+                pipe.xdel(BALLOT_STREAM_KEY, *entry_ids)
+                pipe.execute()
+
+                processed += len(entries)
+                batches += 1
+
+        return processed
+    finally:
+        cache.delete(BALLOT_DRAIN_LOCK_KEY)
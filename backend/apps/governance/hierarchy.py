@@ -0,0 +1,181 @@
+"""
+In-memory governance hierarchy tree builder.
+
+Fetches every active LeaderPosition in scope (with holder and territory joins)
+in a single query, then assembles the nested 1000 → 100 → 50 → 10 structure in
+Python, mirroring LeaderPosition.get_child_positions():
+
+- 1000 → all active 100s (party-wide)
+- 100  → active 50s in the same district
+- 50   → active 10s in the same precinct
+
+Built trees are cached per (scope, max_depth). The cache is versioned and
+invalidated via invalidate_hierarchy_cache(), which signals call whenever a
+position is created, deleted, or its holder/active flag changes.
+"""
+
+import time
+from collections import defaultdict
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from .models import GovernanceTier, LeaderPosition
+
+HIERARCHY_CACHE_VERSION_KEY = "governance:hierarchy:version"
+HIERARCHY_CACHE_TIMEOUT = 60 * 10  # 10 minutes (bounds staleness of holder names)
+
+# Tier order from top to bottom of the tree
+TIER_ORDER = [
+    GovernanceTier.THOUSAND,
+    GovernanceTier.HUNDRED,
+    GovernanceTier.FIFTY,
+    GovernanceTier.ATISTAVI,
+]
+
+
+def invalidate_hierarchy_cache():
+    """Invalidate all cached hierarchy trees by bumping the cache version."""
+    cache.set(HIERARCHY_CACHE_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def _get_cache_version():
+    """Return the current hierarchy cache version, initializing it if missing."""
+    version = cache.get(HIERARCHY_CACHE_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(HIERARCHY_CACHE_VERSION_KEY, version, timeout=None)
+        version = cache.get(HIERARCHY_CACHE_VERSION_KEY, version)
+    return version
+
+
+def _serialize_node(position):
+    """Return the node dict for a position (children filled in by the builder)."""
+    holder = position.holder
+    return {
+        "id": position.id,
+        "tier": position.tier,
+        "tier_name": position.tier_name,
+        "territory_name": position.territory_name,
+        "holder": (
+            {
+                "id": holder.id,
+                "phone_number": holder.phone_number,
+                "full_name": holder.get_full_name(),
+                "role": holder.role,
+            }
+            if holder
+            else None
+        ),
+        "is_vacant": holder is None,
+        "children": [],
+    }
+
+
+def _scope_filter(tiers, district_id=None, precinct_id=None):
+    """Build the Q filter selecting all positions of the given tiers in scope."""
+    scope = Q()
+    for tier in tiers:
+        if precinct_id:
+            scope |= Q(tier=tier, precinct_id=precinct_id)
+        elif district_id:
+            if tier == GovernanceTier.ATISTAVI:
+                # Atistavi positions only carry a precinct
+                scope |= Q(tier=tier, precinct__district_id=district_id)
+            else:
+                scope |= Q(tier=tier, district_id=district_id)
+        else:
+            scope |= Q(tier=tier)
+    return scope
+
+
+def build_hierarchy_tree(district_id=None, precinct_id=None, max_depth=4):
+    """
+    Build the nested hierarchy tree for a scope.
+
+    Args:
+        district_id: Start from tier=100 positions in this district
+        precinct_id: Start from tier=50 positions in this precinct
+        max_depth: Number of levels below the roots to include (1-4)
+
+    Returns:
+        tuple: (roots: list of node dicts, start_tier: str)
+    """
+    if precinct_id:
+        start_tier, start_label = GovernanceTier.FIFTY, "50 (Precinct)"
+    elif district_id:
+        start_tier, start_label = GovernanceTier.HUNDRED, "100 (District)"
+    else:
+        start_tier, start_label = GovernanceTier.THOUSAND, "1000 (Council)"
+
+    start_index = TIER_ORDER.index(start_tier)
+    tiers = TIER_ORDER[start_index : start_index + max_depth + 1]
+
+    positions = (
+        LeaderPosition.objects.filter(
+            _scope_filter(tiers, district_id, precinct_id),
+            is_active=True,
+        )
+        .select_related("holder", "group", "precinct", "district")
+        .order_by("tier", "created_at")
+    )
+
+    roots = []
+    hundreds = []
+    fifties_by_district = defaultdict(list)
+    atistavis_by_precinct = defaultdict(list)
+
+    for position in positions:
+        node = _serialize_node(position)
+        node["_position"] = position
+        if position.tier == start_tier:
+            roots.append(node)
+        if position.tier == GovernanceTier.HUNDRED:
+            hundreds.append(node)
+        elif position.tier == GovernanceTier.FIFTY:
+            fifties_by_district[position.district_id].append(node)
+        elif position.tier == GovernanceTier.ATISTAVI:
+            atistavis_by_precinct[position.precinct_id].append(node)
+
+    def children_of(node):
+        position = node["_position"]
+        if position.tier == GovernanceTier.THOUSAND:
+            return hundreds
+        if position.tier == GovernanceTier.HUNDRED and position.district_id:
+            return fifties_by_district.get(position.district_id, [])
+        if position.tier == GovernanceTier.FIFTY and position.precinct_id:
+            return atistavis_by_precinct.get(position.precinct_id, [])
+        return []
+
+    def assemble(node, depth):
+        # Nodes may appear under several parents, so each occurrence is a copy
+        result = {key: value for key, value in node.items() if key != "_position"}
+        if depth < max_depth:
+            result["children"] = [assemble(child, depth + 1) for child in children_of(node)]
+        return result
+
+    return [assemble(root, 0) for root in roots], start_label
+
+
+def get_hierarchy_tree(district_id=None, precinct_id=None, max_depth=4):
+    """
+    Return the hierarchy tree for a scope, served from cache when available.
+
+    Returns:
+        tuple: (roots: list of node dicts, start_tier: str)
+    """
+    if precinct_id:
+        scope = f"precinct:{precinct_id}"
+    elif district_id:
+        scope = f"district:{district_id}"
+    else:
+        scope = "party"
+
+    cache_key = f"governance:hierarchy:{_get_cache_version()}:{scope}:{max_depth}"
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    tree = build_hierarchy_tree(district_id, precinct_id, max_depth)
+    cache.set(cache_key, tree, timeout=HIERARCHY_CACHE_TIMEOUT)
+    return tree
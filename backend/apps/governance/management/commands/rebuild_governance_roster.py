@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from apps.governance.roster import rebuild_roster
+
+
+class Command(BaseCommand):
+    """
+    Recompute the governance roster (RosterEntry) from LeaderPosition.
+
+    The roster is normally maintained by signals; run this after bulk data
+    changes that bypass them, or to recover from drift.
+
+    Usage:
+        python manage.py rebuild_governance_roster
+    """
+
+    help = "Rebuild the governance roster from active, held LeaderPositions."
+
+    def handle(self, *args, **options):
+        added, removed = rebuild_roster()
+        self.stdout.write(
+            self.style.SUCCESS(f"Roster rebuilt: {added} entries written, {removed} removed.")
+        )
@@ -0,0 +1,96 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Sum
+
+from apps.governance.models import Candidacy, Vote, VoteCountShard
+
+
+class Command(BaseCommand):
+    """
+    Verify sharded vote counters against the raw Vote rows.
+
+    Usage:
+        python manage.py reconcile_vote_counters
+        python manage.py reconcile_vote_counters --election-id 42
+        python manage.py reconcile_vote_counters --fix
+    """
+
+    help = "Verify (and optionally repair) VoteCountShard totals against Vote rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--election-id",
+            type=int,
+            help="Only check candidacies in this election",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite mismatched counters from the raw Vote rows",
+        )
+
+    def handle(self, *args, **options):
+        election_id = options.get("election_id")
+
+        votes = Vote.objects.all()
+        shards = VoteCountShard.objects.all()
+        candidacies = Candidacy.objects.all()
+        if election_id:
+            votes = votes.filter(election_id=election_id)
+            shards = shards.filter(election_id=election_id)
+            candidacies = candidacies.filter(election_id=election_id)
+
+        # One GROUP BY per side
+        actual = dict(
+            votes.values("candidacy_id")
+            .annotate(total=Count("id"))
+            .values_list("candidacy_id", "total")
+        )
+        counted = dict(
+            shards.values("candidacy_id")
+            .annotate(total=Sum("count"))
+            .values_list("candidacy_id", "total")
+        )
+
+        mismatches = {
+            candidacy_id: (counted.get(candidacy_id, 0), actual.get(candidacy_id, 0))
+            for candidacy_id in set(actual) | set(counted)
+            if counted.get(candidacy_id, 0) != actual.get(candidacy_id, 0)
+        }
+
+        for candidacy_id, (counter_total, vote_total) in sorted(mismatches.items()):
+            self.stdout.write(
+                f"  [MISMATCH] Candidacy #{candidacy_id}: counter={counter_total} votes={vote_total}"
+            )
+
+        if mismatches and options["fix"]:
+            election_ids = dict(
+                candidacies.filter(id__in=mismatches).values_list("id", "election_id")
+            )
+            with transaction.atomic():
+                VoteCountShard.objects.filter(candidacy_id__in=mismatches).delete()
+                VoteCountShard.objects.bulk_create(
+                    [
+                        VoteCountShard(
+                            election_id=election_ids[candidacy_id],
+                            candidacy_id=candidacy_id,
+                            shard=0,
+                            count=vote_total,
+                        )
+                        for candidacy_id, (_, vote_total) in mismatches.items()
+                        if vote_total and candidacy_id in election_ids
+                    ]
+                )
+            self.stdout.write(
+                self.style.SUCCESS(f"Repaired counters for {len(mismatches)} candidacies.")
+            )
+        elif mismatches:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(mismatches)} candidacies have drifted counters. Re-run with --fix to repair."
+                )
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"All counters match ({len(actual)} candidacies with votes).")
+            )
@@ -0,0 +1,45 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('governance', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='election',
+            name='candidate_roll_frozen_at',
+            field=models.DateTimeField(blank=True, help_text='When the candidate roll was materialized (null = live eligibility)', null=True),
+        ),
+        migrations.AddField(
+            model_name='election',
+            name='eligible_voter_count',
+            field=models.PositiveIntegerField(blank=True, help_text='Number of voters on the frozen voter roll', null=True),
+        ),
+        migrations.AddField(
+            model_name='election',
+            name='voter_roll_frozen_at',
+            field=models.DateTimeField(blank=True, help_text='When the voter roll was materialized (null = live eligibility)', null=True),
+        ),
+        migrations.CreateModel(
+            name='ElectoralRollEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('roll_type', models.CharField(choices=[('voter', 'Voter'), ('candidate', 'Candidate')], help_text='Whether this entry grants voting or candidacy eligibility', max_length=10)),
+                ('election', models.ForeignKey(help_text='Election this roll belongs to', on_delete=django.db.models.deletion.CASCADE, related_name='roll_entries', to='governance.election')),
+                ('user', models.ForeignKey(help_text='User on the roll', on_delete=django.db.models.deletion.CASCADE, related_name='electoral_roll_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Electoral Roll Entry',
+                'verbose_name_plural': 'Electoral Roll Entries',
+                'constraints': [models.UniqueConstraint(fields=('election', 'roll_type', 'user'), name='unique_roll_entry_per_user_per_election')],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_vote_count_shards(apps, schema_editor):
+    """Seed shard 0 of each candidacy's counter from existing Vote rows."""
+    from django.db.models import Count
+
+    Vote = apps.get_model("governance", "Vote")
+    Candidacy = apps.get_model("governance", "Candidacy")
+    VoteCountShard = apps.get_model("governance", "VoteCountShard")
+
+    totals = dict(
+        Vote.objects.values("candidacy_id")
+        .annotate(total=Count("id"))
+        .values_list("candidacy_id", "total")
+    )
+    election_ids = dict(
+        Candidacy.objects.filter(id__in=totals).values_list("id", "election_id")
+    )
+    VoteCountShard.objects.bulk_create(
+        [
+            VoteCountShard(
+                election_id=election_ids[candidacy_id],
+                candidacy_id=candidacy_id,
+                shard=0,
+                count=total,
+            )
+            for candidacy_id, total in totals.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('governance', '0002_electoral_roll'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VoteCountShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shard', models.PositiveSmallIntegerField(help_text='Shard number')),
+                ('count', models.PositiveIntegerField(default=0, help_text='Votes counted in this shard')),
+                ('candidacy', models.ForeignKey(help_text='Candidacy whose votes are counted', on_delete=django.db.models.deletion.CASCADE, related_name='vote_shards', to='governance.candidacy')),
+                ('election', models.ForeignKey(help_text='Election the counted votes belong to', on_delete=django.db.models.deletion.CASCADE, related_name='vote_shards', to='governance.election')),
+            ],
+            options={
+                'verbose_name': 'Vote Count Shard',
+                'verbose_name_plural': 'Vote Count Shards',
+                'indexes': [models.Index(fields=['election'], name='governance__electio_783a8b_idx')],
+                'constraints': [models.UniqueConstraint(fields=('candidacy', 'shard'), name='unique_vote_shard_per_candidacy')],
+            },
+        ),
+        migrations.RunPython(backfill_vote_count_shards, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('governance', '0003_vote_count_shards'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='election',
+            name='results_computed_at',
+            field=models.DateTimeField(blank=True, help_text='When results_snapshot was computed', null=True),
+        ),
+        migrations.AddField(
+            model_name='election',
+            name='results_etag',
+            field=models.CharField(blank=True, help_text='Content hash of results_snapshot, served as a strong ETag', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='election',
+            name='results_snapshot',
+            field=models.JSONField(blank=True, help_text='Serialized results payload, stored once the election is completed and tallied', null=True),
+        ),
+    ]
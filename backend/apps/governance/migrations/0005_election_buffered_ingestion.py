@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('governance', '0004_election_results_snapshot'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='election',
+            name='buffered_ingestion',
+            field=models.BooleanField(default=False, help_text='Queue ballots in Redis and insert them in batches instead of per request'),
+        ),
+    ]
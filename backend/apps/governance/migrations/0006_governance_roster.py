@@ -0,0 +1,57 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:23
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def populate_roster(apps, schema_editor):
+    """Create a roster entry for every active, held position."""
+    LeaderPosition = apps.get_model("governance", "LeaderPosition")
+    RosterEntry = apps.get_model("governance", "RosterEntry")
+
+    RosterEntry.objects.bulk_create(
+        [
+            RosterEntry(
+                position_id=position.id,
+                user_id=position.holder_id,
+                tier=position.tier,
+                group_id=position.group_id,
+                precinct_id=position.precinct_id,
+                district_id=position.district_id,
+            )
+            for position in LeaderPosition.objects.filter(is_active=True, holder__isnull=False)
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('communities', '0003_endorsementquota_endorsement'),
+        ('governance', '0005_election_buffered_ingestion'),
+        ('territories', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RosterEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tier', models.IntegerField(choices=[(10, 'Atistavi (10s Leader)'), (50, '50s Leader'), (100, '100s Leader'), (1000, '1000s Leader (Council Member)')])),
+                ('district', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='territories.district')),
+                ('group', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='communities.groupoften')),
+                ('position', models.OneToOneField(help_text='Position this entry mirrors', on_delete=django.db.models.deletion.CASCADE, related_name='roster_entry', to='governance.leaderposition')),
+                ('precinct', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='territories.precinct')),
+                ('user', models.ForeignKey(help_text='Current holder of the position', on_delete=django.db.models.deletion.CASCADE, related_name='roster_entries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Roster Entry',
+                'verbose_name_plural': 'Roster Entries',
+                'indexes': [models.Index(fields=['user', 'tier'], name='governance__user_id_979acd_idx'), models.Index(fields=['tier', 'precinct'], name='governance__tier_183654_idx'), models.Index(fields=['tier', 'district'], name='governance__tier_ca59da_idx')],
+            },
+        ),
+        migrations.RunPython(populate_roster, migrations.RunPython.noop),
+    ]
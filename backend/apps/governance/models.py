@@ -146,6 +146,8 @@ class LeaderPosition(models.Model):
         - Tier 50: 5 atistavis (holders of tier=10 positions in the precinct)
         - Tier 100: 2 fifty-leaders (holders of tier=50 positions in the district)
         - Tier 1000: 10 hundred-leaders (holders of tier=100 positions)
+
+        Leader tiers are looked up in the governance roster (RosterEntry).
         """
         from apps.accounts.models import User
 
@@ -159,34 +161,25 @@ class LeaderPosition(models.Model):
 
         elif self.tier == GovernanceTier.FIFTY and self.precinct:
             # Holders of tier=10 positions in the same precinct
-            atistavi_positions = LeaderPosition.objects.filter(
-                tier=GovernanceTier.ATISTAVI,
-                precinct=self.precinct,
-                is_active=True,
-                holder__isnull=False,
-            )
             return User.objects.filter(
-                held_positions__in=atistavi_positions
-            ).distinct()
+                id__in=RosterEntry.objects.filter(
+                    tier=GovernanceTier.ATISTAVI, precinct=self.precinct
+                ).values("user_id")
+            )
 
         elif self.tier == GovernanceTier.HUNDRED and self.district:
             # Holders of tier=50 positions in the same district
-            fifty_positions = LeaderPosition.objects.filter(
-                tier=GovernanceTier.FIFTY,
-                district=self.district,
-                is_active=True,
-                holder__isnull=False,
+            return User.objects.filter(
+                id__in=RosterEntry.objects.filter(
+                    tier=GovernanceTier.FIFTY, district=self.district
+                ).values("user_id")
             )
-            return User.objects.filter(held_positions__in=fifty_positions).distinct()
 
         elif self.tier == GovernanceTier.THOUSAND:
             # Holders of tier=100 positions (district-level)
-            hundred_positions = LeaderPosition.objects.filter(
-                tier=GovernanceTier.HUNDRED, is_active=True, holder__isnull=False
-            )
             return User.objects.filter(
-                held_positions__in=hundred_positions
-            ).distinct()
+                id__in=RosterEntry.objects.filter(tier=GovernanceTier.HUNDRED).values("user_id")
+            )
 
         # Fallback: empty queryset
         return User.objects.none()
@@ -310,6 +303,75 @@ class LeaderPosition(models.Model):
         return LeaderPosition.objects.none()
 
 
+class RosterEntry(models.Model):
+    """
+    A user currently holding an active leader position.
+
+    Denormalized index over LeaderPosition (one row per active, held position),
+    kept current by LeaderPosition signals and apps.governance.roster. Role and
+    territory lookups ("is this user a tier-N leader", "who are the atistavis of
+    this precinct") become indexed lookups instead of DISTINCT joins.
+
+    Rebuild with: python manage.py rebuild_governance_roster
+    """
+
+    position = models.OneToOneField(
+        LeaderPosition,
+        on_delete=models.CASCADE,
+        related_name="roster_entry",
+        help_text="Position this entry mirrors",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="roster_entries",
+        help_text="Current holder of the position",
+    )
+    tier = models.IntegerField(choices=GovernanceTier.choices)
+    group = models.ForeignKey(
+        "communities.GroupOfTen",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    precinct = models.ForeignKey(
+        "territories.Precinct",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    district = models.ForeignKey(
+        "territories.District",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+
+    class Meta:
+        verbose_name = "Roster Entry"
+        verbose_name_plural = "Roster Entries"
+        indexes = [
+            models.Index(fields=["user", "tier"]),
+            models.Index(fields=["tier", "precinct"]),
+            models.Index(fields=["tier", "district"]),
+        ]
+
+    def __str__(self):
+        """Return readable representation of the roster entry."""
+        return f"User #{self.user_id} - Tier {self.tier} (Position #{self.position_id})"
+
+
+# Rows per bulk_create batch when materializing electoral rolls
+ROLL_BATCH_SIZE = 2000
+
+# Counter rows per candidacy; votes pick a random shard so concurrent ballots
+# for one candidate don't serialize on a single row lock
+VOTE_COUNTER_SHARDS = 16
+
+
 class ElectionType(models.TextChoices):
     """
     Types of elections in the governance system.
@@ -331,6 +393,19 @@ class ElectionStatus(models.TextChoices):
     CANCELLED = "cancelled", "Cancelled"
 
 
+# Exact-time lifecycle tasks, registered per election as one-off beat entries
+# named "election-<id>-<transition>" (Election.schedule_transitions)
+ELECTION_TRANSITION_TASKS = {
+    "open-voting": "apps.governance.tasks.open_election_voting",
+    "complete-voting": "apps.governance.tasks.complete_election_voting",
+}
+
+
+def transition_task_name(election_id, transition):
+    """Name of an election's beat entry for one transition."""
+    return f"election-{election_id}-{transition}"
+
+
 class Election(models.Model):
     """
     Represents an election event with nomination and voting periods.
@@ -382,6 +457,46 @@ class Election(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Electoral roll snapshot (see ElectoralRollEntry)
+    candidate_roll_frozen_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the candidate roll was materialized (null = live eligibility)",
+    )
+    voter_roll_frozen_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the voter roll was materialized (null = live eligibility)",
+    )
+    eligible_voter_count = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="Number of voters on the frozen voter roll",
+    )
+
+    # High-turnout mode: ballots are queued and bulk-inserted (see governance.ballots)
+    buffered_ingestion = models.BooleanField(
+        default=False,
+        help_text="Queue ballots in Redis and insert them in batches instead of per request",
+    )
+
+    # Immutable results snapshot (written once by tally_election_results)
+    results_snapshot = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Serialized results payload, stored once the election is completed and tallied",
+    )
+    results_etag = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="Content hash of results_snapshot, served as a strong ETag",
+    )
+    results_computed_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When results_snapshot was computed",
+    )
+
     class Meta:
         verbose_name = "Election"
         verbose_name_plural = "Elections"
@@ -422,15 +537,83 @@ class Election(models.Model):
         Used after election completion to determine the winner.
         Returns None if no votes cast or tie.
         """
-        from django.db.models import Count
+        return self.get_results_data()["winner"]
+
+    @property
+    def total_votes(self):
+        """
+        Return total votes cast.
 
-        winner = (
-            self.candidacies.annotate(vote_count=Count("votes"))
-            .filter(is_approved=True)
-            .order_by("-vote_count")
-            .first()
+        Uses the value annotated by the queryset when present, otherwise sums
+        the sharded vote counters.
+        """
+        if getattr(self, "_total_votes", None) is None:
+            from django.db.models import Sum
+
+            self._total_votes = self.vote_shards.aggregate(total=Sum("count"))["total"] or 0
+        return self._total_votes
+
+    @total_votes.setter
+    def total_votes(self, value):
+        """Allow queryset annotations to populate total_votes."""
+        self._total_votes = value
+
+    def get_results_data(self):
+        """
+        Return results data for ElectionResultsSerializer.
+
+        Candidacies are annotated from the vote counters and ordered by votes.
+        There is no winner when no votes were cast or first place is tied.
+        """
+        from .tally import rank_candidacies
+
+        ranked, winner, is_tie = rank_candidacies(
+            self.candidacies.filter(is_approved=True)
+            .with_vote_counts()
+            .select_related("candidate")
         )
-        return winner
+        return {
+            "election_id": self.id,
+            "status": self.status,
+            "winner": winner,
+            "is_tie": is_tie,
+            "results": ranked,
+            "total_votes": self.total_votes,
+            "total_eligible_voters": self.get_eligible_voter_count(),
+        }
+
+    @property
+    def has_results_snapshot(self):
+        """Check if immutable results can be served from the stored snapshot."""
+        return self.status == ElectionStatus.COMPLETED and self.results_snapshot is not None
+
+    def apply_results_snapshot(self, payload):
+        """
+        Set the results snapshot fields from a serialized payload without saving.
+
+        Args:
+            payload: Serialized results (ElectionResultsSerializer.data)
+        """
+        import hashlib
+        import json
+
+        from django.core.serializers.json import DjangoJSONEncoder
+        from django.utils import timezone
+
+        encoded = json.dumps(payload, cls=DjangoJSONEncoder, sort_keys=True, separators=(",", ":"))
+        self.results_snapshot = json.loads(encoded)
+        self.results_etag = hashlib.sha256(encoded.encode()).hexdigest()
+        self.results_computed_at = timezone.now()
+
+    def store_results_snapshot(self, payload):
+        """
+        Persist the serialized results payload with its content hash.
+
+        Args:
+            payload: Serialized results (ElectionResultsSerializer.data)
+        """
+        self.apply_results_snapshot(payload)
+        self.save(update_fields=["results_snapshot", "results_etag", "results_computed_at"])
 
     @property
     def can_be_tallied(self):
@@ -441,7 +624,9 @@ class Election(models.Model):
         """
         Transition election from nomination to voting.
         Validates that current time >= voting_start.
+        Freezes the voter roll in the same transaction as the status change.
         """
+        from django.db import transaction
         from django.utils import timezone
 
         if self.status != ElectionStatus.NOMINATION:
@@ -450,8 +635,10 @@ class Election(models.Model):
         if timezone.now() < self.voting_start:
             raise ValueError("Cannot transition to voting before voting_start time")
 
-        self.status = ElectionStatus.VOTING
-        self.save(update_fields=["status"])
+        with transaction.atomic():
+            self.status = ElectionStatus.VOTING
+            self.save(update_fields=["status"])
+            self.freeze_voter_roll()
 
     def transition_to_completed(self):
         """
@@ -469,6 +656,161 @@ class Election(models.Model):
         self.status = ElectionStatus.COMPLETED
         self.save(update_fields=["status"])
 
+    def schedule_transitions(self):
+        """
+        Register lifecycle tasks at the exact voting_start and voting_end.
+
+        Each transition is a one-off django_celery_beat PeriodicTask on a
+        ClockedSchedule, so it lives in the database and is fired once by the
+        DatabaseScheduler. Called whenever the election is created or its
+        schedule changes: an entry that already matches is left alone, a moved
+        one is re-pointed, and entries for transitions no longer ahead are
+        removed. Entries are removed for good by unschedule_transitions().
+        """
+        import json
+
+        from django.db import transaction
+        from django_celery_beat.models import ClockedSchedule, PeriodicTask
+
+        due = {}
+        if self.status == ElectionStatus.NOMINATION:
+            due["open-voting"] = self.voting_start
+        if self.status in (ElectionStatus.NOMINATION, ElectionStatus.VOTING):
+            due["complete-voting"] = self.voting_end
+
+        names = {
+            transition: transition_task_name(self.id, transition)
+            for transition in ELECTION_TRANSITION_TASKS
+        }
+        with transaction.atomic():
+            existing = {
+                entry.name: entry
+                for entry in PeriodicTask.objects.filter(name__in=names.values()).select_related(
+                    "clocked"
+                )
+            }
+            stale_clocked = set()
+            for transition, name in names.items():
+                entry = existing.get(name)
+                run_at = due.get(transition)
+                if run_at is None:
+                    if entry is not None:
+                        stale_clocked.add(entry.clocked_id)
+                        entry.delete()
+                    continue
+                if entry is not None and entry.enabled and entry.clocked.clocked_time == run_at:
+                    continue
+
+                clocked = ClockedSchedule.objects.filter(clocked_time=run_at).first()
+                if clocked is None:
+                    clocked = ClockedSchedule.objects.create(clocked_time=run_at)
+                if entry is None:
+                    PeriodicTask.objects.create(
+                        name=name,
+                        task=ELECTION_TRANSITION_TASKS[transition],
+                        clocked=clocked,
+                        one_off=True,
+                        args=json.dumps([self.id]),
+                    )
+                else:
+                    stale_clocked.add(entry.clocked_id)
+                    entry.clocked = clocked
+                    entry.enabled = True
+                    entry.save()
+
+            ClockedSchedule.objects.filter(
+                id__in=stale_clocked, periodictask__isnull=True
+            ).delete()
+
+    @classmethod
+    def unschedule_transitions(cls, election_ids):
+        """
+        Delete the transition beat entries of finished or deleted elections.
+
+        Args:
+            election_ids: Elections whose entries are removed
+        """
+        from django.db import transaction
+        from django_celery_beat.models import ClockedSchedule, PeriodicTask
+
+        names = [
+            transition_task_name(election_id, transition)
+            for election_id in election_ids
+            for transition in ELECTION_TRANSITION_TASKS
+        ]
+        with transaction.atomic():
+            entries = PeriodicTask.objects.filter(name__in=names)
+            clocked_ids = set(entries.values_list("clocked_id", flat=True))
+            entries.delete()
+            ClockedSchedule.objects.filter(id__in=clocked_ids, periodictask__isnull=True).delete()
+
+    @classmethod
+    def open_due_voting(cls, election_ids=None):
+        """
+        Transition every due NOMINATION election to VOTING.
+
+        One conditional UPDATE moves all elections whose voting_start has
+        passed; their voter rolls are frozen in the same transaction. Idempotent:
+        elections that already moved on are excluded by the status guard.
+
+        Args:
+            election_ids: Restrict to these elections (default: all due)
+
+        Returns:
+            list: IDs of the elections transitioned
+        """
+        from django.db import transaction
+        from django.utils import timezone
+
+        with transaction.atomic():
+            due = cls.objects.filter(
+                status=ElectionStatus.NOMINATION, voting_start__lte=timezone.now()
+            )
+            if election_ids is not None:
+                due = due.filter(id__in=election_ids)
+
+            opened = list(due.select_for_update(skip_locked=True).values_list("id", flat=True))
+            if not opened:
+                return []
+
+            cls.objects.filter(id__in=opened).update(status=ElectionStatus.VOTING)
+            for election in cls.objects.filter(id__in=opened).select_related("position"):
+                election.freeze_voter_roll()
+
+        return opened
+
+    @classmethod
+    def complete_due_voting(cls, election_ids=None, exclude_ids=()):
+        """
+        Transition every due VOTING election to COMPLETED.
+
+        One conditional UPDATE moves all elections whose voting_end has passed.
+        Idempotent: elections that already moved on are excluded by the
+        status guard.
+
+        Args:
+            election_ids: Restrict to these elections (default: all due)
+            exclude_ids: Elections to leave in VOTING for now
+
+        Returns:
+            list: IDs of the elections transitioned
+        """
+        from django.db import transaction
+        from django.utils import timezone
+
+        with transaction.atomic():
+            due = cls.objects.filter(status=ElectionStatus.VOTING, voting_end__lte=timezone.now())
+            if election_ids is not None:
+                due = due.filter(id__in=election_ids)
+            if exclude_ids:
+                due = due.exclude(id__in=exclude_ids)
+
+            completed = list(due.select_for_update(skip_locked=True).values_list("id", flat=True))
+            if completed:
+                cls.objects.filter(id__in=completed).update(status=ElectionStatus.COMPLETED)
+
+        return completed
+
     def get_eligible_voters(self):
         """
         Return queryset of users eligible to vote in this election.
@@ -509,6 +851,152 @@ class Election(models.Model):
                 return User.objects.none()
             return self.position.get_eligible_candidates()
 
+    def _freeze_roll(self, roll_type, source_queryset):
+        """
+        Materialize an electoral roll from a live eligibility queryset.
+
+        Replaces any existing entries of the same roll type, streams user ids
+        from the database and inserts them in batches.
+
+        Returns:
+            int: Number of users on the roll
+        """
+        from django.db import transaction
+
+        with transaction.atomic():
+            self.roll_entries.filter(roll_type=roll_type).delete()
+
+            batch = []
+            for user_id in source_queryset.values_list("id", flat=True).iterator(
+                chunk_size=ROLL_BATCH_SIZE
+            ):
+                batch.append(
+                    ElectoralRollEntry(election=self, user_id=user_id, roll_type=roll_type)
+                )
+                if len(batch) >= ROLL_BATCH_SIZE:
+                    ElectoralRollEntry.objects.bulk_create(batch, ignore_conflicts=True)
+                    batch = []
+            if batch:
+                ElectoralRollEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+            return self.roll_entries.filter(roll_type=roll_type).count()
+
+    def freeze_candidate_roll(self):
+        """
+        Snapshot the users eligible to run in this election.
+
+        Called when the election enters NOMINATION (i.e. on creation).
+        """
+        from django.utils import timezone
+
+        self._freeze_roll(ElectoralRollEntry.RollType.CANDIDATE, self.get_eligible_candidates())
+        self.candidate_roll_frozen_at = timezone.now()
+        self.save(update_fields=["candidate_roll_frozen_at"])
+
+    def freeze_voter_roll(self):
+        """
+        Snapshot the users eligible to vote in this election.
+
+        Called when the election enters VOTING. Stores the roll size so results
+        don't need to recount eligible voters.
+        """
+        from django.utils import timezone
+
+        count = self._freeze_roll(ElectoralRollEntry.RollType.VOTER, self.get_eligible_voters())
+        self.voter_roll_frozen_at = timezone.now()
+        self.eligible_voter_count = count
+        self.save(update_fields=["voter_roll_frozen_at", "eligible_voter_count"])
+
+    def is_eligible_voter(self, user):
+        """
+        Check whether user may vote in this election.
+
+        Uses the frozen voter roll (indexed point lookup) once it exists,
+        otherwise falls back to live eligibility.
+        """
+        if self.voter_roll_frozen_at:
+            return self.roll_entries.filter(
+                roll_type=ElectoralRollEntry.RollType.VOTER, user=user
+            ).exists()
+        return self.get_eligible_voters().filter(pk=user.pk).exists()
+
+    def is_eligible_candidate(self, user):
+        """
+        Check whether user may run in this election.
+
+        Uses the frozen candidate roll once it exists, otherwise falls back to
+        live eligibility.
+        """
+        if self.candidate_roll_frozen_at:
+            return self.roll_entries.filter(
+                roll_type=ElectoralRollEntry.RollType.CANDIDATE, user=user
+            ).exists()
+        return self.get_eligible_candidates().filter(pk=user.pk).exists()
+
+    def get_eligible_voter_count(self):
+        """Return the number of eligible voters (stored count once the roll is frozen)."""
+        if self.voter_roll_frozen_at and self.eligible_voter_count is not None:
+            return self.eligible_voter_count
+        return self.get_eligible_voters().count()
+
+
+class ElectoralRollEntry(models.Model):
+    """
+    A user on an election's frozen electoral roll.
+
+    Rolls are materialized in bulk from live eligibility rules:
+    - Candidate roll: when the election enters NOMINATION
+    - Voter roll: when the election enters VOTING
+
+    Once frozen, eligibility checks become indexed point lookups and the roll
+    no longer shifts as memberships or positions change mid-election.
+    """
+
+    class RollType(models.TextChoices):
+        VOTER = "voter", "Voter"
+        CANDIDATE = "candidate", "Candidate"
+
+    election = models.ForeignKey(
+        Election,
+        on_delete=models.CASCADE,
+        related_name="roll_entries",
+        help_text="Election this roll belongs to",
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="electoral_roll_entries",
+        help_text="User on the roll",
+    )
+    roll_type = models.CharField(
+        max_length=10,
+        choices=RollType.choices,
+        help_text="Whether this entry grants voting or candidacy eligibility",
+    )
+
+    class Meta:
+        verbose_name = "Electoral Roll Entry"
+        verbose_name_plural = "Electoral Roll Entries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["election", "roll_type", "user"],
+                name="unique_roll_entry_per_user_per_election",
+            )
+        ]
+
+    def __str__(self):
+        """Return readable representation of the roll entry."""
+        return f"User #{self.user_id} ({self.roll_type}) - Election #{self.election_id}"
+
+
+class CandidacyQuerySet(models.QuerySet):
+    def with_vote_counts(self):
+        """Annotate each candidacy with vote_count summed from its counter shards."""
+        from django.db.models import Sum
+        from django.db.models.functions import Coalesce
+
+        return self.annotate(vote_count=Coalesce(Sum("vote_shards__count"), 0))
+
 
 class Candidacy(models.Model):
     """
@@ -538,6 +1026,8 @@ class Candidacy(models.Model):
         default=True, help_text="Whether candidacy is approved (for future moderation)"
     )
 
+    objects = CandidacyQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Candidacy"
         verbose_name_plural = "Candidacies"
@@ -561,8 +1051,24 @@ class Candidacy(models.Model):
 
     @property
     def vote_count(self):
-        """Return count of votes received."""
-        return self.votes.count()
+        """
+        Return count of votes received.
+
+        Uses the value annotated by with_vote_counts() when present, otherwise
+        sums this candidacy's counter shards.
+        """
+        if getattr(self, "_vote_count", None) is None:
+            from django.db.models import Sum
+
+            self._vote_count = (
+                self.vote_shards.aggregate(total=Sum("count"))["total"] or 0
+            )
+        return self._vote_count
+
+    @vote_count.setter
+    def vote_count(self, value):
+        """Allow queryset annotations to populate vote_count."""
+        self._vote_count = value
 
 
 class Vote(models.Model):
@@ -614,3 +1120,79 @@ class Vote(models.Model):
             or self.candidacy.candidate.phone_number
         )
         return f"{voter_name} votes for {candidate_name} - Election #{self.election.id}"
+
+
+class VoteCountShard(models.Model):
+    """
+    One shard of a candidacy's denormalized vote counter.
+
+    Each vote increments a randomly chosen shard in the same transaction as
+    the Vote insert. A candidacy's total is the sum of its shards; an
+    election's total is the sum of all its candidacies' shards. Shard rows are
+    created lazily on first use.
+
+    Use the reconcile_vote_counters management command to verify shards
+    against the raw Vote rows.
+    """
+
+    election = models.ForeignKey(
+        Election,
+        on_delete=models.CASCADE,
+        related_name="vote_shards",
+        help_text="Election the counted votes belong to",
+    )
+    candidacy = models.ForeignKey(
+        Candidacy,
+        on_delete=models.CASCADE,
+        related_name="vote_shards",
+        help_text="Candidacy whose votes are counted",
+    )
+    shard = models.PositiveSmallIntegerField(help_text="Shard number")
+    count = models.PositiveIntegerField(default=0, help_text="Votes counted in this shard")
+
+    class Meta:
+        verbose_name = "Vote Count Shard"
+        verbose_name_plural = "Vote Count Shards"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["candidacy", "shard"], name="unique_vote_shard_per_candidacy"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["election"]),
+        ]
+
+    def __str__(self):
+        """Return readable representation of the shard."""
+        return f"Candidacy #{self.candidacy_id} shard {self.shard}: {self.count}"
+
+    @classmethod
+    def increment(cls, candidacy, amount=1):
+        """
+        Add votes to a random shard of the candidacy's counter.
+
+        Must be called inside the transaction that inserts the Vote rows.
+        """
+        import random
+
+        from django.db import IntegrityError, transaction
+        from django.db.models import F
+
+        shard = random.randrange(VOTE_COUNTER_SHARDS)
+        shard_rows = cls.objects.filter(candidacy_id=candidacy.id, shard=shard)
+
+        if shard_rows.update(count=F("count") + amount):
+            return
+
+        # First vote landing on this shard: create it, or fall back to the
+        # update if a concurrent transaction created it first
+        try:
+            with transaction.atomic():
+                cls.objects.create(
+                    election_id=candidacy.election_id,
+                    candidacy_id=candidacy.id,
+                    shard=shard,
+                    count=amount,
+                )
+        except IntegrityError:
+            shard_rows.update(count=F("count") + amount)
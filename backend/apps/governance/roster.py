@@ -0,0 +1,117 @@
+"""
+Governance roster maintenance and lookups.
+
+The roster (RosterEntry) holds one row per active LeaderPosition with a holder,
+copying the position's tier and territory. It is kept current by:
+
+- LeaderPosition post_save signals → sync_positions([position])
+- bulk position writes that skip signals (e.g. the tally engine) → sync_positions()
+- CASCADE deletes when a position or user is removed
+
+Every change bumps the affected users' capability_version so capability claims
+in their access tokens stop being trusted (apps.accounts.capabilities).
+
+rebuild_roster() recomputes it from LeaderPosition for recovery.
+"""
+
+from django.db import transaction
+
+from .models import LeaderPosition, RosterEntry
+
+# LeaderPosition fields mirrored by the roster
+ROSTER_FIELDS = ("holder", "tier", "group", "precinct", "district")
+
+
+def _entry_for(position):
+    """Return the unsaved RosterEntry for a position, or None if it has none."""
+    if not position.is_active or position.holder_id is None:
+        return None
+    return RosterEntry(
+        position_id=position.id,
+        user_id=position.holder_id,
+        tier=position.tier,
+        group_id=position.group_id,
+        precinct_id=position.precinct_id,
+        district_id=position.district_id,
+    )
+
+
+def sync_positions(positions):
+    """
+    Bring the roster rows for the given positions in line with their state.
+
+    Replaces the positions' entries with one delete and one bulk_create.
+    """
+    positions = list(positions)
+    entries = [entry for entry in map(_entry_for, positions) if entry is not None]
+
+    with transaction.atomic():
+        current = RosterEntry.objects.filter(position_id__in=[position.id for position in positions])
+        affected = set(current.values_list("user_id", flat=True))
+        current.delete()
+        RosterEntry.objects.bulk_create(entries)
+
+        affected.update(entry.user_id for entry in entries)
+        bump_capability_versions(affected)
+
+
+def bump_capability_versions(user_ids):
+    """Invalidate capability token claims of users whose positions changed."""
+    from django.db.models import F
+
+    from apps.accounts.models import User
+
+    if user_ids:
+        User.objects.filter(id__in=user_ids).update(capability_version=F("capability_version") + 1)
+
+
+def rebuild_roster():
+    """
+    Recompute the whole roster from LeaderPosition.
+
+    Returns:
+        tuple: (added: int, removed: int) rows changed
+    """
+    expected = {
+        entry.position_id: entry
+        for entry in map(
+            _entry_for,
+            LeaderPosition.objects.filter(is_active=True, holder__isnull=False).only(
+                "id", "is_active", *ROSTER_FIELDS
+            ),
+        )
+    }
+
+    def key(entry):
+        return (
+            entry.position_id,
+            entry.user_id,
+            entry.tier,
+            entry.group_id,
+            entry.precinct_id,
+            entry.district_id,
+        )
+
+    with transaction.atomic():
+        current = {entry.position_id: entry for entry in RosterEntry.objects.select_for_update()}
+
+        stale = [
+            position_id
+            for position_id, entry in current.items()
+            if position_id not in expected or key(entry) != key(expected[position_id])
+        ]
+        missing = [
+            entry
+            for position_id, entry in expected.items()
+            if position_id not in current or position_id in stale
+        ]
+
+        RosterEntry.objects.filter(position_id__in=stale).delete()
+        RosterEntry.objects.bulk_create(missing)
+
+        bump_capability_versions(
+            {current[position_id].user_id for position_id in stale}
+            | {entry.user_id for entry in missing}
+        )
+
+    return len(missing), len(stale)
@@ -156,60 +156,6 @@ class LeaderPositionDetailSerializer(serializers.ModelSerializer):
         }
 
 
-class HierarchyNodeSerializer(serializers.Serializer):
-    """
-    Serializer for a single position in the hierarchy tree.
-    Includes nested children for recursive tree structure.
-    """
-
-    id = serializers.IntegerField()
-    tier = serializers.IntegerField()
-    tier_name = serializers.CharField()
-    territory_name = serializers.CharField()
-    holder = serializers.SerializerMethodField()
-    is_vacant = serializers.BooleanField()
-    children = serializers.SerializerMethodField()
-
-    def get_holder(self, obj):
-        """Return holder details."""
-        if not obj.holder:
-            return None
-        return {
-            "id": obj.holder.id,
-            "phone_number": obj.holder.phone_number,
-            "full_name": obj.holder.get_full_name(),
-            "role": obj.holder.role,
-        }
-
-    def get_children(self, obj):
-        """
-        Return children positions at the tier below.
-        Recursively serializes child positions.
-        """
-        # Get context to check if we should include children
-        include_children = self.context.get("include_children", True)
-        max_depth = self.context.get("max_depth", 4)  # Default: all 4 tiers
-        current_depth = self.context.get("current_depth", 0)
-
-        if not include_children or current_depth >= max_depth:
-            return []
-
-        # Get child positions using the helper method
-        child_positions = obj.get_child_positions()
-
-        if not child_positions.exists():
-            return []
-
-        # Increment depth for recursion
-        child_context = self.context.copy()
-        child_context["current_depth"] = current_depth + 1
-
-        # Serialize children recursively
-        return HierarchyNodeSerializer(
-            child_positions, many=True, context=child_context
-        ).data
-
-
 # ============================================================================
 # CANDIDACY SERIALIZERS
 # ============================================================================
@@ -330,6 +276,7 @@ class ElectionDetailSerializer(serializers.ModelSerializer):
             "nomination_end",
             "voting_start",
             "voting_end",
+            "buffered_ingestion",
             "candidacies",
             "total_votes",
             "created_by",
@@ -361,6 +308,7 @@ class ElectionCreateSerializer(serializers.ModelSerializer):
             "nomination_end",
             "voting_start",
             "voting_end",
+            "buffered_ingestion",
         ]
 
     def validate(self, data):
@@ -410,15 +358,25 @@ class ElectionCreateSerializer(serializers.ModelSerializer):
         return data
 
 
+class BallotReceiptSerializer(serializers.Serializer):
+    """
+    Serializer for buffered ballot receipts.
+    """
+
+    receipt = serializers.CharField()
+    status = serializers.CharField()
+
+
 class ElectionResultsSerializer(serializers.Serializer):
     """
     Serializer for election results endpoint.
-    Returns vote tallies and winner.
+    Returns vote tallies and winner (null when no votes were cast or on a tie).
     """
 
     election_id = serializers.IntegerField()
     status = serializers.CharField()
     winner = serializers.SerializerMethodField()
+    is_tie = serializers.BooleanField()
     results = serializers.SerializerMethodField()
     total_votes = serializers.IntegerField()
     total_eligible_voters = serializers.IntegerField()
@@ -1,9 +1,14 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from apps.accounts.models import User
+from apps.accounts.roles import role_changed
 from apps.communities.models import GroupOfTen
 
-from .models import GovernanceTier, LeaderPosition
+from .hierarchy import invalidate_hierarchy_cache
+from .models import Election, GovernanceTier, LeaderPosition, RosterEntry
+from .roster import bump_capability_versions, sync_positions
 
 
 @receiver(post_save, sender=GroupOfTen)
@@ -24,3 +29,92 @@ def create_atistavi_position_for_group(sender, instance, created, **kwargs):
                 "is_active": True,
             },
         )
+
+
+@receiver(post_save, sender=Election)
+def freeze_candidate_roll_for_election(sender, instance, created, **kwargs):
+    """
+    Materialize the candidate roll when an Election is created.
+
+    Elections start in NOMINATION, so the candidate roll is frozen at creation.
+    The voter roll is frozen later by Election.transition_to_voting().
+    """
+    if created:
+        instance.freeze_candidate_roll()
+
+
+# Fields whose change moves an election's scheduled transitions
+SCHEDULE_FIELDS = {"voting_start", "voting_end"}
+
+
+@receiver(post_save, sender=Election)
+def schedule_election_transitions(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Register exact-time lifecycle tasks when an election is created or rescheduled.
+
+    Scheduled after commit so the tasks never see uncommitted rows. Status-only
+    saves from the transitions themselves don't reschedule, and unchanged
+    entries are left untouched (see Election.schedule_transitions).
+    """
+    if created or update_fields is None or SCHEDULE_FIELDS & set(update_fields):
+        transaction.on_commit(instance.schedule_transitions)
+
+
+@receiver(post_delete, sender=Election)
+def unschedule_election_transitions(sender, instance, **kwargs):
+    """Drop a deleted election's lifecycle beat entries."""
+    election_id = instance.id
+    transaction.on_commit(lambda: Election.unschedule_transitions([election_id]))
+
+
+# Fields whose change alters the shape or content of the hierarchy tree (and
+# the governance roster)
+HIERARCHY_FIELDS = {"holder", "is_active", "tier", "group", "precinct", "district"}
+
+
+@receiver(post_save, sender=LeaderPosition)
+def invalidate_hierarchy_on_position_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Invalidate cached hierarchy trees when a position is created or its
+    holder/active flag (or territory) changes.
+    """
+    if created or update_fields is None or HIERARCHY_FIELDS & set(update_fields):
+        invalidate_hierarchy_cache()
+
+
+@receiver(post_save, sender=LeaderPosition)
+def sync_roster_on_position_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Keep the governance roster in line with a position's holder, active flag
+    and territory. Deleted positions drop out of the roster via CASCADE.
+    """
+    if created or update_fields is None or HIERARCHY_FIELDS & set(update_fields):
+        sync_positions([instance])
+
+
+@receiver(post_delete, sender=LeaderPosition)
+def invalidate_hierarchy_on_position_delete(sender, instance, **kwargs):
+    """Invalidate cached hierarchy trees when a position is deleted."""
+    invalidate_hierarchy_cache()
+
+
+@receiver(post_delete, sender=LeaderPosition)
+def invalidate_capabilities_on_position_delete(sender, instance, **kwargs):
+    """
+    Invalidate the holder's capability claims when a held position is deleted.
+
+    The roster entry itself is removed by CASCADE.
+    """
+    if instance.is_active and instance.holder_id:
+        bump_capability_versions({instance.holder_id})
+
+
+@receiver(role_changed, sender=User)
+def invalidate_hierarchy_on_role_change(sender, transitions, **kwargs):
+    """
+    Invalidate cached hierarchy trees when a position holder's role changes
+    (trees show each holder's role).
+    """
+    user_ids = [t.user_id for t in transitions if t.old_role is not None]
+    if user_ids and RosterEntry.objects.filter(user_id__in=user_ids).exists():
+        invalidate_hierarchy_cache()
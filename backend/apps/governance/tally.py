@@ -0,0 +1,136 @@
+"""
+Batch tally engine for completed elections.
+
+Tallies any number of elections with a fixed number of queries:
+
+- one GROUP BY over the sharded vote counters for all election ids
+- one query for the approved candidacies (with candidates)
+- one bulk_update for the results snapshots
+- one bulk_update for the LeaderPositions that receive a winner (plus the
+  matching governance roster sync)
+
+Ties for first place are reported explicitly; tied elections get a results
+snapshot but no winner is assigned to their position.
+"""
+
+from collections import defaultdict
+
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from .models import Candidacy, Election, ElectionStatus, LeaderPosition, VoteCountShard
+
+
+def rank_candidacies(candidacies):
+    """
+    Order candidacies by votes and determine the winner.
+
+    Candidacies must carry vote_count. There is no winner when no votes were
+    cast or when two or more candidacies share the highest count.
+
+    Returns:
+        tuple: (ranked candidacies, winner or None, is_tie)
+    """
+    ranked = sorted(candidacies, key=lambda candidacy: -candidacy.vote_count)
+    if not ranked or ranked[0].vote_count == 0:
+        return ranked, None, False
+    if len(ranked) > 1 and ranked[1].vote_count == ranked[0].vote_count:
+        return ranked, None, True
+    return ranked, ranked[0], False
+
+
+def tally_elections(election_ids):
+    """
+    Compute results for completed elections and assign winners to positions.
+
+    Elections that are not COMPLETED are skipped. Positions are updated in a
+    single transaction together with the results snapshots.
+
+    Returns:
+        dict: election id lists keyed by outcome:
+              "assigned", "tied", "no_votes", "no_position", "skipped"
+    """
+    from .hierarchy import invalidate_hierarchy_cache
+    from .roster import sync_positions
+    from .serializers import ElectionResultsSerializer
+
+    outcome = {key: [] for key in ("assigned", "tied", "no_votes", "no_position", "skipped")}
+
+    elections = {
+        election.id: election
+        for election in Election.objects.filter(id__in=election_ids).select_related("position")
+    }
+    outcome["skipped"] = [
+        election_id
+        for election_id in election_ids
+        if election_id not in elections or elections[election_id].status != ElectionStatus.COMPLETED
+    ]
+    elections = {
+        election_id: election
+        for election_id, election in elections.items()
+        if election.status == ElectionStatus.COMPLETED
+    }
+    if not elections:
+        return outcome
+
+    # One aggregate pass over the counters for every election in the batch
+    counts = {}
+    totals = defaultdict(int)
+    for row in (
+        VoteCountShard.objects.filter(election_id__in=elections)
+        .values("election_id", "candidacy_id")
+        .annotate(total=Sum("count"))
+    ):
+        counts[row["candidacy_id"]] = row["total"]
+        totals[row["election_id"]] += row["total"]
+
+    candidacies_by_election = defaultdict(list)
+    for candidacy in Candidacy.objects.filter(
+        election_id__in=elections, is_approved=True
+    ).select_related("candidate"):
+        candidacy.vote_count = counts.get(candidacy.id, 0)
+        candidacies_by_election[candidacy.election_id].append(candidacy)
+
+    now = timezone.now()
+    positions = []
+    for election_id, election in elections.items():
+        ranked, winner, is_tie = rank_candidacies(candidacies_by_election[election_id])
+        results_data = {
+            "election_id": election_id,
+            "status": election.status,
+            "winner": winner,
+            "is_tie": is_tie,
+            "results": ranked,
+            "total_votes": totals[election_id],
+            "total_eligible_voters": election.get_eligible_voter_count(),
+        }
+        election.apply_results_snapshot(ElectionResultsSerializer(results_data).data)
+
+        if not election.can_be_tallied:
+            outcome["no_position"].append(election_id)
+        elif is_tie:
+            outcome["tied"].append(election_id)
+        elif winner is None:
+            outcome["no_votes"].append(election_id)
+        else:
+            position = election.position
+            position.holder_id = winner.candidate_id
+            position.held_since = now
+            positions.append(position)
+            outcome["assigned"].append(election_id)
+
+    with transaction.atomic():
+        Election.objects.bulk_update(
+            elections.values(), ["results_snapshot", "results_etag", "results_computed_at"]
+        )
+        if positions:
+            LeaderPosition.objects.bulk_update(positions, ["holder", "held_since"])
+            # bulk_update skips post_save, so sync the roster and
+            # hierarchy cache here
+            sync_positions(positions)
+
+    if positions:
+        invalidate_hierarchy_cache()
+
+    return outcome
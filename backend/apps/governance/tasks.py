@@ -1,11 +1,26 @@
 import logging
 
 from celery import shared_task
-from django.utils import timezone
 
 logger = logging.getLogger(__name__)
 
 
+def _log_tally_outcome(outcome):
+    """Log the per-election outcome of a batch tally."""
+    for election_id in outcome["skipped"]:
+        logger.warning(f"Election {election_id} is missing or not completed, skipping tally")
+    for election_id in outcome["no_position"]:
+        logger.info(f"Election {election_id} cannot be tallied (parliamentary or no position)")
+    for election_id in outcome["no_votes"]:
+        logger.warning(f"Election {election_id} has no winner (no votes cast)")
+    for election_id in outcome["tied"]:
+        logger.warning(f"Election {election_id} has a tie for first place, position not assigned")
+    if outcome["assigned"]:
+        logger.info(
+            f"Assigned winners for {len(outcome['assigned'])} elections: {outcome['assigned']}"
+        )
+
+
 @shared_task
 def tally_election_results(election_id: int):
     """
@@ -13,115 +28,158 @@ def tally_election_results(election_id: int):
 
     Steps:
     1. Get election and verify it's completed
-    2. Get winner via election.get_winner()
-    3. If winner exists:
+    2. Compute results once and store them as the immutable results snapshot
+    3. If the election has a position and a single winner with votes:
        - Update position.holder = winner.candidate
        - Update position.held_since = timezone.now()
     4. Log result
 
-    Called manually or by close_expired_elections task after election completes.
+    Called manually or by complete_election_voting after election completes.
+    Delegates to the batch tally engine (apps.governance.tally).
     """
-    from .models import Election, ElectionStatus
+    from .tally import tally_elections as run_tally
 
-    try:
-        election = Election.objects.select_related("position").get(id=election_id)
-    except Election.DoesNotExist:
-        logger.error(f"Election {election_id} does not exist")
-        return
+    _log_tally_outcome(run_tally([election_id]))
 
-    # Check if election is completed
-    if election.status != ElectionStatus.COMPLETED:
-        logger.warning(
-            f"Election {election_id} is not completed (status={election.status}), skipping tally"
-        )
-        return
 
-    # Check if election can be tallied (has a position)
-    if not election.can_be_tallied:
-        logger.info(
-            f"Election {election_id} cannot be tallied (parliamentary or no position)"
-        )
-        return
+# Elections per tally task when fanning out after a completion sweep
+TALLY_BATCH_SIZE = 50
 
-    # Get winner
-    winner = election.get_winner()
 
-    if not winner:
-        logger.warning(f"Election {election_id} has no winner (no votes cast)")
-        return
+@shared_task
+def tally_elections(election_ids: list):
+    """
+    Tally a batch of completed elections in one task.
+
+    Used for fan-out after bulk completion instead of one task per election.
+    All counts come from one aggregate query and all winners are assigned with
+    one bulk update.
+    """
+    from .tally import tally_elections as run_tally
 
-    # Check if there are any votes
-    vote_count = winner.vote_count
-    if vote_count == 0:
-        logger.warning(f"Election {election_id} has no votes cast")
-        return
+    _log_tally_outcome(run_tally(election_ids))
 
-    # Assign winner to position
-    position = election.position
-    position.holder = winner.candidate
-    position.held_since = timezone.now()
-    position.save(update_fields=["holder", "held_since"])
 
-    logger.info(
-        f"Election {election_id} results tallied: Winner is {winner.candidate} "
-        f"(User #{winner.candidate.id}) with {vote_count} votes. "
-        f"Assigned to position #{position.id}."
-    )
+def _dispatch_tallies(election_ids):
+    """Queue tally tasks for completed elections in batches of TALLY_BATCH_SIZE."""
+    for start in range(0, len(election_ids), TALLY_BATCH_SIZE):
+        tally_elections.delay(election_ids[start : start + TALLY_BATCH_SIZE])
 
 
 @shared_task
-def close_expired_elections():
+def open_election_voting(election_id: int):
     """
-    Automatically transition elections when periods end.
+    Transition one election to VOTING at its exact voting_start.
 
-    Steps:
-    1. Find elections in NOMINATION status where current_time >= voting_start
-       → Transition to VOTING
-    2. Find elections in VOTING status where current_time >= voting_end
-       → Transition to COMPLETED
-       → Call tally_election_results.delay(election_id)
+    Fired once by a clocked beat entry from Election.schedule_transitions().
+    A no-op if the election was already opened, cancelled, or rescheduled to
+    a later voting_start.
+    """
+    from .models import Election
+
+    if Election.open_due_voting([election_id]):
+        logger.info(f"Election {election_id} transitioned to VOTING")
 
-    Runs every 15 minutes via Celery Beat (configured in Django admin).
+
+# Seconds between completion attempts of a buffered election with queued ballots
+BALLOT_HOLD_RETRY_DELAY = 10
+
+
+def _complete_due_voting(election_ids=None):
     """
-    from .models import Election, ElectionStatus
+    Complete due VOTING elections, holding buffered ones with queued ballots.
 
-    now = timezone.now()
+    The ballot stream is drained first so ballots cast before voting_end are
+    in the Vote table before the election completes and is tallied. Buffered
+    elections that still have queued ballots afterwards (another drain holds
+    the lock, or a run stopped at its batch cap) stay in VOTING.
 
-    # Transition nomination → voting
-    expired_nomination = Election.objects.filter(
-        status=ElectionStatus.NOMINATION, voting_start__lte=now
-    )
+    Returns:
+        tuple: (completed election IDs, held election IDs)
+    """
+    from django.utils import timezone
 
-    nomination_count = 0
-    for election in expired_nomination:
-        try:
-            election.transition_to_voting()
-            nomination_count += 1
-            logger.info(f"Election {election.id} transitioned to VOTING")
-        except ValueError as e:
-            logger.error(f"Failed to transition election {election.id} to VOTING: {e}")
-
-    # Transition voting → completed
-    expired_voting = Election.objects.filter(
-        status=ElectionStatus.VOTING, voting_end__lte=now
+    from .ballots import drain_ballot_stream, elections_with_pending_ballots
+    from .models import Election, ElectionStatus
+
+    buffered = Election.objects.filter(
+        status=ElectionStatus.VOTING, voting_end__lte=timezone.now(), buffered_ingestion=True
     )
+    if election_ids is not None:
+        buffered = buffered.filter(id__in=election_ids)
+    buffered = list(buffered.values_list("id", flat=True))
+
+    held = set()
+    if buffered:
+        drain_ballot_stream()
+        held = elections_with_pending_ballots(buffered)
+
+    return Election.complete_due_voting(election_ids, exclude_ids=held), held
+
+
+@shared_task(bind=True, max_retries=30)
+def complete_election_voting(self, election_id: int):
+    """
+    Transition one election to COMPLETED at its exact voting_end and tally it.
+
+    Fired once by a clocked beat entry from Election.schedule_transitions().
+    A no-op if the election was already completed, cancelled, or rescheduled
+    to a later voting_end. A buffered election with queued ballots is retried until they are ingested
+    (close_expired_elections picks it up if the retries run out).
+    """
+    from .models import Election
+
+    completed, held = _complete_due_voting([election_id])
+    if completed:
+        logger.info(f"Election {election_id} transitioned to COMPLETED, triggering vote tally")
+        Election.unschedule_transitions(completed)
+        tally_election_results.delay(election_id)
+    elif held:
+        logger.info(f"Election {election_id} has queued ballots, holding completion")
+        raise self.retry(countdown=BALLOT_HOLD_RETRY_DELAY)
+
+
+@shared_task
+def close_expired_elections():
+    """
+    Safety-net sweep for election transitions missed by the exact-time tasks.
 
-    voting_count = 0
-    for election in expired_voting:
-        try:
-            election.transition_to_completed()
-            voting_count += 1
-            logger.info(
-                f"Election {election.id} transitioned to COMPLETED, triggering vote tally"
-            )
-
-            # Trigger vote tallying asynchronously
-            tally_election_results.delay(election.id)
-        except ValueError as e:
-            logger.error(
-                f"Failed to transition election {election.id} to COMPLETED: {e}"
-            )
+    Steps:
+    1. One conditional UPDATE moves every NOMINATION election past voting_start
+       → VOTING (voter rolls frozen in the same transaction)
+    2. Queued ballots are drained; one conditional UPDATE moves every VOTING
+       election past voting_end → COMPLETED, except buffered elections that
+       still have queued ballots
+       → Tally fan-out in batches of TALLY_BATCH_SIZE
+
+    Transitions normally happen at the exact time via open_election_voting /
+    complete_election_voting. Runs hourly via Celery Beat.
+    """
+    from .models import Election
+
+    opened = Election.open_due_voting()
+    completed, held = _complete_due_voting()
+
+    if completed:
+        Election.unschedule_transitions(completed)
+        _dispatch_tallies(completed)
 
     logger.info(
-        f"Processed expired elections: {nomination_count} → VOTING, {voting_count} → COMPLETED"
+        f"Processed expired elections: {len(opened)} → VOTING, {len(completed)} → COMPLETED, "
+        f"{len(held)} held for queued ballots"
     )
+
+
+@shared_task
+def ingest_buffered_ballots():
+    """
+    Drain queued ballots for buffered-ingestion elections into Vote rows.
+
+    Ballots are inserted with batched bulk_create and counter increments; see
+    apps.governance.ballots. Runs every few seconds via Celery Beat.
+    """
+    from .ballots import drain_ballot_stream
+
+    processed = drain_ballot_stream()
+    if processed:
+        logger.info(f"Ingested {processed} buffered ballots")
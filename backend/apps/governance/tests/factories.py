@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+import factory
+from django.utils import timezone
+
+from apps.accounts.tests.factories import UserFactory
+from apps.governance.models import Candidacy, Election, ElectionStatus, ElectionType
+
+
+class ElectionFactory(factory.django.DjangoModelFactory):
+    """Parliamentary election in its voting period."""
+
+    class Meta:
+        model = Election
+
+    election_type = ElectionType.PARLIAMENTARY
+    status = ElectionStatus.VOTING
+    nomination_start = factory.LazyFunction(lambda: timezone.now() - timedelta(days=2))
+    nomination_end = factory.LazyFunction(lambda: timezone.now() - timedelta(days=1))
+    voting_start = factory.LazyFunction(lambda: timezone.now() - timedelta(hours=1))
+    voting_end = factory.LazyFunction(lambda: timezone.now() + timedelta(days=1))
+
+
+class CandidacyFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Candidacy
+
+    election = factory.SubFactory(ElectionFactory)
+    candidate = factory.SubFactory(UserFactory)
@@ -0,0 +1,63 @@
+"""
+Query profiles of ElectionViewSet.
+
+list and retrieve must issue a fixed number of queries however many
+elections, candidacies and votes there are.
+"""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.accounts.tests.factories import UserFactory
+from apps.governance.models import VoteCountShard
+
+from .factories import CandidacyFactory, ElectionFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def client():
+    api_client = APIClient()
+    api_client.force_authenticate(UserFactory())
+    return api_client
+
+
+def add_candidacies(election, count):
+    for candidacy in CandidacyFactory.create_batch(count, election=election):
+        VoteCountShard.increment(candidacy, amount=3)
+
+
+def count_queries(client, url):
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(queries)
+
+
+def test_list_query_count_is_constant(client):
+    url = "/api/v1/governance/elections/"
+    add_candidacies(ElectionFactory(), 2)
+    baseline = count_queries(client, url)
+
+    for election in ElectionFactory.create_batch(5):
+        add_candidacies(election, 3)
+
+    assert count_queries(client, url) == baseline
+    assert client.get(url).json()["count"] == 6
+
+
+def test_retrieve_query_count_is_constant(client):
+    election = ElectionFactory()
+    url = f"/api/v1/governance/elections/{election.id}/"
+    add_candidacies(election, 1)
+    baseline = count_queries(client, url)
+
+    add_candidacies(election, 8)
+
+    assert count_queries(client, url) == baseline
+    data = client.get(url).json()
+    assert len(data["candidacies"]) == 9
+    assert data["total_votes"] == 27
@@ -1,5 +1,8 @@
-from django.db.models import Count, Q
+from django.db import IntegrityError, transaction
+from django.db.models import Count, IntegerField, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.shortcuts import get_object_or_404
+from django.utils.http import parse_etags
 from rest_framework import status, viewsets
 from rest_framework.views import APIView
 from rest_framework.decorators import action
@@ -7,9 +10,11 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from common.permissions import IsActiveMember, IsNotDiaspora, IsOnboarded, IsVerifiedMember
+from common.throttling import VoteRateThrottle
 
-from .models import Candidacy, Election, ElectionStatus, Vote
+from .models import Candidacy, Election, ElectionStatus, Vote, VoteCountShard
 from .serializers import (
+    BallotReceiptSerializer,
     CandidacySerializer,
     ElectionCreateSerializer,
     ElectionDetailSerializer,
@@ -18,6 +23,9 @@ from .serializers import (
     VoteSerializer,
 )
 
+# Completed results never change, so clients may cache them for a year
+RESULTS_CACHE_MAX_AGE = 60 * 60 * 24 * 365
+
 
 class ElectionViewSet(viewsets.ModelViewSet):
     """
@@ -36,28 +44,42 @@ class ElectionViewSet(viewsets.ModelViewSet):
     - create: POST /api/v1/governance/elections/
     - nominate: POST /api/v1/governance/elections/{id}/nominate/
     - vote: POST /api/v1/governance/elections/{id}/vote/
+    - ballot-status: GET /api/v1/governance/elections/{id}/ballot-status/?receipt=...
     - results: GET /api/v1/governance/elections/{id}/results/
     """
 
     permission_classes = [IsAuthenticated, IsOnboarded]
 
+    # Actions that only need the election row itself (and its position)
+    MINIMAL_ACTIONS = {
+        "nominate",
+        "vote",
+        "ballot_status",
+        "results",
+        "start_voting",
+        "complete_election",
+        "destroy",
+    }
+
     def get_queryset(self):
         """
-        Return elections with optimizations and optional filtering.
-        Annotates with candidate_count and vote_count for list view.
+        Return elections with an action-specific query profile and optional filtering.
+
+        - list: counts only (candidate_count, vote_count annotations)
+        - retrieve: total_votes annotation + candidacies with vote counts
+        - write actions / results: the election row with its position
         """
-        queryset = Election.objects.select_related(
-            "position__group",
-            "position__precinct",
-            "position__district",
-            "created_by",
-        ).prefetch_related("candidacies", "votes")
+        queryset = self._base_queryset()
 
-        # Annotate counts for list view
-        queryset = queryset.annotate(
-            candidate_count=Count("candidacies", filter=Q(candidacies__is_approved=True)),
-            vote_count=Count("votes"),
-        )
+        if self.action == "list":
+            # vote_count is read from the sharded counters via a subquery so it
+            # doesn't join against candidacies.
+            queryset = queryset.annotate(
+                candidate_count=Count("candidacies", filter=Q(candidacies__is_approved=True)),
+                vote_count=self._vote_total_subquery(),
+            )
+        elif self.action not in self.MINIMAL_ACTIONS:
+            queryset = self._with_candidacies(queryset)
 
         # Filter by status if provided
         status_filter = self.request.query_params.get("status")
@@ -76,6 +98,36 @@ class ElectionViewSet(viewsets.ModelViewSet):
 
         return queryset.order_by("-created_at")
 
+    @staticmethod
+    def _base_queryset():
+        """Return elections joined with their position and its territory/holder."""
+        return Election.objects.select_related(
+            "position__group",
+            "position__precinct",
+            "position__district",
+            "position__holder",
+        )
+
+    @staticmethod
+    def _vote_total_subquery():
+        """Return the election's total votes summed from its counter shards."""
+        vote_total = (
+            VoteCountShard.objects.filter(election=OuterRef("pk"))
+            .values("election")
+            .annotate(total=Sum("count"))
+            .values("total")
+        )
+        return Coalesce(Subquery(vote_total, output_field=IntegerField()), 0)
+
+    def _with_candidacies(self, queryset):
+        """Add total_votes and candidacies annotated with vote counts for detail output."""
+        return queryset.annotate(total_votes=self._vote_total_subquery()).prefetch_related(
+            Prefetch(
+                "candidacies",
+                queryset=Candidacy.objects.with_vote_counts().select_related("candidate"),
+            )
+        )
+
     def get_serializer_class(self):
         """Return different serializers for different actions."""
         if self.action == "list":
@@ -101,29 +153,11 @@ class ElectionViewSet(viewsets.ModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         """
         Get election detail with candidacies.
-        Annotate candidacies with vote_count.
+        Candidacies and total_votes come annotated from get_queryset().
         """
         election = self.get_object()
-
-        # Annotate candidacies with vote counts
-        candidacies = election.candidacies.annotate(vote_count=Count("votes"))
-
-        # Manually set the annotated candidacies on the election
-        election.candidacies_with_counts = candidacies
-
-        # Calculate total votes
-        total_votes = election.votes.count()
-
         serializer = self.get_serializer(election)
-        data = serializer.data
-        data["total_votes"] = total_votes
-
-        # Replace candidacies with annotated version
-        data["candidacies"] = CandidacySerializer(
-            candidacies, many=True, context=self.get_serializer_context()
-        ).data
-
-        return Response(data)
+        return Response(serializer.data)
 
     @action(detail=True, methods=["post"])
     def nominate(self, request, pk=None):
@@ -133,7 +167,7 @@ class ElectionViewSet(viewsets.ModelViewSet):
         Business rules:
         - Election must be in NOMINATION status
         - Current time must be within nomination period
-        - User must be an eligible candidate (checked via position.get_eligible_candidates())
+        - User must be an eligible candidate (checked via election.is_eligible_candidate())
         - User can only nominate once per election (UniqueConstraint enforced)
 
         Request body:
@@ -158,9 +192,8 @@ class ElectionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if user is eligible candidate
-        eligible_candidates = election.get_eligible_candidates()
-        if user not in eligible_candidates:
+        # Check if user is eligible candidate (frozen roll lookup when available)
+        if not election.is_eligible_candidate(user):
             # Provide election-type-specific error messages
             from .models import ElectionType, GovernanceTier
             from apps.accounts.models import User as UserModel
@@ -208,7 +241,7 @@ class ElectionViewSet(viewsets.ModelViewSet):
         serializer = CandidacySerializer(candidacy, context=self.get_serializer_context())
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-    @action(detail=True, methods=["post"])
+    @action(detail=True, methods=["post"], throttle_classes=[VoteRateThrottle])
     def vote(self, request, pk=None):
         """
         Cast vote in an election.
@@ -216,10 +249,13 @@ class ElectionViewSet(viewsets.ModelViewSet):
         Business rules:
         - Election must be in VOTING status
         - Current time must be within voting period
-        - User must be an eligible voter (checked via position.get_eligible_voters())
+        - User must be an eligible voter (checked via election.is_eligible_voter())
         - Candidacy must belong to this election and be approved
         - User can only vote once per election (UniqueConstraint enforced)
 
+        For elections with buffered_ingestion, the ballot is queued and a
+        receipt is returned with 202; see ballot_status.
+
         Request body:
         {
             "candidacy_id": 5
@@ -242,9 +278,8 @@ class ElectionViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # Check if user is eligible voter
-        eligible_voters = election.get_eligible_voters()
-        if user not in eligible_voters:
+        # Check if user is eligible voter (frozen roll lookup when available)
+        if not election.is_eligible_voter(user):
             # Provide election-type-specific error messages
             from .models import ElectionType, GovernanceTier
             from apps.accounts.models import User as UserModel
@@ -286,12 +321,30 @@ class ElectionViewSet(viewsets.ModelViewSet):
             Candidacy, id=candidacy_id, election=election, is_approved=True
         )
 
-        # Cast vote
-        try:
-            vote = Vote.objects.create(
-                election=election, voter=user, candidacy=candidacy
+        # Buffered mode: queue the ballot and return a receipt immediately
+        if election.buffered_ingestion:
+            from .ballots import BallotStatus, enqueue_ballot
+
+            receipt = enqueue_ballot(election, user, candidacy)
+            if receipt is None:
+                return Response(
+                    {"detail": "You have already voted in this election."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            serializer = BallotReceiptSerializer(
+                {"receipt": receipt, "status": BallotStatus.PENDING}
             )
-        except Exception as e:
+            return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+        # Cast vote and bump the sharded counter in the same transaction
+        try:
+            with transaction.atomic():
+                vote = Vote.objects.create(
+                    election=election, voter=user, candidacy=candidacy
+                )
+                VoteCountShard.increment(candidacy)
+        except IntegrityError:
             # UniqueConstraint will raise IntegrityError
             return Response(
                 {"detail": "You have already voted in this election."},
@@ -301,6 +354,36 @@ class ElectionViewSet(viewsets.ModelViewSet):
         serializer = VoteSerializer(vote, context=self.get_serializer_context())
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=True, methods=["get"], url_path="ballot-status")
+    def ballot_status(self, request, pk=None):
+        """
+        Check the status of a buffered ballot.
+
+        GET /api/v1/governance/elections/{id}/ballot-status/?receipt=<receipt>
+
+        Returns pending until the ingestion worker has processed the ballot,
+        then accepted or rejected. Only the voter who cast it can see it.
+        """
+        from .ballots import get_ballot_status
+
+        election = self.get_object()
+        receipt = request.query_params.get("receipt", "")
+        if not receipt:
+            return Response(
+                {"detail": "Query parameter 'receipt' is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        ballot_status = get_ballot_status(election, request.user, receipt)
+        if ballot_status is None:
+            return Response(
+                {"detail": "Ballot receipt not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        serializer = BallotReceiptSerializer({"receipt": receipt, "status": ballot_status})
+        return Response(serializer.data)
+
     @action(detail=True, methods=["get"])
     def results(self, request, pk=None):
         """
@@ -312,36 +395,27 @@ class ElectionViewSet(viewsets.ModelViewSet):
         - results: array of all candidacies with vote counts (sorted by votes descending)
         - total_votes: total number of votes cast
         - total_eligible_voters: count of eligible voters
+
+        Completed, tallied elections are served from the immutable snapshot
+        stored by tally_election_results, with a strong ETag (If-None-Match
+        → 304) and a long Cache-Control lifetime.
         """
         election = self.get_object()
 
-        # Annotate candidacies with vote counts and order by vote count
-        candidacies = (
-            election.candidacies.filter(is_approved=True)
-            .annotate(vote_count=Count("votes"))
-            .order_by("-vote_count")
-        )
-
-        # Get winner (first in ordered list)
-        winner = candidacies.first() if candidacies.exists() else None
-
-        # Calculate total votes
-        total_votes = election.votes.count()
-
-        # Calculate total eligible voters
-        total_eligible_voters = election.get_eligible_voters().count()
-
-        # Prepare results data
-        results_data = {
-            "election_id": election.id,
-            "status": election.status,
-            "winner": winner,
-            "results": candidacies,
-            "total_votes": total_votes,
-            "total_eligible_voters": total_eligible_voters,
-        }
+        if election.has_results_snapshot:
+            etag = f'"{election.results_etag}"'
+            headers = {
+                "ETag": etag,
+                "Cache-Control": f"private, max-age={RESULTS_CACHE_MAX_AGE}, immutable",
+            }
+            if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+            if etag in if_none_match or "*" in if_none_match:
+                return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+            return Response(election.results_snapshot, headers=headers)
 
-        serializer = ElectionResultsSerializer(results_data, context=self.get_serializer_context())
+        serializer = ElectionResultsSerializer(
+            election.get_results_data(), context=self.get_serializer_context()
+        )
         return Response(serializer.data)
 
     @action(detail=True, methods=["post"])
@@ -365,7 +439,7 @@ class ElectionViewSet(viewsets.ModelViewSet):
                 {"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        serializer = self.get_serializer(election)
+        serializer = self.get_serializer(self._refetch_detail(election))
         return Response(serializer.data)
 
     @action(detail=True, methods=["post"])
@@ -395,9 +469,13 @@ class ElectionViewSet(viewsets.ModelViewSet):
                 {"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST
             )
 
-        serializer = self.get_serializer(election)
+        serializer = self.get_serializer(self._refetch_detail(election))
         return Response(serializer.data)
 
+    def _refetch_detail(self, election):
+        """Reload an election with the detail profile after a state change."""
+        return self._with_candidacies(self._base_queryset()).get(pk=election.pk)
+
 
 class LeaderPositionViewSet(viewsets.ReadOnlyModelViewSet):
     """
@@ -487,46 +565,24 @@ class HierarchyTreeView(APIView):
     - precinct_id: Filter to specific precinct (shows 50→10)
     - max_depth: Maximum tree depth (1-4, default=4)
 
-    Returns nested tree structure.
+    Returns nested tree structure. Trees are built in memory from a single
+    query and cached per (scope, max_depth); see apps.governance.hierarchy.
     """
 
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        from .models import GovernanceTier, LeaderPosition
-        from .serializers import HierarchyNodeSerializer
+        from .hierarchy import get_hierarchy_tree
 
         district_id = request.query_params.get("district_id")
         precinct_id = request.query_params.get("precinct_id")
 
-        # Determine starting tier based on filters
-        if precinct_id:
-            # Precinct level: start from tier=50
-            queryset = LeaderPosition.objects.filter(
-                tier=GovernanceTier.FIFTY,
-                precinct_id=precinct_id,
-                is_active=True,
-            )
-            start_tier = "50 (Precinct)"
-        elif district_id:
-            # District level: start from tier=100
-            queryset = LeaderPosition.objects.filter(
-                tier=GovernanceTier.HUNDRED,
-                district_id=district_id,
-                is_active=True,
-            )
-            start_tier = "100 (District)"
-        else:
-            # Party-wide: start from tier=1000
-            queryset = LeaderPosition.objects.filter(
-                tier=GovernanceTier.THOUSAND, is_active=True
-            )
-            start_tier = "1000 (Council)"
-
-        # Optimize query
-        queryset = queryset.select_related(
-            "holder", "district", "precinct", "group", "parent"
-        )
+        for name, value in (("district_id", district_id), ("precinct_id", precinct_id)):
+            if value is not None and not value.isdigit():
+                return Response(
+                    {"detail": f"{name} must be an integer."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
         # Get max depth
         max_depth_param = request.query_params.get("max_depth", "4")
@@ -536,24 +592,19 @@ class HierarchyTreeView(APIView):
         except ValueError:
             max_depth = 4
 
-        # Serialize with recursive children
-        context = {
-            "include_children": True,
-            "max_depth": max_depth,
-            "current_depth": 0,
-        }
-
-        serializer = HierarchyNodeSerializer(queryset, many=True, context=context)
+        hierarchy, start_tier = get_hierarchy_tree(
+            district_id=district_id, precinct_id=precinct_id, max_depth=max_depth
+        )
 
         return Response(
             {
                 "start_tier": start_tier,
-                "hierarchy": serializer.data,
+                "hierarchy": hierarchy,
                 "filters": {
                     "district_id": district_id,
                     "precinct_id": precinct_id,
                     "max_depth": max_depth,
                 },
-                "total_positions": queryset.count(),
+                "total_positions": len(hierarchy),
             }
         )
@@ -6,6 +6,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from common.permissions import IsLeaderAtTier, IsVerifiedMember
+from common.throttling import SignRateThrottle
 
 from .models import Initiative, InitiativeSignature
 from .serializers import (
@@ -65,7 +66,7 @@ class InitiativeViewSet(viewsets.ModelViewSet):
     def perform_create(self, serializer):
         serializer.save(author=self.request.user)
 
-    @action(detail=True, methods=["post"])
+    @action(detail=True, methods=["post"], throttle_classes=[SignRateThrottle])
     def sign(self, request, pk=None):
         """
         Sign the initiative. One signature per user per initiative.
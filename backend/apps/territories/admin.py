@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import District, Precinct, Region
+from .models import District, Precinct, PrecinctBoundary, Region
 
 
 @admin.register(Region)
@@ -22,3 +22,11 @@ class PrecinctAdmin(admin.ModelAdmin):
     search_fields = ("name", "name_ka", "cec_code")
     list_filter = ("district__region", "district")
     raw_id_fields = ("district",)
+
+
+@admin.register(PrecinctBoundary)
+class PrecinctBoundaryAdmin(admin.ModelAdmin):
+    list_display = ("precinct", "source", "imported_at")
+    search_fields = ("precinct__name", "precinct__name_ka", "precinct__cec_code")
+    readonly_fields = ("min_lat", "min_lng", "max_lat", "max_lng", "imported_at")
+    raw_id_fields = ("precinct",)
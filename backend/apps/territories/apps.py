@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class TerritoriesConfig(AppConfig):
     name = "apps.territories"
     verbose_name = "Territories"
+
+    def ready(self):
+        """Import signals when app is ready."""
+        import apps.territories.signals  # noqa: F401
@@ -0,0 +1,116 @@
+"""
+Versioned territory bundle for mobile clients.
+
+The whole region → district → precinct tree is served as one gzip-compressed
+JSON document, laid out as column lists to stay small:
+
+    {
+        "version": "<content hash>",
+        "regions":   {"fields": [...], "rows": [[...], ...]},
+        "districts": {"fields": [...], "rows": [[...], ...]},
+        "precincts": {"fields": [...], "rows": [[...], ...]}
+    }
+
+The version is a hash of the content, so it only changes when territory data
+actually changes and clients can revalidate with If-None-Match.
+
+The compressed bundle is prebuilt into the shared cache by the
+build_territory_bundle command (run after territory imports). It is tagged
+with the territory version (apps.territories.cache). A stale or missing
+bundle is rebuilt on the next request, and each process keeps a local copy.
+"""
+
+import gzip
+import hashlib
+import json
+
+from django.core.cache import cache
+
+from .cache import VersionedStructure, get_territory_version
+from .models import District, Precinct, Region
+
+TERRITORY_BUNDLE_CACHE_KEY = "territories:bundle"
+
+REGION_FIELDS = ["id", "name", "name_ka", "code"]
+DISTRICT_FIELDS = ["id", "region_id", "name", "name_ka", "cec_code"]
+PRECINCT_FIELDS = ["id", "district_id", "name", "name_ka", "cec_code", "latitude", "longitude"]
+
+
+class TerritoryBundle:
+    """A built bundle: content version and gzip-compressed JSON body."""
+
+    def __init__(self, version, body):
+        self.version = version
+        self.body = body
+
+    @property
+    def etag(self):
+        return f'"{self.version}"'
+
+    @property
+    def gzip_etag(self):
+        """ETag of the gzip-encoded representation."""
+        return f'"{self.version}-gz"'
+
+
+def _coordinate(value):
+    return float(value) if value is not None else None
+
+
+def build_bundle_payload():
+    """Return the bundle document (without compression)."""
+    regions = [
+        list(row) for row in Region.objects.order_by("id").values_list(*REGION_FIELDS)
+    ]
+    districts = [
+        list(row) for row in District.objects.order_by("id").values_list(*DISTRICT_FIELDS)
+    ]
+    precincts = [
+        [*row[:5], _coordinate(row[5]), _coordinate(row[6])]
+        for row in Precinct.objects.order_by("id").values_list(*PRECINCT_FIELDS)
+    ]
+    content = {
+        "regions": {"fields": REGION_FIELDS, "rows": regions},
+        "districts": {"fields": DISTRICT_FIELDS, "rows": districts},
+        "precincts": {"fields": PRECINCT_FIELDS, "rows": precincts},
+    }
+    digest = hashlib.sha256(
+        json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+    ).hexdigest()
+    return {"version": digest[:16], **content}
+
+
+def build_territory_bundle():
+    """
+    Build the bundle and store it in the shared cache for the current territory version.
+
+    Returns:
+        TerritoryBundle
+    """
+    territory_version = get_territory_version()
+    payload = build_bundle_payload()
+    body = gzip.compress(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode(), mtime=0
+    )
+    cache.set(
+        TERRITORY_BUNDLE_CACHE_KEY,
+        {"territory_version": territory_version, "version": payload["version"], "body": body},
+        timeout=None,
+    )
+    return TerritoryBundle(payload["version"], body)
+
+
+def _load_bundle():
+    """Return the prebuilt bundle if it matches the territory version, else build it."""
+    stored = cache.get(TERRITORY_BUNDLE_CACHE_KEY)
+    if stored and stored["territory_version"] == get_territory_version():
+        return TerritoryBundle(stored["version"], stored["body"])
+    return build_territory_bundle()
+
+
+_bundle = VersionedStructure(_load_bundle)
+
+
+def get_territory_bundle():
+    """Return the current territory bundle (process-local, shared-cache backed)."""
+    return _bundle.get()
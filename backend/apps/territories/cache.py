@@ -0,0 +1,50 @@
+"""
+Territory data version.
+
+Territory tables change a few times a year (imports, coordinate fixes), so
+derived structures are built once and kept in process memory. They are
+tagged with the shared territory version, which signals bump whenever a
+Region, District or Precinct is saved or deleted. Every process compares its
+copy against the version in the shared cache and rebuilds lazily on mismatch.
+"""
+
+import threading
+import time
+
+from django.core.cache import cache
+
+TERRITORY_VERSION_KEY = "territories:version"
+
+
+def invalidate_territory_data():
+    """Mark every process-local territory structure as stale."""
+    cache.set(TERRITORY_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def get_territory_version():
+    """Return the current territory version, initializing it if missing."""
+    version = cache.get(TERRITORY_VERSION_KEY)
+    if version is None:
+        version = time.time_ns()
+        cache.add(TERRITORY_VERSION_KEY, version, timeout=None)
+        version = cache.get(TERRITORY_VERSION_KEY, version)
+    return version
+
+
+class VersionedStructure:
+    """Process-local value rebuilt by `builder` whenever the territory version changes."""
+
+    def __init__(self, builder):
+        self.builder = builder
+        self._lock = threading.Lock()
+        self._version = None
+        self._value = None
+
+    def get(self):
+        version = get_territory_version()
+        if self._version != version:
+            with self._lock:
+                if self._version != version:
+                    self._value = self.builder()
+                    self._version = version
+        return self._value
@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from apps.territories.bundle import build_territory_bundle
+
+
+class Command(BaseCommand):
+    """
+    Prebuild the compressed territory bundle served to mobile clients.
+
+    Run after importing or editing territories so the first client request
+    doesn't pay for the build.
+
+    Usage:
+        python manage.py build_territory_bundle
+    """
+
+    help = "Build the versioned territory bundle and store it in the shared cache."
+
+    def handle(self, *args, **options):
+        bundle = build_territory_bundle()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Built territory bundle {bundle.version} ({len(bundle.body) / 1024:.1f} KiB gzipped)."
+            )
+        )
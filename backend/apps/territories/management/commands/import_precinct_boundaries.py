@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.territories.cache import invalidate_territory_data
+from apps.territories.models import Precinct, PrecinctBoundary
+
+
+class Command(BaseCommand):
+    """
+    Import CEC precinct boundary polygons from a GeoJSON FeatureCollection.
+
+    Each feature must carry the precinct's CEC code in its properties and a
+    Polygon or MultiPolygon geometry with [longitude, latitude] coordinates.
+    Existing boundaries are replaced.
+
+    Usage:
+        python manage.py import_precinct_boundaries boundaries.geojson
+        python manage.py import_precinct_boundaries boundaries.geojson --code-property PRECINCT_CODE
+    """
+
+    help = "Import precinct boundary polygons (GeoJSON) keyed by CEC code."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="GeoJSON FeatureCollection file")
+        parser.add_argument(
+            "--code-property",
+            default="cec_code",
+            help="Feature property holding the precinct CEC code (default: cec_code)",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        try:
+            features = json.loads(path.read_text(encoding="utf-8"))["features"]
+        except (OSError, ValueError, KeyError) as exc:
+            raise CommandError(f"Cannot read GeoJSON features from {path}: {exc}")
+
+        precinct_ids = dict(Precinct.objects.values_list("cec_code", "id"))
+        code_property = options["code_property"]
+
+        boundaries = []
+        skipped = 0
+        for feature in features:
+            code = str((feature.get("properties") or {}).get(code_property, ""))
+            precinct_id = precinct_ids.get(code)
+            if precinct_id is None:
+                self.stdout.write(self.style.WARNING(f"  [SKIP] Unknown precinct code: {code!r}"))
+                skipped += 1
+                continue
+            try:
+                boundaries.append(
+                    PrecinctBoundary.from_geojson(
+                        precinct_id, feature.get("geometry") or {}, source=path.name
+                    )
+                )
+            except (ValueError, KeyError, IndexError, TypeError) as exc:
+                self.stdout.write(self.style.WARNING(f"  [SKIP] Precinct {code}: {exc}"))
+                skipped += 1
+
+        with transaction.atomic():
+            PrecinctBoundary.objects.bulk_create(
+                boundaries,
+                batch_size=200,
+                update_conflicts=True,
+                unique_fields=["precinct"],
+                update_fields=[
+                    "polygons",
+                    "min_lat",
+                    "min_lng",
+                    "max_lat",
+                    "max_lng",
+                    "source",
+                    "imported_at",
+                ],
+            )
+        # bulk_create skips post_save
+        invalidate_territory_data()
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Imported {len(boundaries)} precinct boundaries ({skipped} skipped).")
+        )
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.2 on 2026-10-18 08:43
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('territories', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PrecinctBoundary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('polygons', models.JSONField(help_text='GeoJSON MultiPolygon coordinates')),
+                ('min_lat', models.FloatField()),
+                ('min_lng', models.FloatField()),
+                ('max_lat', models.FloatField()),
+                ('max_lng', models.FloatField()),
+                ('source', models.CharField(blank=True, max_length=200)),
+                ('imported_at', models.DateTimeField(auto_now=True)),
+                ('precinct', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='boundary', to='territories.precinct')),
+            ],
+            options={
+                'verbose_name': 'Precinct Boundary',
+                'verbose_name_plural': 'Precinct Boundaries',
+            },
+        ),
+    ]
@@ -53,3 +53,60 @@ class Precinct(models.Model):
 
     def __str__(self):
         return self.name
+
+
+class PrecinctBoundary(models.Model):
+    """
+    CEC boundary of a precinct.
+
+    polygons holds GeoJSON MultiPolygon coordinates: a list of polygons, each
+    a list of rings (outer ring first, then holes) of [longitude, latitude]
+    pairs. The bounding box is stored alongside for candidate filtering.
+    """
+
+    precinct = models.OneToOneField(
+        Precinct, on_delete=models.CASCADE, related_name="boundary"
+    )
+    polygons = models.JSONField(help_text="GeoJSON MultiPolygon coordinates")
+    min_lat = models.FloatField()
+    min_lng = models.FloatField()
+    max_lat = models.FloatField()
+    max_lng = models.FloatField()
+    source = models.CharField(max_length=200, blank=True)
+    imported_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Precinct Boundary"
+        verbose_name_plural = "Precinct Boundaries"
+
+    def __str__(self):
+        return f"Boundary of {self.precinct}"
+
+    @classmethod
+    def from_geojson(cls, precinct_id, geometry, source=""):
+        """
+        Build an unsaved boundary from a GeoJSON Polygon or MultiPolygon geometry.
+
+        Raises:
+            ValueError: If the geometry type is unsupported or it has no coordinates
+        """
+        if geometry.get("type") == "Polygon":
+            polygons = [geometry["coordinates"]]
+        elif geometry.get("type") == "MultiPolygon":
+            polygons = geometry["coordinates"]
+        else:
+            raise ValueError(f"Unsupported geometry type: {geometry.get('type')}")
+
+        points = [point for polygon in polygons for ring in polygon for point in ring]
+        if not points:
+            raise ValueError("Geometry has no coordinates.")
+
+        return cls(
+            precinct_id=precinct_id,
+            polygons=polygons,
+            min_lat=min(point[1] for point in points),
+            min_lng=min(point[0] for point in points),
+            max_lat=max(point[1] for point in points),
+            max_lng=max(point[0] for point in points),
+            source=source,
+        )
@@ -0,0 +1,247 @@
+"""
+In-memory bilingual territory search.
+
+All regions, districts and precincts are indexed in process memory under a
+normalized Latin "search key", so Georgian input (ვაკე), formal Latin
+transliteration (Vake) and informal chat-style Latin (e.g. "x" for ხ,
+"w" for წ, "q" for ქ) match the same entries.
+
+Lookups combine:
+
+- token prefixes: sorted (token, entry) pairs searched with bisect
+- CEC code prefixes
+- trigram similarity as a fuzzy fallback for typos and infixes
+
+Ranking: exact name > name prefix > every query token prefixes a name token >
+trigram similarity; ties go to the higher level (region, district, precinct)
+and then to the shorter name.
+
+The index is rebuilt lazily per process when the territory version changes
+(apps.territories.cache).
+"""
+
+import re
+from bisect import bisect_left
+from collections import defaultdict
+
+from .cache import VersionedStructure
+
+# National system of romanization (2002)
+GEORGIAN_TO_LATIN = {
+    "ა": "a",
+    "ბ": "b",
+    "გ": "g",
+    "დ": "d",
+    "ე": "e",
+    "ვ": "v",
+    "ზ": "z",
+    "თ": "t",
+    "ი": "i",
+    "კ": "k",
+    "ლ": "l",
+    "მ": "m",
+    "ნ": "n",
+    "ო": "o",
+    "პ": "p",
+    "ჟ": "zh",
+    "რ": "r",
+    "ს": "s",
+    "ტ": "t",
+    "უ": "u",
+    "ფ": "p",
+    "ქ": "k",
+    "ღ": "gh",
+    "ყ": "q",
+    "შ": "sh",
+    "ჩ": "ch",
+    "ც": "ts",
+    "ძ": "dz",
+    "წ": "ts",
+    "ჭ": "ch",
+    "ხ": "kh",
+    "ჯ": "j",
+    "ჰ": "h",
+}
+
+# Spelling variants folded together in search keys (informal Latin Georgian
+# and apostrophes marking ejectives)
+LATIN_VARIANTS = {"ch": "ch", "c": "ts", "x": "kh", "w": "ts", "q": "k", "y": "k", "'": "", "`": ""}
+LATIN_VARIANTS_PATTERN = re.compile(r"ch|[cxwqy'`]")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+LEVELS = ("region", "district", "precinct")
+
+# Minimum trigram similarity for fuzzy hits
+MIN_TRIGRAM_SIMILARITY = 0.3
+
+# Rank scores
+SCORE_EXACT = 100
+SCORE_PREFIX = 80
+SCORE_TOKEN_PREFIX = 60
+SCORE_CODE_PREFIX = 70
+SCORE_TRIGRAM = 50
+
+
+def normalize(text):
+    """Return the search key of a Georgian or Latin text."""
+    latin = "".join(GEORGIAN_TO_LATIN.get(char, char) for char in text.lower())
+    latin = LATIN_VARIANTS_PATTERN.sub(lambda match: LATIN_VARIANTS[match.group()], latin)
+    return " ".join(TOKEN_PATTERN.findall(latin))
+
+
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[index : index + 3] for index in range(len(padded) - 2)}
+
+
+def _entry(level, pk, name, name_ka, code, region_id=None, district_id=None):
+    return {
+        "type": level,
+        "id": pk,
+        "name": name,
+        "name_ka": name_ka,
+        "code": code,
+        "region_id": region_id,
+        "district_id": district_id,
+    }
+
+
+class TerritorySearchIndex:
+    """Prefix, code and trigram index over all territories."""
+
+    def __init__(self, entries):
+        """
+        Args:
+            entries: dicts with "type", "id", "name", "name_ka", "code",
+                     "region_id" and "district_id"
+        """
+        self.entries = list(entries)
+        self.keys = []
+        self.trigram_counts = []
+        self.trigrams = defaultdict(list)
+        tokens = set()
+        codes = []
+        for index, entry in enumerate(self.entries):
+            keys = {normalize(entry["name"]), normalize(entry["name_ka"])} - {""}
+            self.keys.append(keys)
+            codes.append((entry["code"].lower(), index))
+
+            entry_trigrams = set()
+            for key in keys:
+                tokens.update((token, index) for token in key.split())
+                entry_trigrams |= _trigrams(key)
+            self.trigram_counts.append(len(entry_trigrams))
+            for trigram in entry_trigrams:
+                self.trigrams[trigram].append(index)
+
+        self.tokens = sorted(tokens)
+        self.codes = sorted(codes)
+
+    @classmethod
+    def build(cls):
+        """Build the index from all regions, districts and precincts."""
+        from .models import District, Precinct, Region
+
+        entries = [
+            _entry("region", pk, name, name_ka, code, region_id=pk)
+            for pk, name, name_ka, code in Region.objects.values_list(
+                "id", "name", "name_ka", "code"
+            )
+        ]
+        entries += [
+            _entry("district", pk, name, name_ka, code, region_id=region_id, district_id=pk)
+            for pk, name, name_ka, code, region_id in District.objects.values_list(
+                "id", "name", "name_ka", "cec_code", "region_id"
+            )
+        ]
+        entries += [
+            _entry("precinct", pk, name, name_ka, code, region_id=region_id, district_id=district_id)
+            for pk, name, name_ka, code, district_id, region_id in Precinct.objects.values_list(
+                "id", "name", "name_ka", "cec_code", "district_id", "district__region_id"
+            )
+        ]
+        return cls(entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _prefixed(self, sorted_pairs, prefix):
+        """Entry indices whose key in sorted (key, index) pairs starts with prefix."""
+        matches = set()
+        position = bisect_left(sorted_pairs, (prefix, -1))
+        while position < len(sorted_pairs) and sorted_pairs[position][0].startswith(prefix):
+            matches.add(sorted_pairs[position][1])
+            position += 1
+        return matches
+
+    def search(self, query, limit=20, levels=LEVELS):
+        """
+        Return ranked territory hits for a query.
+
+        Returns:
+            list[dict]: Entries with an added "score", best first
+        """
+        key = normalize(query)
+        code = query.strip().lower()
+        scores = {}
+
+        def consider(index, score):
+            if self.entries[index]["type"] in levels and score > scores.get(index, 0):
+                scores[index] = score
+
+        query_tokens = key.split()
+        if query_tokens:
+            candidates = self._prefixed(self.tokens, query_tokens[0])
+            for token in query_tokens[1:]:
+                candidates &= self._prefixed(self.tokens, token)
+            for index in candidates:
+                keys = self.keys[index]
+                if key in keys:
+                    consider(index, SCORE_EXACT)
+                elif any(entry_key.startswith(key) for entry_key in keys):
+                    consider(index, SCORE_PREFIX)
+                else:
+                    consider(index, SCORE_TOKEN_PREFIX)
+
+        if code and code[0].isdigit():
+            for index in self._prefixed(self.codes, code):
+                exact = self.entries[index]["code"].lower() == code
+                consider(index, SCORE_EXACT if exact else SCORE_CODE_PREFIX)
+
+        # Fuzzy fallback when prefixes don't fill the page
+        if len(scores) < limit and len(key) >= 3:
+            query_trigrams = _trigrams(key)
+            shared = defaultdict(int)
+            for trigram in query_trigrams:
+                for index in self.trigrams.get(trigram, ()):
+                    shared[index] += 1
+            for index, count in shared.items():
+                if index in scores:
+                    continue
+                similarity = count / (len(query_trigrams) + self.trigram_counts[index] - count)
+                if similarity >= MIN_TRIGRAM_SIMILARITY:
+                    consider(index, SCORE_TRIGRAM * similarity)
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (
+                -item[1],
+                LEVELS.index(self.entries[item[0]]["type"]),
+                len(self.entries[item[0]]["name"]),
+            ),
+        )
+        return [{**self.entries[index], "score": round(score, 1)} for index, score in ranked[:limit]]
+
+
+_search_index = VersionedStructure(TerritorySearchIndex.build)
+
+
+def get_search_index():
+    """Return the process-local search index, rebuilding it if territories changed."""
+    return _search_index.get()
+
+
+def search_territories(query, limit=20, levels=LEVELS):
+    """Search regions, districts and precincts by name (Georgian or Latin) or CEC code."""
+    return get_search_index().search(query, limit=limit, levels=levels)
@@ -48,3 +48,16 @@ class PrecinctWithDistanceSerializer(PrecinctSerializer):
 
     class Meta(PrecinctSerializer.Meta):
         fields = PrecinctSerializer.Meta.fields + ["distance"]
+
+
+class TerritorySearchResultSerializer(serializers.Serializer):
+    """One hit of the unified territory search."""
+
+    type = serializers.ChoiceField(choices=["region", "district", "precinct"])
+    id = serializers.IntegerField()
+    name = serializers.CharField()
+    name_ka = serializers.CharField()
+    code = serializers.CharField()
+    region_id = serializers.IntegerField(allow_null=True)
+    district_id = serializers.IntegerField(allow_null=True)
+    score = serializers.FloatField()
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_territory_data
+from .models import District, Precinct, PrecinctBoundary, Region
+
+
+@receiver(post_save, sender=Region)
+@receiver(post_save, sender=District)
+@receiver(post_save, sender=Precinct)
+@receiver(post_save, sender=PrecinctBoundary)
+@receiver(post_delete, sender=Region)
+@receiver(post_delete, sender=District)
+@receiver(post_delete, sender=Precinct)
+@receiver(post_delete, sender=PrecinctBoundary)
+def invalidate_territory_data_on_change(sender, **kwargs):
+    """Rebuild in-memory territory indexes after any territory change."""
+    invalidate_territory_data()
@@ -0,0 +1,224 @@
+"""
+In-memory spatial index over geocoded precinct centroids.
+
+Precinct coordinates are bucketed into a fixed lat/lng grid. A radius query
+only visits the grid cells overlapping the query's bounding box, drops
+points outside the box, and computes haversine distances for the remaining
+candidates, so a query touches a few dozen of the ~3,800 precincts instead
+of all of them.
+
+Precinct boundaries (PrecinctBoundary) get a second grid over their bounding
+boxes: a point lookup reads one fine-grained cell, keeps the boundaries whose
+box contains the point, and only runs the exact ray-casting test on those.
+
+Both indexes are rebuilt lazily per process when the territory version
+changes (apps.territories.cache).
+"""
+
+import math
+from array import array
+from collections import defaultdict
+
+from .cache import VersionedStructure
+
+EARTH_RADIUS_KM = 6371
+
+# Kilometers per degree of latitude
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+# Grid cell size in degrees (~28 km north-south)
+GRID_CELL_DEGREES = 0.25
+
+# Boundary grid cell size in degrees (~2 km; urban precincts are small)
+BOUNDARY_CELL_DEGREES = 0.02
+
+
+def haversine_distance(lat1, lon1, lat2, lon2):
+    """
+    Calculate distance in kilometers between two lat/lon points using the Haversine formula.
+
+    Args:
+        lat1, lon1: Coordinates of first point
+        lat2, lon2: Coordinates of second point
+
+    Returns:
+        Distance in kilometers
+    """
+    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    c = 2 * math.asin(math.sqrt(a))
+
+    return EARTH_RADIUS_KM * c
+
+
+def _cell(lat, lng, size=GRID_CELL_DEGREES):
+    return (math.floor(lat / size), math.floor(lng / size))
+
+
+class PrecinctSpatialIndex:
+    """Grid-bucketed precinct centroids."""
+
+    def __init__(self, points):
+        """
+        Args:
+            points: (precinct_id, latitude, longitude) tuples
+        """
+        self.ids = array("q")
+        self.lats = array("d")
+        self.lngs = array("d")
+        self.cells = defaultdict(list)
+        for precinct_id, lat, lng in points:
+            self.cells[_cell(lat, lng)].append(len(self.ids))
+            self.ids.append(precinct_id)
+            self.lats.append(lat)
+            self.lngs.append(lng)
+
+    @classmethod
+    def build(cls):
+        """Build the index from all geocoded precincts."""
+        from .models import Precinct
+
+        return cls(
+            (precinct_id, float(lat), float(lng))
+            for precinct_id, lat, lng in Precinct.objects.filter(
+                latitude__isnull=False, longitude__isnull=False
+            ).values_list("id", "latitude", "longitude")
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def nearby(self, lat, lng, radius):
+        """
+        Return precincts within radius km of a point.
+
+        Returns:
+            list[tuple]: (precinct_id, distance_km) ordered by distance
+        """
+        dlat = radius / KM_PER_DEGREE
+        # Longitude degrees shrink with latitude; near the poles scan all
+        cos_lat = math.cos(math.radians(lat))
+        dlng = 180.0 if cos_lat < 1e-6 else min(180.0, radius / (KM_PER_DEGREE * cos_lat))
+
+        min_lat, max_lat = lat - dlat, lat + dlat
+        min_lng, max_lng = lng - dlng, lng + dlng
+        (min_row, min_col), (max_row, max_col) = _cell(min_lat, min_lng), _cell(max_lat, max_lng)
+
+        results = []
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                for index in self.cells.get((row, col), ()):
+                    point_lat, point_lng = self.lats[index], self.lngs[index]
+                    if not (min_lat <= point_lat <= max_lat and min_lng <= point_lng <= max_lng):
+                        continue
+                    distance = haversine_distance(lat, lng, point_lat, point_lng)
+                    if distance <= radius:
+                        results.append((self.ids[index], distance))
+
+        results.sort(key=lambda result: result[1])
+        return results
+
+
+def point_in_ring(lat, lng, ring):
+    """
+    Ray-casting test of a point against one ring.
+
+    Args:
+        ring: Flat array of lng, lat, lng, lat, ... values
+    """
+    inside = False
+    count = len(ring) // 2
+    previous_lng, previous_lat = ring[2 * count - 2], ring[2 * count - 1]
+    for index in range(count):
+        current_lng, current_lat = ring[2 * index], ring[2 * index + 1]
+        if (current_lat > lat) != (previous_lat > lat):
+            crossing_lng = current_lng + (lat - current_lat) * (previous_lng - current_lng) / (
+                previous_lat - current_lat
+            )
+            if lng < crossing_lng:
+                inside = not inside
+        previous_lng, previous_lat = current_lng, current_lat
+    return inside
+
+
+def point_in_polygons(lat, lng, polygons):
+    """Check a point against polygons given as lists of flat rings (outer ring first, then holes)."""
+    for rings in polygons:
+        if rings and point_in_ring(lat, lng, rings[0]) and not any(
+            point_in_ring(lat, lng, hole) for hole in rings[1:]
+        ):
+            return True
+    return False
+
+
+class BoundaryIndex:
+    """Grid over precinct boundary bounding boxes."""
+
+    def __init__(self, boundaries):
+        """
+        Args:
+            boundaries: (precinct_id, polygons, min_lat, min_lng, max_lat, max_lng)
+                        tuples, polygons as GeoJSON MultiPolygon coordinates
+        """
+        self.entries = []
+        self.cells = defaultdict(list)
+        for precinct_id, polygons, min_lat, min_lng, max_lat, max_lng in boundaries:
+            # Rings as flat float arrays: a fraction of the memory of nested lists
+            flat = [
+                [array("d", (value for point in ring for value in point[:2])) for ring in polygon]
+                for polygon in polygons
+            ]
+            index = len(self.entries)
+            self.entries.append((precinct_id, (min_lat, min_lng, max_lat, max_lng), flat))
+
+            min_row, min_col = _cell(min_lat, min_lng, BOUNDARY_CELL_DEGREES)
+            max_row, max_col = _cell(max_lat, max_lng, BOUNDARY_CELL_DEGREES)
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    self.cells[(row, col)].append(index)
+
+    @classmethod
+    def build(cls):
+        """Build the index from all imported precinct boundaries."""
+        from .models import PrecinctBoundary
+
+        return cls(
+            PrecinctBoundary.objects.values_list(
+                "precinct_id", "polygons", "min_lat", "min_lng", "max_lat", "max_lng"
+            ).iterator(chunk_size=500)
+        )
+
+    def __len__(self):
+        return len(self.entries)
+
+    def locate(self, lat, lng):
+        """Return the id of the precinct whose boundary contains the point, or None."""
+        for index in self.cells.get(_cell(lat, lng, BOUNDARY_CELL_DEGREES), ()):
+            precinct_id, (min_lat, min_lng, max_lat, max_lng), polygons = self.entries[index]
+            if not (min_lat <= lat <= max_lat and min_lng <= lng <= max_lng):
+                continue
+            if point_in_polygons(lat, lng, polygons):
+                return precinct_id
+        return None
+
+
+_precinct_index = VersionedStructure(PrecinctSpatialIndex.build)
+_boundary_index = VersionedStructure(BoundaryIndex.build)
+
+
+def get_precinct_index():
+    """Return the process-local precinct index, rebuilding it if territories changed."""
+    return _precinct_index.get()
+
+
+def get_boundary_index():
+    """Return the process-local boundary index, rebuilding it if territories changed."""
+    return _boundary_index.get()
+
+
+def locate_precinct(lat, lng):
+    """Return the id of the precinct containing a point, or None if no boundary does."""
+    return get_boundary_index().locate(lat, lng)
@@ -0,0 +1,36 @@
+from decimal import Decimal
+
+import factory
+
+from apps.territories.models import District, Precinct, Region
+
+
+class RegionFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Region
+
+    name = factory.Sequence(lambda n: f"Region {n}")
+    name_ka = factory.Sequence(lambda n: f"რეგიონი {n}")
+    code = factory.Sequence(lambda n: f"{n:02d}")
+
+
+class DistrictFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = District
+
+    region = factory.SubFactory(RegionFactory)
+    name = factory.Sequence(lambda n: f"District {n}")
+    name_ka = factory.Sequence(lambda n: f"ოლქი {n}")
+    cec_code = factory.Sequence(lambda n: f"{n:02d}.{n:02d}")
+
+
+class PrecinctFactory(factory.django.DjangoModelFactory):
+    class Meta:
+        model = Precinct
+
+    district = factory.SubFactory(DistrictFactory)
+    name = factory.Sequence(lambda n: f"Precinct {n}")
+    name_ka = factory.Sequence(lambda n: f"უბანი {n}")
+    cec_code = factory.Sequence(lambda n: f"{n:02d}.{n:02d}.{n:03d}")
+    latitude = Decimal("41.7151")
+    longitude = Decimal("44.8271")
@@ -5,6 +5,10 @@ from . import views
 app_name = "territories"
 
 urlpatterns = [
+    # Full tree for offline clients
+    path("bundle/", views.TerritoryBundleView.as_view(), name="territory-bundle"),
+    # Unified bilingual search
+    path("search/", views.TerritorySearchView.as_view(), name="territory-search"),
     # Regions
     path("regions/", views.RegionListView.as_view(), name="region-list"),
     path(
@@ -25,4 +29,5 @@ urlpatterns = [
         name="precinct-detail",
     ),
     path("precincts/nearby/", views.NearbyPrecinctsView.as_view(), name="precinct-nearby"),
+    path("precincts/locate/", views.PrecinctLocateView.as_view(), name="precinct-locate"),
 ]
@@ -1,5 +1,8 @@
-import math
+import gzip
 
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
 from rest_framework import filters, generics, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -7,36 +10,17 @@ from rest_framework.views import APIView
 
 from common.pagination import StandardPagination
 
+from .bundle import get_territory_bundle
 from .models import District, Precinct, Region
+from .search import LEVELS, search_territories
 from .serializers import (
     DistrictSerializer,
     PrecinctSerializer,
     PrecinctWithDistanceSerializer,
     RegionSerializer,
+    TerritorySearchResultSerializer,
 )
-
-
-def haversine_distance(lat1, lon1, lat2, lon2):
-    """
-    Calculate distance in kilometers between two lat/lon points using the Haversine formula.
-
-    Args:
-        lat1, lon1: Coordinates of first point
-        lat2, lon2: Coordinates of second point
-
-    Returns:
-        Distance in kilometers
-    """
-    R = 6371  # Earth radius in kilometers
-
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
-
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
-    c = 2 * math.asin(math.sqrt(a))
-
-    return R * c
+from .spatial import get_precinct_index, locate_precinct
 
 
 class RegionListView(generics.ListAPIView):
@@ -114,6 +98,8 @@ class NearbyPrecinctsView(APIView):
     - radius (optional): Search radius in km (1-50, default 10)
 
     Returns precincts within the specified radius, ordered by distance.
+    Distances come from the process-local spatial index (apps.territories.spatial);
+    only the precincts of the requested page are loaded from the database.
     """
 
     permission_classes = [IsAuthenticated]
@@ -152,31 +138,184 @@ class NearbyPrecinctsView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 2. Get all precincts with coordinates
-        precincts = Precinct.objects.filter(
-            latitude__isnull=False, longitude__isnull=False
-        ).select_related("district__region")
+        # 2. Candidates from the in-memory spatial index, ordered by distance
+        results = get_precinct_index().nearby(lat, lng, radius)
+
+        # 3. Paginate the (id, distance) pairs
+        paginator = StandardPagination()
+        page = paginator.paginate_queryset(results, request)
+
+        # 4. Fetch only this page's precincts and serialize with distance
+        precincts = Precinct.objects.select_related("district__region").in_bulk(
+            [precinct_id for precinct_id, _ in page]
+        )
+        page_precincts = []
+        for precinct_id, distance in page:
+            precinct = precincts.get(precinct_id)
+            if precinct is None:
+                # Deleted since the index was built
+                continue
+            precinct.distance = round(distance, 2)
+            page_precincts.append(precinct)
+
+        serializer = PrecinctWithDistanceSerializer(page_precincts, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+
+class PrecinctLocateView(APIView):
+    """
+    Find the precinct whose CEC boundary contains given coordinates.
+
+    Query parameters:
+    - lat (required): Latitude (-90 to 90)
+    - lng (required): Longitude (-180 to 180)
+
+    Uses the process-local boundary index (apps.territories.spatial). Returns
+    404 when no imported boundary contains the point.
+    """
+
+    permission_classes = [IsAuthenticated]
 
-        # 3. Calculate distances and filter
-        results = []
-        for precinct in precincts:
-            distance = haversine_distance(
-                lat, lng, float(precinct.latitude), float(precinct.longitude)
+    def get(self, request):
+        lat = request.GET.get("lat")
+        lng = request.GET.get("lng")
+
+        if not lat or not lng:
+            return Response(
+                {"detail": "Both 'lat' and 'lng' query parameters are required."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            if distance <= radius:
-                results.append({"precinct": precinct, "distance": round(distance, 2)})
 
-        # 4. Sort by distance
-        results.sort(key=lambda x: x["distance"])
+        try:
+            lat = float(lat)
+            lng = float(lng)
+        except ValueError:
+            return Response(
+                {"detail": "Invalid coordinate values. Must be numeric."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        # 5. Paginate
-        paginator = StandardPagination()
-        page = paginator.paginate_queryset([r["precinct"] for r in results], request)
+        if not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
+            return Response(
+                {"detail": "Coordinates out of range. Latitude: -90 to 90, Longitude: -180 to 180."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        precinct_id = locate_precinct(lat, lng)
+        precinct = (
+            Precinct.objects.select_related("district__region").filter(id=precinct_id).first()
+            if precinct_id is not None
+            else None
+        )
+        if precinct is None:
+            return Response(
+                {"detail": "No precinct boundary contains this point."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(PrecinctSerializer(precinct).data)
+
+
+# Bundle cache lifetime for clients (territories change a few times a year)
+TERRITORY_BUNDLE_MAX_AGE = 60 * 60 * 24  # 1 day
+
+
+def accepts_gzip(accept_encoding):
+    """Whether an Accept-Encoding header allows gzip (a q=0 weight refuses it)."""
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        coding = coding.strip().lower()
+        if coding in ("gzip", "x-gzip"):
+            return quality > 0
+        if coding == "*":
+            wildcard = quality > 0
+    return wildcard
+
+
+class TerritoryBundleView(APIView):
+    """
+    Full region/district/precinct tree in one compressed, versioned payload.
+
+    GET /api/v1/territories/bundle/
+
+    The ETag is the bundle's content version; clients send it back in
+    If-None-Match and get 304 Not Modified until territory data changes.
+    The gzip body is served as-is to clients that accept gzip; each encoding
+    has its own ETag (the gzip one ends in "-gz").
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        bundle = get_territory_bundle()
+        compressed = accepts_gzip(request.headers.get("Accept-Encoding", ""))
+        etag = bundle.gzip_etag if compressed else bundle.etag
+
+        # If-None-Match uses weak comparison
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        if "*" in if_none_match or etag in [tag.removeprefix("W/") for tag in if_none_match]:
+            response = HttpResponseNotModified()
+        elif compressed:
+            response = HttpResponse(bundle.body, content_type="application/json")
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(gzip.decompress(bundle.body), content_type="application/json")
+
+        response["ETag"] = etag
+        response["Cache-Control"] = f"private, max-age={TERRITORY_BUNDLE_MAX_AGE}"
+        patch_vary_headers(response, ["Accept-Encoding", "Authorization"])
+        return response
+
+
+class TerritorySearchView(APIView):
+    """
+    Unified search over regions, districts and precincts.
+
+    GET /api/v1/territories/search/?q=vake
+
+    Query parameters:
+    - q (required): Name in Georgian or Latin transliteration, or a CEC code prefix
+    - type (optional): Comma-separated levels to include (region, district, precinct)
+    - limit (optional): Maximum hits (1-50, default 20)
+
+    Served from the process-local search index (apps.territories.search).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        query = request.GET.get("q", "").strip()
+        if not query:
+            return Response(
+                {"detail": "The 'q' query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        # 6. Serialize with distance
-        serializer = PrecinctWithDistanceSerializer(page, many=True)
-        serialized_data = serializer.data
-        for i, result in enumerate(results[: len(page)]):
-            serialized_data[i]["distance"] = result["distance"]
+        try:
+            limit = int(request.GET.get("limit", 20))
+        except ValueError:
+            limit = 0
+        if not (1 <= limit <= 50):
+            return Response(
+                {"detail": "Limit must be between 1 and 50."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        levels = tuple(level for level in request.GET.get("type", "").split(",") if level) or LEVELS
+        if not set(levels) <= set(LEVELS):
+            return Response(
+                {"detail": f"Type must be one or more of: {', '.join(LEVELS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        return paginator.get_paginated_response(serialized_data)
+        results = search_territories(query, limit=limit, levels=levels)
+        return Response({"results": TerritorySearchResultSerializer(results, many=True).data})
@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from .models import DeviceFingerprint, GeDVerification, SMSOTPRequest
+from .models import (
+    DeviceCluster,
+    DeviceFingerprint,
+    GeDVerification,
+    OTPAuditEvent,
+    SMSOTPRequest,
+    SMSOutbox,
+)
 
 
 @admin.register(SMSOTPRequest)
@@ -11,17 +18,74 @@ class SMSOTPRequestAdmin(admin.ModelAdmin):
     readonly_fields = ["code", "reference", "created_at"]
 
 
+@admin.register(SMSOutbox)
+class SMSOutboxAdmin(admin.ModelAdmin):
+    list_display = ["phone_number", "kind", "status", "attempts", "next_attempt_at", "sent_at"]
+    list_filter = ["status", "kind"]
+    search_fields = ["phone_number", "reference"]
+    raw_id_fields = ["otp"]
+    # OTP message bodies are encrypted and must not be edited
+    readonly_fields = ["message", "reference", "last_error", "created_at", "updated_at", "sent_at"]
+
+
+@admin.register(OTPAuditEvent)
+class OTPAuditEventAdmin(admin.ModelAdmin):
+    list_display = ["phone_number", "event", "attempts", "occurred_at"]
+    list_filter = ["event"]
+    search_fields = ["phone_number"]
+
+    # Append-only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(GeDVerification)
 class GeDVerificationAdmin(admin.ModelAdmin):
-    list_display = ["user", "ged_id", "is_verified", "ged_balance", "verified_at", "last_sync_at"]
-    list_filter = ["is_verified"]
+    list_display = [
+        "user",
+        "ged_id",
+        "is_verified",
+        "ged_balance",
+        "needs_review",
+        "verified_at",
+        "last_sync_at",
+    ]
+    list_filter = ["is_verified", "needs_review"]
     search_fields = ["user__phone_number", "ged_id"]
     raw_id_fields = ["user"]
 
 
 @admin.register(DeviceFingerprint)
 class DeviceFingerprintAdmin(admin.ModelAdmin):
-    list_display = ["user", "fingerprint_hash", "ip_address", "is_flagged", "created_at"]
+    list_display = [
+        "user",
+        "fingerprint_hash",
+        "ip_address",
+        "is_flagged",
+        "seen_count",
+        "first_seen",
+        "last_seen",
+    ]
     list_filter = ["is_flagged"]
     search_fields = ["user__phone_number", "fingerprint_hash"]
     raw_id_fields = ["user"]
+
+
+@admin.register(DeviceCluster)
+class DeviceClusterAdmin(admin.ModelAdmin):
+    list_display = ["id", "score", "size", "first_detected_at", "last_detected_at"]
+    readonly_fields = [
+        "cluster_key",
+        "score",
+        "size",
+        "signals",
+        "user_ids",
+        "first_detected_at",
+        "last_detected_at",
+    ]
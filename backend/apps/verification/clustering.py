@@ -0,0 +1,317 @@
+"""
+Device fingerprint clustering.
+
+A batch job links users through their devices and precomputes
+DeviceFingerprint.is_flagged, so the fingerprint endpoint never scans other
+users' rows. Signals:
+
+- shared hashes: one fingerprint hash submitted by several users. Hashes
+  shared by more than MAX_SHARED_GROUP users (device farms) become clusters
+  of their own instead of being merged with other links
+- shared subnets: groups of up to MAX_SUBNET_GROUP users behind one IPv4
+  /24 (IPv6 /48) network; larger groups are carrier NAT / public Wi-Fi and
+  are ignored. Subnets are weak evidence: they never link users, they only
+  add to the score of clusters whose members share them, capped at
+  MAX_SUBNET_SCORE
+- similar devices: device_data of different users whose MinHash-estimated
+  Jaccard similarity is at least MINHASH_THRESHOLD. Candidate pairs come from
+  LSH banding (signatures cut into bands, rows sharing a band bucket are
+  compared), so the job never compares all pairs. Buckets holding many users
+  are common stock configurations and are skipped.
+
+Device links (shared hashes and similar devices) are merged with union-find
+into clusters, scored with SCORE_WEIGHTS per link, and written to
+DeviceCluster, so users who merely share a network are never clustered or
+flagged. Fingerprints of users in clusters scoring at
+least DEVICE_CLUSTER_MIN_SCORE are flagged; all others are unflagged.
+"""
+
+import hashlib
+import ipaddress
+import random
+from collections import Counter, defaultdict
+from itertools import combinations
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.communities.fraud import DisjointSet
+
+from .models import DeviceCluster, DeviceFingerprint
+
+# Clusters scoring below this are not stored or flagged; one shared hash
+# between two users is enough
+DEVICE_CLUSTER_MIN_SCORE = 3.0
+
+# Subnet groups larger than this are treated as shared infrastructure
+MAX_SUBNET_GROUP = 20
+
+# Cap on a cluster's shared_subnets score, well below DEVICE_CLUSTER_MIN_SCORE
+MAX_SUBNET_SCORE = 1.0
+
+# Hash groups larger than this are reported as clusters of their own (not
+# merged with other links); LSH buckets larger than this are generic and
+# ignored
+MAX_SHARED_GROUP = 20
+
+# MinHash signature: MINHASH_BANDS bands of MINHASH_ROWS values
+MINHASH_BANDS = 16
+MINHASH_ROWS = 4
+MINHASH_THRESHOLD = 0.9
+MINHASH_SEED = 20261018
+
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Signal weights per link (members of a group beyond the first)
+SCORE_WEIGHTS = {
+    "shared_hashes": 3.0,
+    "similar_devices": 1.0,
+    "shared_subnets": 0.5,
+}
+
+# User ids stored per cluster row
+MAX_STORED_USERS = 500
+
+# Rows fetched per database round trip while loading
+LOAD_CHUNK_SIZE = 5000
+
+# Users per flag-updating UPDATE
+FLAG_BATCH_SIZE = 1000
+
+_rng = random.Random(MINHASH_SEED)
+MINHASH_PERMUTATIONS = [
+    (_rng.randrange(1, MERSENNE_PRIME), _rng.randrange(0, MERSENNE_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+]
+
+
+def device_tokens(data, prefix=""):
+    """Flatten device_data into a set of "path=value" tokens."""
+    tokens = set()
+    if isinstance(data, dict):
+        for key, value in data.items():
+            tokens |= device_tokens(value, f"{prefix}{key}.")
+    elif isinstance(data, list):
+        for value in data:
+            tokens |= device_tokens(value, f"{prefix}[].")
+    else:
+        tokens.add(f"{prefix.rstrip('.')}={data}")
+    return tokens
+
+
+def minhash_signature(tokens):
+    """MinHash signature of a token set (one minimum per permutation)."""
+    values = [
+        int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+        for token in tokens
+    ]
+    return tuple(
+        min((a * value + b) % MERSENNE_PRIME for value in values)
+        for a, b in MINHASH_PERMUTATIONS
+    )
+
+
+def estimated_similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity of the token sets behind two signatures."""
+    equal = sum(1 for a, b in zip(signature_a, signature_b) if a == b)
+    return equal / len(signature_a)
+
+
+def subnet(ip_address):
+    """The /24 (IPv4) or /48 (IPv6) network of an address, as a string."""
+    address = ipaddress.ip_address(ip_address)
+    prefix = 24 if address.version == 4 else 48
+    return str(ipaddress.ip_network(f"{address}/{prefix}", strict=False))
+
+
+def _groups(users_by_key, max_group=None):
+    """Sorted user tuples of keys shared by 2..max_group (default: any) distinct users."""
+    for users in users_by_key.values():
+        if len(users) >= 2 and (max_group is None or len(users) <= max_group):
+            yield tuple(sorted(users))
+
+
+def similar_pairs(signatures):
+    """
+    Pairs of users with similar devices.
+
+    Args:
+        signatures: (user_id, signature) pairs
+
+    Returns:
+        set[tuple]: (user_id, user_id) pairs, smaller id first
+    """
+    buckets = defaultdict(list)
+    for user_id, signature in signatures:
+        for band in range(MINHASH_BANDS):
+            rows = signature[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS]
+            buckets[(band, rows)].append((user_id, signature))
+
+    pairs = set()
+    for members in buckets.values():
+        distinct = len({user_id for user_id, _ in members})
+        if not 2 <= distinct <= MAX_SHARED_GROUP:
+            continue
+        for (user_a, signature_a), (user_b, signature_b) in combinations(members, 2):
+            if user_a == user_b:
+                continue
+            pair = (min(user_a, user_b), max(user_a, user_b))
+            if pair in pairs:
+                continue
+            if estimated_similarity(signature_a, signature_b) >= MINHASH_THRESHOLD:
+                pairs.add(pair)
+    return pairs
+
+
+def find_device_clusters(rows, min_score=DEVICE_CLUSTER_MIN_SCORE):
+    """
+    Cluster users linked by their fingerprints.
+
+    Args:
+        rows: (user_id, fingerprint_hash, ip_address, device_data) rows
+        min_score: Minimum score to report
+
+    Returns:
+        list[dict]: Clusters ordered by score, with keys "user_ids", "size",
+                    "score" and "signals"
+    """
+    users_by_hash = defaultdict(set)
+    users_by_subnet = defaultdict(set)
+    signatures = []
+    for user_id, fingerprint_hash, ip_address, device_data in rows:
+        users_by_hash[fingerprint_hash].add(user_id)
+        if ip_address:
+            users_by_subnet[subnet(ip_address)].add(user_id)
+        tokens = device_tokens(device_data)
+        if tokens:
+            signatures.append((user_id, minhash_signature(tokens)))
+
+    hash_groups = list(_groups(users_by_hash))
+    links = {
+        "shared_hashes": [members for members in hash_groups if len(members) <= MAX_SHARED_GROUP],
+        "similar_devices": sorted(similar_pairs(signatures)),
+    }
+
+    # Device farms: every member shares one hash; reported without merging
+    result = [
+        _cluster(members, {"shared_hashes": len(members) - 1})
+        for members in hash_groups
+        if len(members) > MAX_SHARED_GROUP
+    ]
+
+    index = {}
+    for groups in links.values():
+        for members in groups:
+            for user_id in members:
+                index.setdefault(user_id, len(index))
+
+    clusters = DisjointSet(len(index))
+    for groups in links.values():
+        for members in groups:
+            for user_id in members[1:]:
+                clusters.union(index[members[0]], index[user_id])
+
+    signals = defaultdict(lambda: dict.fromkeys(SCORE_WEIGHTS, 0))
+    for name, groups in links.items():
+        for members in groups:
+            signals[clusters.find(index[members[0]])][name] += len(members) - 1
+
+    # Subnets only count between members already linked by their devices
+    for members in _groups(users_by_subnet, MAX_SUBNET_GROUP):
+        linked = Counter(clusters.find(index[user_id]) for user_id in members if user_id in index)
+        for root, count in linked.items():
+            signals[root]["shared_subnets"] += count - 1
+
+    users_by_root = defaultdict(list)
+    for user_id, position in index.items():
+        users_by_root[clusters.find(position)].append(user_id)
+
+    result.extend(_cluster(users_by_root[root], values) for root, values in signals.items())
+    result = [cluster for cluster in result if cluster["score"] >= min_score]
+    result.sort(key=lambda cluster: -cluster["score"])
+    return result
+
+
+def _cluster(user_ids, signals):
+    """Build a scored cluster dict from its members and signal counts."""
+    values = dict.fromkeys(SCORE_WEIGHTS, 0) | signals
+    score = sum(
+        SCORE_WEIGHTS[name] * count for name, count in values.items() if name != "shared_subnets"
+    )
+    score += min(SCORE_WEIGHTS["shared_subnets"] * values["shared_subnets"], MAX_SUBNET_SCORE)
+    user_ids = sorted(user_ids)
+    return {"user_ids": user_ids, "size": len(user_ids), "score": score, "signals": values}
+
+
+def analyze_devices(min_score=DEVICE_CLUSTER_MIN_SCORE, chunk_size=LOAD_CHUNK_SIZE):
+    """Load all fingerprints and return scored device clusters."""
+    rows = (
+        DeviceFingerprint.objects.order_by()
+        .values_list("user_id", "fingerprint_hash", "ip_address", "device_data")
+        .iterator(chunk_size=chunk_size)
+    )
+    return find_device_clusters(rows, min_score=min_score)
+
+
+def store_device_clusters(clusters):
+    """
+    Write clusters to DeviceCluster and precompute fingerprint flags.
+
+    Known clusters are refreshed (first_detected_at is kept), clusters missing
+    from this run are deleted. Fingerprints of clustered users are flagged and
+    all other flags are cleared.
+
+    Returns:
+        dict: {"stored": int, "removed": int, "flagged": int, "unflagged": int}
+    """
+    now = timezone.now()
+    rows = []
+    flagged = set()
+    for cluster in clusters:
+        flagged.update(cluster["user_ids"])
+        key = hashlib.sha256(",".join(map(str, cluster["user_ids"])).encode()).hexdigest()
+        rows.append(
+            DeviceCluster(
+                cluster_key=key,
+                score=cluster["score"],
+                size=cluster["size"],
+                signals=cluster["signals"],
+                user_ids=cluster["user_ids"][:MAX_STORED_USERS],
+                last_detected_at=now,
+            )
+        )
+
+    with transaction.atomic():
+        removed, _ = DeviceCluster.objects.exclude(
+            cluster_key__in=[row.cluster_key for row in rows]
+        ).delete()
+        DeviceCluster.objects.bulk_create(
+            rows,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["cluster_key"],
+            update_fields=["score", "size", "signals", "user_ids", "last_detected_at"],
+        )
+
+        currently_flagged = set(
+            DeviceFingerprint.objects.filter(is_flagged=True)
+            .values_list("user_id", flat=True)
+            .distinct()
+        )
+        to_flag = sorted(flagged)
+        to_unflag = sorted(currently_flagged - flagged)
+        for start in range(0, len(to_flag), FLAG_BATCH_SIZE):
+            DeviceFingerprint.objects.filter(
+                user_id__in=to_flag[start : start + FLAG_BATCH_SIZE], is_flagged=False
+            ).update(is_flagged=True)
+        for start in range(0, len(to_unflag), FLAG_BATCH_SIZE):
+            DeviceFingerprint.objects.filter(
+                user_id__in=to_unflag[start : start + FLAG_BATCH_SIZE]
+            ).update(is_flagged=False)
+
+    return {
+        "stored": len(rows),
+        "removed": removed,
+        "flagged": len(flagged - currently_flagged),
+        "unflagged": len(to_unflag),
+    }
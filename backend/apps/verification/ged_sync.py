@@ -0,0 +1,173 @@
+"""
+Periodic GeD re-sync of verified users (GP-065).
+
+Walks verified GeDVerification rows in keyset-paginated chunks (id > last
+id of the previous chunk) and re-fetches each user from the girchi.com
+Strapi API:
+
+- requests for a chunk run concurrently on a bounded thread pool over one
+  pooled session, paced by a rate limiter (GED_SYNC_RATE requests per
+  second for the whole run; one run at a time is enforced by a lock)
+- rows synced within GED_SYNC_INTERVAL are skipped (last_sync_at), so a run
+  that crashed or was stopped resumes where it left off when started again
+- results are written with one bulk_update per chunk
+
+Users that girchi.com no longer knows, or that no longer hold GeD, are
+flagged for admin review (needs_review); their role is not revoked.
+Transient failures leave the row untouched for the next run.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .http import RateLimiter, pooled_session
+from .models import GeDVerification
+
+logger = logging.getLogger(__name__)
+
+# Verifications fetched and written per chunk
+GED_SYNC_CHUNK_SIZE = 200
+
+# Rows synced more recently than this are skipped
+GED_SYNC_INTERVAL = timedelta(hours=6)
+
+GED_SYNC_LOCK_KEY = "verification:ged-sync:lock"
+GED_SYNC_LOCK_TIMEOUT = 60 * 60 * 2
+
+GED_SYNC_FIELDS = [
+    "ged_balance",
+    "raw_response",
+    "needs_review",
+    "review_reason",
+    "last_sync_at",
+]
+
+
+class GeDSyncAborted(Exception):
+    """girchi.com rejected the API token; the run stops."""
+
+
+def _fetch(session, limiter, base_url, verification):
+    """Fetch one girchi.com user; returns (verification, HTTP status or None, data)."""
+    limiter.acquire()
+    try:
+        response = session.get(
+            f"{base_url}/api/users-permissions/users/{verification.girchi_user_id}",
+            headers={"Authorization": f"Bearer {settings.GIRCHI_API_TOKEN}"},
+            timeout=10,
+        )
+        if response.status_code != 200:
+            return verification, response.status_code, None
+        return verification, 200, response.json()
+    except (requests.RequestException, ValueError):
+        return verification, None, None
+
+
+def _parse_balance(value):
+    try:
+        return Decimal(str(value)).quantize(Decimal("0.01"))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _apply(verification, status_code, data, now):
+    """
+    Update a verification from a fetch result.
+
+    Returns:
+        bool: False if the result was a transient failure and nothing changed
+    """
+    if status_code == 404:
+        verification.needs_review = True
+        verification.review_reason = "User not found on girchi.com."
+    elif status_code == 200 and isinstance(data, dict):
+        verification.raw_response = data
+        verification.ged_balance = _parse_balance(data.get("ged_balance"))
+        if verification.ged_balance:
+            verification.needs_review = False
+            verification.review_reason = ""
+        else:
+            verification.needs_review = True
+            verification.review_reason = "No GeD balance on girchi.com."
+    else:
+        return False
+
+    # bulk_update skips auto_now
+    verification.last_sync_at = now
+    return True
+
+
+def sync_ged_data(chunk_size=GED_SYNC_CHUNK_SIZE, force=False):
+    """
+    Re-fetch GeD data for all verified users.
+
+    Args:
+        chunk_size: Verifications per chunk
+        force: Also re-fetch rows synced within GED_SYNC_INTERVAL
+
+    Raises:
+        GeDSyncAborted: If girchi.com answers 401 / 403
+
+    Returns:
+        dict | None: {"synced": int, "flagged": int, "errors": int}, or None if
+        another run holds the lock
+    """
+    if not cache.add(GED_SYNC_LOCK_KEY, 1, timeout=GED_SYNC_LOCK_TIMEOUT):
+        return None
+
+    started = timezone.now()
+    cutoff = started if force else started - GED_SYNC_INTERVAL
+    base_url = settings.GIRCHI_API_BASE_URL
+    session = pooled_session(settings.GED_SYNC_CONCURRENCY)
+    limiter = RateLimiter(settings.GED_SYNC_RATE)
+    summary = {"synced": 0, "flagged": 0, "errors": 0}
+    last_id = 0
+
+    try:
+        with ThreadPoolExecutor(max_workers=settings.GED_SYNC_CONCURRENCY) as pool:
+            while True:
+                chunk = list(
+                    GeDVerification.objects.filter(
+                        id__gt=last_id,
+                        is_verified=True,
+                        girchi_user_id__isnull=False,
+                        last_sync_at__lt=cutoff,
+                    )
+                    .order_by("id")
+                    .only("id", "girchi_user_id", *GED_SYNC_FIELDS)[:chunk_size]
+                )
+                if not chunk:
+                    break
+                last_id = chunk[-1].id
+
+                results = list(
+                    pool.map(lambda row: _fetch(session, limiter, base_url, row), chunk)
+                )
+                now = timezone.now()
+                updated = []
+                rejected = False
+                for verification, status_code, data in results:
+                    if status_code in (401, 403):
+                        rejected = True
+                    if _apply(verification, status_code, data, now):
+                        updated.append(verification)
+                        summary["flagged"] += verification.needs_review
+                    else:
+                        summary["errors"] += 1
+
+                GeDVerification.objects.bulk_update(updated, GED_SYNC_FIELDS)
+                summary["synced"] += len(updated)
+                if rejected:
+                    raise GeDSyncAborted("girchi.com rejected GIRCHI_API_TOKEN.")
+    finally:
+        session.close()
+        cache.delete(GED_SYNC_LOCK_KEY)
+
+    return summary
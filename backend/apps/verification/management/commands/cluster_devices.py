@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+
+from apps.verification.clustering import (
+    DEVICE_CLUSTER_MIN_SCORE,
+    analyze_devices,
+    store_device_clusters,
+)
+
+
+class Command(BaseCommand):
+    """
+    Cluster users by device fingerprints and refresh the precomputed flags.
+
+    Usage:
+        python manage.py cluster_devices
+        python manage.py cluster_devices --dry-run
+        python manage.py cluster_devices --min-score 5
+    """
+
+    help = "Group users by shared devices, subnets and similar device data; flag clustered users."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Print the top clusters without writing clusters or flags",
+        )
+        parser.add_argument(
+            "--min-score",
+            type=float,
+            default=DEVICE_CLUSTER_MIN_SCORE,
+            help="Minimum cluster score to store and flag",
+        )
+
+    def handle(self, *args, **options):
+        clusters = analyze_devices(min_score=options["min_score"])
+
+        for cluster in clusters[:20]:
+            signals = cluster["signals"]
+            self.stdout.write(
+                f"  score {cluster['score']:.1f}: {cluster['size']} users, "
+                f"{signals['shared_hashes']} shared-hash links, "
+                f"{signals['similar_devices']} similar-device links, "
+                f"{signals['shared_subnets']} subnet links"
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"[DRY RUN] Found {len(clusters)} device clusters.")
+            )
+            return
+
+        summary = store_device_clusters(clusters)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored {summary['stored']} device clusters ({summary['removed']} removed); "
+                f"{summary['flagged']} users flagged, {summary['unflagged']} unflagged."
+            )
+        )
@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.verification.ged_sync import GED_SYNC_CHUNK_SIZE, GeDSyncAborted, sync_ged_data
+
+
+class Command(BaseCommand):
+    """
+    Re-fetch GeD data of all verified users from girchi.com.
+
+    Rows synced within the last 6 hours are skipped, so an interrupted run
+    continues where it stopped.
+
+    Usage:
+        python manage.py sync_ged_data
+        python manage.py sync_ged_data --force
+        python manage.py sync_ged_data --chunk-size 500
+    """
+
+    help = "Re-fetch GeD balances of verified users and flag lost GeD for review."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Also re-fetch users synced within the last 6 hours",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=GED_SYNC_CHUNK_SIZE,
+            help="Verifications fetched and written per chunk",
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        try:
+            summary = sync_ged_data(chunk_size=options["chunk_size"], force=options["force"])
+        except GeDSyncAborted as exc:
+            raise CommandError(str(exc))
+
+        if summary is None:
+            raise CommandError("Another GeD sync is running.")
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Synced {summary['synced']} GeD verifications in {elapsed:.1f}s "
+                f"({summary['flagged']} flagged for review, {summary['errors']} errors)."
+            )
+        )
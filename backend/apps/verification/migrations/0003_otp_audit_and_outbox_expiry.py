@@ -0,0 +1,34 @@
+# Generated by Django 6.0.2 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verification', '0002_smsoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='smsoutbox',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='OTPAuditEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phone_number', models.CharField(max_length=20)),
+                ('event', models.CharField(choices=[('issued', 'Issued'), ('verified', 'Verified'), ('invalid', 'Invalid code'), ('locked', 'Too many attempts'), ('expired', 'Expired'), ('missing', 'No OTP')], max_length=10)),
+                ('attempts', models.PositiveSmallIntegerField(default=0)),
+                ('occurred_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'OTP Audit Event',
+                'ordering': ['-occurred_at'],
+                'indexes': [models.Index(fields=['phone_number', 'occurred_at'], name='verificatio_phone_n_1cc848_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 17:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verification', '0003_otp_audit_and_outbox_expiry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gedverification',
+            name='needs_review',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='gedverification',
+            name='review_reason',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 6.0.2 on 2026-10-18 18:10
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def merge_duplicate_fingerprints(apps, schema_editor):
+    """Collapse repeated (user, hash) submissions into one row with seen counts."""
+    from django.db.models import Count, Max, Min, Q
+
+    DeviceFingerprint = apps.get_model("verification", "DeviceFingerprint")
+
+    duplicates = (
+        DeviceFingerprint.objects.values("user_id", "fingerprint_hash")
+        .annotate(
+            rows=Count("id"),
+            keep_id=Max("id"),
+            first=Min("first_seen"),
+            last=Max("first_seen"),
+            flagged=Count("id", filter=Q(is_flagged=True)),
+        )
+        .filter(rows__gt=1)
+    )
+    kept = []
+    for group in duplicates.iterator():
+        kept.append(
+            DeviceFingerprint(
+                id=group["keep_id"],
+                first_seen=group["first"],
+                last_seen=group["last"],
+                seen_count=group["rows"],
+                is_flagged=group["flagged"] > 0,
+            )
+        )
+        DeviceFingerprint.objects.filter(
+            user_id=group["user_id"], fingerprint_hash=group["fingerprint_hash"]
+        ).exclude(id=group["keep_id"]).delete()
+    DeviceFingerprint.objects.bulk_update(
+        kept, ["first_seen", "last_seen", "seen_count", "is_flagged"], batch_size=1000
+    )
+
+
+def backfill_last_seen(apps, schema_editor):
+    from django.db.models import F
+
+    DeviceFingerprint = apps.get_model("verification", "DeviceFingerprint")
+    DeviceFingerprint.objects.update(last_seen=F("first_seen"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('verification', '0004_gedverification_needs_review'),
+    ]
+
+    operations = [
+        migrations.RenameField(
+            model_name='devicefingerprint',
+            old_name='created_at',
+            new_name='first_seen',
+        ),
+        migrations.AddField(
+            model_name='devicefingerprint',
+            name='last_seen',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='devicefingerprint',
+            name='seen_count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.RunPython(backfill_last_seen, migrations.RunPython.noop),
+        migrations.RunPython(merge_duplicate_fingerprints, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='devicefingerprint',
+            constraint=models.UniqueConstraint(fields=('user', 'fingerprint_hash'), name='verification_fingerprint_user_hash_uniq'),
+        ),
+        migrations.CreateModel(
+            name='DeviceCluster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cluster_key', models.CharField(help_text='SHA-256 of the sorted user ids', max_length=64, unique=True)),
+                ('score', models.FloatField(db_index=True)),
+                ('size', models.PositiveIntegerField(help_text='Number of users in the cluster')),
+                ('signals', models.JSONField(default=dict, help_text='shared_hashes, shared_subnets, similar_devices')),
+                ('user_ids', models.JSONField(default=list, help_text='User ids (truncated for huge clusters)')),
+                ('first_detected_at', models.DateTimeField(auto_now_add=True)),
+                ('last_detected_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Device Cluster',
+                'verbose_name_plural': 'Device Clusters',
+                'ordering': ['-score'],
+            },
+        ),
+    ]
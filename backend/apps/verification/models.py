@@ -1,9 +1,10 @@
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class SMSOTPRequest(models.Model):
-    """Tracks OTP codes sent via smsoffice.ge."""
+    """OTP codes of the database OTP store (apps.verification.otp_store)."""
 
     phone_number = models.CharField(max_length=20, db_index=True)
     code = models.CharField(max_length=6)
@@ -31,6 +32,99 @@ class SMSOTPRequest(models.Model):
         return timezone.now() > self.expires_at
 
 
+class SMSOutbox(models.Model):
+    """
+    Outgoing SMS queued for asynchronous delivery (apps.verification.outbox).
+
+    At most one pending message per (destination, kind): re-queuing replaces
+    the pending message's content instead of sending twice.
+    """
+
+    class Kind(models.TextChoices):
+        OTP = "otp", "OTP"
+        NOTIFICATION = "notification", "Notification"
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+        SKIPPED = "skipped", "Skipped"
+
+    phone_number = models.CharField(max_length=20)
+    kind = models.CharField(max_length=20, choices=Kind.choices, default=Kind.NOTIFICATION)
+    message = models.TextField()
+    otp = models.ForeignKey(
+        SMSOTPRequest,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="outbox_messages",
+    )
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True)
+    reference = models.CharField(max_length=100, blank=True)
+    # Messages not delivered by then are skipped (OTP validity)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "SMS Outbox Message"
+        verbose_name_plural = "SMS Outbox"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["phone_number", "kind"],
+                condition=models.Q(status="pending"),
+                name="verification_outbox_pending_uniq",
+            ),
+        ]
+
+    def __str__(self):
+        return f"SMS to {self.phone_number} ({self.kind}, {self.status})"
+
+
+class OTPAuditEvent(models.Model):
+    """
+    Append-only trail of OTP issuance and verification (OTP_AUDIT_TRAIL).
+
+    Written asynchronously by the record_otp_event task; never stores codes.
+    """
+
+    class Event(models.TextChoices):
+        ISSUED = "issued", "Issued"
+        VERIFIED = "verified", "Verified"
+        INVALID = "invalid", "Invalid code"
+        LOCKED = "locked", "Too many attempts"
+        EXPIRED = "expired", "Expired"
+        MISSING = "missing", "No OTP"
+
+    phone_number = models.CharField(max_length=20)
+    event = models.CharField(max_length=10, choices=Event.choices)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    occurred_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = "OTP Audit Event"
+        ordering = ["-occurred_at"]
+        indexes = [
+            models.Index(fields=["phone_number", "occurred_at"]),
+        ]
+
+    def __str__(self):
+        return f"OTP {self.event} for {self.phone_number}"
+
+
 class GeDVerification(models.Model):
     """Records GeD API verification attempts and results."""
 
@@ -48,6 +142,10 @@ class GeDVerification(models.Model):
     )
     raw_response = models.JSONField(default=dict, blank=True)
     last_sync_at = models.DateTimeField(auto_now=True)
+    # Set by the periodic sync when girchi.com no longer confirms the GeD;
+    # the role is not revoked automatically
+    needs_review = models.BooleanField(default=False)
+    review_reason = models.CharField(max_length=255, blank=True)
 
     class Meta:
         indexes = [
@@ -60,7 +158,12 @@ class GeDVerification(models.Model):
 
 
 class DeviceFingerprint(models.Model):
-    """Anti-fake: stores device identity signals per user."""
+    """
+    Anti-fake: device identity signals, one row per (user, fingerprint hash).
+
+    Repeat submissions update last_seen / seen_count. is_flagged is
+    precomputed by the clustering job (apps.verification.clustering).
+    """
 
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -71,13 +174,51 @@ class DeviceFingerprint(models.Model):
     device_data = models.JSONField(default=dict)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     is_flagged = models.BooleanField(default=False)
-    created_at = models.DateTimeField(auto_now_add=True)
+    first_seen = models.DateTimeField(auto_now_add=True)
+    last_seen = models.DateTimeField(default=timezone.now)
+    seen_count = models.PositiveIntegerField(default=1)
 
     class Meta:
         indexes = [
             models.Index(fields=["fingerprint_hash"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "fingerprint_hash"],
+                name="verification_fingerprint_user_hash_uniq",
+            ),
+        ]
 
     def __str__(self):
         status = "FLAGGED" if self.is_flagged else "clean"
         return f"Device {self.fingerprint_hash[:12]}... ({status})"
+
+
+class DeviceCluster(models.Model):
+    """
+    Users linked through their devices (apps.verification.clustering).
+
+    Rows are keyed by their sorted member set and fully recomputed by each
+    clustering run; members of clusters scoring at least
+    DEVICE_CLUSTER_MIN_SCORE get their fingerprints flagged.
+    """
+
+    cluster_key = models.CharField(
+        max_length=64, unique=True, help_text="SHA-256 of the sorted user ids"
+    )
+    score = models.FloatField(db_index=True)
+    size = models.PositiveIntegerField(help_text="Number of users in the cluster")
+    signals = models.JSONField(
+        default=dict, help_text="shared_hashes, shared_subnets, similar_devices"
+    )
+    user_ids = models.JSONField(default=list, help_text="User ids (truncated for huge clusters)")
+    first_detected_at = models.DateTimeField(auto_now_add=True)
+    last_detected_at = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Device Cluster"
+        verbose_name_plural = "Device Clusters"
+        ordering = ["-score"]
+
+    def __str__(self):
+        return f"Device cluster #{self.id} ({self.size} users, score {self.score:.1f})"
@@ -0,0 +1,221 @@
+"""
+Pluggable OTP storage.
+
+The OTP_STORE setting selects the backend (dotted path):
+
+- RedisOTPStore (default): one hash per phone number holding a keyed digest
+  of the code, its expiry and the attempt counter. Verification is a single
+  Lua script that checks expiry and the attempt limit, increments attempts,
+  compares digests in constant time and consumes the code on success, so
+  parallel guesses can't exceed OTP_MAX_ATTEMPTS. The key outlives the code
+  by OTP_TOMBSTONE_SECONDS so late attempts are reported as expired rather
+  than missing; after that it disappears and nothing needs cleaning up.
+- DatabaseOTPStore: SMSOTPRequest rows, with attempts claimed through a
+  conditional UPDATE. Old rows are purged by cleanup_expired_otps.
+
+Issuing a new code replaces the phone number's previous one.
+
+With OTP_AUDIT_TRAIL enabled, every issue / verification outcome is also
+appended to OTPAuditEvent by a Celery task (record_audit_event).
+"""
+
+import hashlib
+import hmac
+from collections import namedtuple
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import F
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import OTPAuditEvent, SMSOTPRequest
+
+OTP_EXPIRY_MINUTES = 5
+OTP_MAX_ATTEMPTS = 5
+
+OTP_KEY = "verification:otp:{phone_number}"
+
+# Expired codes are remembered this long (Redis store) to report EXPIRED
+OTP_TOMBSTONE_SECONDS = 60 * 60
+
+# issue() result; record is the SMSOTPRequest for the database store
+IssuedOTP = namedtuple("IssuedOTP", ["code", "expires_at", "record"])
+
+# verify() result
+VerifyResult = namedtuple("VerifyResult", ["status", "attempts"])
+
+
+class OTPStatus:
+    """Outcomes of an OTP verification."""
+
+    VERIFIED = OTPAuditEvent.Event.VERIFIED
+    INVALID = OTPAuditEvent.Event.INVALID
+    LOCKED = OTPAuditEvent.Event.LOCKED
+    EXPIRED = OTPAuditEvent.Event.EXPIRED
+    MISSING = OTPAuditEvent.Event.MISSING
+
+
+# KEYS[1]: OTP hash; ARGV[1]: digest of the submitted code; ARGV[2]: max attempts.
+# Returns {status, attempts} with status 0 = missing, 1 = verified,
+# 2 = invalid, 3 = locked, 4 = expired.
+VERIFY_SCRIPT = """
+local stored = redis.call('HGET', KEYS[1], 'digest')
+if not stored then
+    return {0, 0}
+end
+local attempts = tonumber(redis.call('HGET', KEYS[1], 'attempts') or '0')
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+if now >= tonumber(redis.call('HGET', KEYS[1], 'expires_at') or '0') then
+    return {4, attempts}
+end
+if attempts >= tonumber(ARGV[2]) then
+    return {3, attempts}
+end
+attempts = redis.call('HINCRBY', KEYS[1], 'attempts', 1)
+
+-- Constant-time: every byte is compared whatever the first mismatch
+local given = ARGV[1]
+local diff = 0
+if #stored ~= #given then
+    diff = 1
+end
+for i = 1, #stored do
+    diff = diff + math.abs(string.byte(stored, i) - (string.byte(given, i) or 0))
+end
+
+if diff == 0 then
+    redis.call('DEL', KEYS[1])
+    return {1, attempts}
+end
+return {2, attempts}
+"""
+
+SCRIPT_STATUSES = {
+    0: OTPStatus.MISSING,
+    1: OTPStatus.VERIFIED,
+    2: OTPStatus.INVALID,
+    3: OTPStatus.LOCKED,
+    4: OTPStatus.EXPIRED,
+}
+
+
+class OTPStore:
+    """Interface of OTP stores."""
+
+    def issue(self, phone_number, code, expires_at):
+        """
+        Store a new code for phone_number, replacing any previous one.
+
+        Returns:
+            IssuedOTP
+        """
+        raise NotImplementedError
+
+    def verify(self, phone_number, code):
+        """
+        Check a submitted code, counting the attempt.
+
+        A verified code is consumed.
+
+        Returns:
+            VerifyResult: OTPStatus value and the attempts used so far
+        """
+        raise NotImplementedError
+
+
+class RedisOTPStore(OTPStore):
+    """OTPs in Redis hashes that expire with the code."""
+
+    def __init__(self):
+        from django_redis import get_redis_connection
+
+        self.conn = get_redis_connection("default")
+        self.verify_script = self.conn.register_script(VERIFY_SCRIPT)
+
+    @staticmethod
+    def digest(phone_number, code):
+        """Keyed digest of a code, so Redis never holds codes in clear."""
+        return hmac.new(
+            settings.SECRET_KEY.encode(), f"{phone_number}:{code}".encode(), hashlib.sha256
+        ).hexdigest()
+
+    def issue(self, phone_number, code, expires_at):
+        key = OTP_KEY.format(phone_number=phone_number)
+        pipe = self.conn.pipeline()
+        pipe.delete(key)
+        pipe.hset(
+            key,
+            mapping={
+                "digest": self.digest(phone_number, code),
+                "expires_at": int(expires_at.timestamp() * 1000),
+                "attempts": 0,
+            },
+        )
+        pipe.pexpireat(key, expires_at + timedelta(seconds=OTP_TOMBSTONE_SECONDS))
+        pipe.execute()
+        return IssuedOTP(code, expires_at, None)
+
+    def verify(self, phone_number, code):
+        status, attempts = self.verify_script(
+            keys=[OTP_KEY.format(phone_number=phone_number)],
+            args=[self.digest(phone_number, code), OTP_MAX_ATTEMPTS],
+        )
+        return VerifyResult(SCRIPT_STATUSES[int(status)], int(attempts))
+
+
+class DatabaseOTPStore(OTPStore):
+    """OTPs as SMSOTPRequest rows."""
+
+    def issue(self, phone_number, code, expires_at):
+        record = SMSOTPRequest.objects.create(
+            phone_number=phone_number, code=code, expires_at=expires_at
+        )
+        return IssuedOTP(code, expires_at, record)
+
+    def verify(self, phone_number, code):
+        otp = (
+            SMSOTPRequest.objects.filter(phone_number=phone_number, is_verified=False)
+            .order_by("-created_at")
+            .first()
+        )
+        if otp is None:
+            return VerifyResult(OTPStatus.MISSING, 0)
+        if otp.is_expired:
+            return VerifyResult(OTPStatus.EXPIRED, otp.attempts)
+
+        # Claim an attempt atomically; concurrent guesses can't exceed the limit
+        claimed = SMSOTPRequest.objects.filter(
+            id=otp.id, is_verified=False, attempts__lt=OTP_MAX_ATTEMPTS
+        ).update(attempts=F("attempts") + 1)
+        if not claimed:
+            return VerifyResult(OTPStatus.LOCKED, OTP_MAX_ATTEMPTS)
+        attempts = otp.attempts + 1
+
+        if not hmac.compare_digest(otp.code.encode(), code.encode()):
+            return VerifyResult(OTPStatus.INVALID, attempts)
+
+        # Consume the code; a parallel request may have won the race
+        if not SMSOTPRequest.objects.filter(id=otp.id, is_verified=False).update(is_verified=True):
+            return VerifyResult(OTPStatus.MISSING, attempts)
+        return VerifyResult(OTPStatus.VERIFIED, attempts)
+
+
+_store = None
+
+
+def get_otp_store():
+    """Return the configured OTP store (OTP_STORE setting)."""
+    global _store
+    if _store is None:
+        _store = import_string(settings.OTP_STORE)()
+    return _store
+
+
+def record_audit_event(phone_number, event, attempts=0):
+    """Queue an OTPAuditEvent write if OTP_AUDIT_TRAIL is enabled."""
+    from .tasks import record_otp_event
+
+    if settings.OTP_AUDIT_TRAIL:
+        record_otp_event.delay(phone_number, event, attempts, timezone.now().isoformat())
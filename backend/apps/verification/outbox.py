@@ -0,0 +1,346 @@
+"""
+SMS outbox: asynchronous, pooled delivery through the SMS gateway.
+
+Web requests only write an SMSOutbox row (enqueue_sms) and return; a worker
+on the dedicated "sms" Celery queue drains the outbox (deliver_outbox):
+
+- due pending rows are claimed in batches with SELECT ... FOR UPDATE SKIP
+  LOCKED and marked "sending", so several workers never send the same row
+- messages are sent concurrently over one pooled requests.Session, paced by
+  a token-bucket limiter (SMS_GATEWAY_RATE messages per second per worker)
+- transient failures (network errors, 429, 5xx) are retried with
+  exponential backoff and jitter up to SMS_MAX_ATTEMPTS; other 4xx responses
+  fail permanently; messages that expired before delivery (OTPs) are skipped
+- results are written back with one bulk_update per batch
+
+OTP message bodies hold a verification code, so they are stored encrypted
+(Fernet, keyed from SECRET_KEY) and decrypted only by the delivery worker.
+Their text is blanked once the row is finished (sent, failed, skipped or
+expired).
+
+Per-destination dedupe: there is at most one pending message per
+(phone_number, kind). Re-queuing (e.g. "resend code" tapped repeatedly)
+replaces the pending message instead of sending several SMS.
+
+sweep_outbox() requeues rows stuck in "sending" after a worker crash, skips
+expired pending rows and purges old delivered rows.
+"""
+
+import base64
+import logging
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import requests
+from cryptography.fernet import Fernet
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.crypto import salted_hmac
+
+from .http import RateLimiter, pooled_session
+from .models import SMSOTPRequest, SMSOutbox
+
+logger = logging.getLogger(__name__)
+
+# Messages claimed per delivery run
+OUTBOX_BATCH_SIZE = 100
+
+# Delivery attempts before a message is marked failed
+SMS_MAX_ATTEMPTS = 5
+
+# Retry backoff: RETRY_BASE_SECONDS * 2 ** (attempts - 1), capped, with jitter
+RETRY_BASE_SECONDS = 5
+RETRY_MAX_SECONDS = 60 * 10
+
+# Rows left in "sending" this long are assumed orphaned by a crashed worker
+STALE_SENDING_MINUTES = 10
+
+# Delivered / failed rows are kept this long
+OUTBOX_RETENTION_DAYS = 7
+
+OUTBOX_RESULT_FIELDS = [
+    "message",
+    "status",
+    "attempts",
+    "next_attempt_at",
+    "last_error",
+    "reference",
+    "sent_at",
+    "updated_at",
+]
+
+
+# Kinds whose message body is stored encrypted and blanked when finished
+SENSITIVE_KINDS = {SMSOutbox.Kind.OTP}
+
+
+class GatewayRejected(Exception):
+    """The gateway permanently rejected a message (4xx other than 429)."""
+
+
+def _fernet():
+    key = salted_hmac("apps.verification.outbox", "message", algorithm="sha256").digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def seal_message(kind, message):
+    """Return the stored form of a message body (encrypted for sensitive kinds)."""
+    if kind not in SENSITIVE_KINDS:
+        return message
+    return _fernet().encrypt(message.encode()).decode()
+
+
+def open_message(outbox):
+    """Return the plain text of an outbox row's message."""
+    if outbox.kind not in SENSITIVE_KINDS or not outbox.message:
+        return outbox.message
+    return _fernet().decrypt(outbox.message.encode()).decode()
+
+
+_session = None
+_limiter = None
+_session_lock = threading.Lock()
+
+
+def get_gateway_session():
+    """Return the process-wide pooled HTTP session for the SMS gateway."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = pooled_session(settings.SMS_DELIVERY_CONCURRENCY)
+    return _session
+
+
+def get_gateway_limiter():
+    """Return the process-wide gateway rate limiter (shared by delivery runs)."""
+    global _limiter
+    if _limiter is None:
+        with _session_lock:
+            if _limiter is None:
+                _limiter = RateLimiter(settings.SMS_GATEWAY_RATE)
+    return _limiter
+
+
+def enqueue_sms(
+    phone_number, message, kind=SMSOutbox.Kind.NOTIFICATION, otp=None, expires_at=None
+):
+    """
+    Queue an SMS for delivery, replacing a pending message of the same kind.
+
+    Messages still undelivered at expires_at are skipped.
+
+    Delivery is kicked off after the surrounding transaction commits.
+
+    Returns:
+        SMSOutbox: The pending outbox row
+    """
+    from .tasks import deliver_sms_outbox
+
+    now = timezone.now()
+    with transaction.atomic():
+        pending = SMSOutbox.objects.filter(
+            phone_number=phone_number, kind=kind, status=SMSOutbox.Status.PENDING
+        )
+        outbox = pending.select_for_update().first()
+        if outbox is None:
+            try:
+                with transaction.atomic():
+                    outbox = SMSOutbox.objects.create(
+                        phone_number=phone_number,
+                        kind=kind,
+                        message=seal_message(kind, message),
+                        otp=otp,
+                        expires_at=expires_at,
+                        next_attempt_at=now,
+                    )
+            except IntegrityError:
+                # A concurrent request queued one first; replace its content
+                outbox = pending.select_for_update().get()
+        if open_message(outbox) != message or outbox.otp_id != (otp.id if otp else None):
+            outbox.message = seal_message(kind, message)
+            outbox.otp = otp
+            outbox.expires_at = expires_at
+            outbox.next_attempt_at = now
+            outbox.save(
+                update_fields=["message", "otp", "expires_at", "next_attempt_at", "updated_at"]
+            )
+
+    transaction.on_commit(deliver_sms_outbox.delay)
+    return outbox
+
+
+def _claim_batch(batch_size):
+    """Mark up to batch_size due pending messages as sending and return them."""
+    with transaction.atomic():
+        ids = list(
+            SMSOutbox.objects.select_for_update(skip_locked=True)
+            .filter(status=SMSOutbox.Status.PENDING, next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        SMSOutbox.objects.filter(id__in=ids).update(
+            status=SMSOutbox.Status.SENDING, updated_at=timezone.now()
+        )
+    return list(SMSOutbox.objects.filter(id__in=ids).select_related("otp"))
+
+
+def _send(sms_service, limiter, outbox):
+    """Deliver one message; returns (outbox, gateway result or exception)."""
+    if outbox.expires_at is not None and outbox.expires_at <= timezone.now():
+        return outbox, None
+    limiter.acquire()
+    try:
+        return outbox, sms_service.send_sms(outbox.phone_number, open_message(outbox))
+    except requests.HTTPError as exc:
+        status_code = exc.response.status_code if exc.response is not None else None
+        if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+            return outbox, GatewayRejected(f"Gateway rejected message: HTTP {status_code}")
+        return outbox, exc
+    except requests.RequestException as exc:
+        return outbox, exc
+
+
+def _retry_delay(attempts):
+    delay = min(RETRY_MAX_SECONDS, RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return timedelta(seconds=delay * random.uniform(0.5, 1.0))
+
+
+def deliver_outbox(batch_size=OUTBOX_BATCH_SIZE):
+    """
+    Send one batch of due outbox messages.
+
+    Returns:
+        dict: Message counts keyed by outcome ("sent", "retry", "failed", "skipped")
+    """
+    from .services import SMSService
+
+    summary = {"sent": 0, "retry": 0, "failed": 0, "skipped": 0}
+    batch = _claim_batch(batch_size)
+    if not batch:
+        return summary
+
+    sms_service = SMSService()
+    limiter = get_gateway_limiter()
+    with ThreadPoolExecutor(max_workers=settings.SMS_DELIVERY_CONCURRENCY) as pool:
+        results = list(pool.map(lambda outbox: _send(sms_service, limiter, outbox), batch))
+
+    now = timezone.now()
+    otps = []
+    for outbox, result in results:
+        outbox.attempts += 1
+        outbox.updated_at = now
+        if isinstance(result, GatewayRejected):
+            outbox.status = SMSOutbox.Status.FAILED
+            outbox.last_error = str(result)
+        elif isinstance(result, Exception):
+            outbox.last_error = f"{type(result).__name__}: {result}"[:1000]
+            if outbox.attempts >= SMS_MAX_ATTEMPTS:
+                outbox.status = SMSOutbox.Status.FAILED
+            else:
+                outbox.status = SMSOutbox.Status.PENDING
+                outbox.next_attempt_at = now + _retry_delay(outbox.attempts)
+                summary["retry"] += 1
+                continue
+        elif result is None:
+            outbox.status = SMSOutbox.Status.SKIPPED
+            outbox.last_error = (
+                "Expired before delivery."
+                if outbox.expires_at is not None and outbox.expires_at <= now
+                else "SMS_API_KEY not configured."
+            )
+        else:
+            outbox.status = SMSOutbox.Status.SENT
+            outbox.sent_at = now
+            outbox.reference = str(result.get("MessageId", ""))
+            if outbox.otp is not None:
+                outbox.otp.reference = outbox.reference
+                otps.append(outbox.otp)
+        if outbox.kind in SENSITIVE_KINDS:
+            outbox.message = ""
+        summary[outbox.status] += 1
+
+    finished = []
+    retries = []
+    for outbox, _ in results:
+        if outbox.status == SMSOutbox.Status.PENDING:
+            retries.append(outbox)
+        else:
+            finished.append(outbox)
+
+    with transaction.atomic():
+        SMSOutbox.objects.bulk_update(finished, OUTBOX_RESULT_FIELDS)
+        # Only pending rows fall under the per-destination unique constraint
+        for outbox in retries:
+            try:
+                with transaction.atomic():
+                    outbox.save(update_fields=OUTBOX_RESULT_FIELDS)
+            except IntegrityError:
+                # A newer message for the same destination was queued while
+                # this one was sending; the newer one supersedes the retry
+                outbox.status = SMSOutbox.Status.SKIPPED
+                outbox.last_error = "Superseded by a newer message."
+                if outbox.kind in SENSITIVE_KINDS:
+                    outbox.message = ""
+                outbox.save(update_fields=OUTBOX_RESULT_FIELDS)
+                summary["retry"] -= 1
+                summary["skipped"] += 1
+        if otps:
+            SMSOTPRequest.objects.bulk_update(otps, ["reference"])
+
+    for outbox, result in results:
+        if outbox.status == SMSOutbox.Status.FAILED:
+            logger.warning(
+                f"SMS #{outbox.id} to {outbox.phone_number} failed after "
+                f"{outbox.attempts} attempts: {outbox.last_error}"
+            )
+    return summary
+
+
+def sweep_outbox():
+    """
+    Requeue messages orphaned in "sending", skip expired pending messages and
+    purge old finished messages.
+
+    Returns:
+        dict: {"requeued": int, "purged": int, "due": bool}
+    """
+    now = timezone.now()
+    requeued = 0
+    for outbox in SMSOutbox.objects.filter(
+        status=SMSOutbox.Status.SENDING,
+        updated_at__lt=now - timedelta(minutes=STALE_SENDING_MINUTES),
+    ):
+        try:
+            with transaction.atomic():
+                requeued += SMSOutbox.objects.filter(
+                    id=outbox.id, status=SMSOutbox.Status.SENDING
+                ).update(status=SMSOutbox.Status.PENDING, next_attempt_at=now)
+        except IntegrityError:
+            # Superseded by a newer pending message for the destination
+            SMSOutbox.objects.filter(id=outbox.id).update(
+                status=SMSOutbox.Status.SKIPPED,
+                last_error="Superseded by a newer message.",
+                message="" if outbox.kind in SENSITIVE_KINDS else outbox.message,
+            )
+
+    # Expired messages are never sent; drop them (and their text) unclaimed
+    SMSOutbox.objects.filter(status=SMSOutbox.Status.PENDING, expires_at__lte=now).update(
+        status=SMSOutbox.Status.SKIPPED,
+        last_error="Expired before delivery.",
+        message="",
+        updated_at=now,
+    )
+
+    purged, _ = SMSOutbox.objects.filter(
+        status__in=[SMSOutbox.Status.SENT, SMSOutbox.Status.FAILED, SMSOutbox.Status.SKIPPED],
+        created_at__lt=now - timedelta(days=OUTBOX_RETENTION_DAYS),
+    ).delete()
+
+    due = SMSOutbox.objects.filter(
+        status=SMSOutbox.Status.PENDING, next_attempt_at__lte=now
+    ).exists()
+    return {"requeued": requeued, "purged": purged, "due": due}
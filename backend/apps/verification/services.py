@@ -1,5 +1,5 @@
 import logging
-import random
+import secrets
 import string
 from datetime import timedelta
 
@@ -7,43 +7,48 @@ import requests
 from django.conf import settings
 from django.utils import timezone
 
-from .models import DeviceFingerprint, GeDVerification, SMSOTPRequest
+from .models import DeviceFingerprint, GeDVerification, OTPAuditEvent, SMSOutbox
+from .otp_store import (
+    OTP_EXPIRY_MINUTES,
+    OTP_MAX_ATTEMPTS,
+    IssuedOTP,
+    OTPStatus,
+    get_otp_store,
+    record_audit_event,
+)
 
 logger = logging.getLogger(__name__)
 
-OTP_EXPIRY_MINUTES = 5
-OTP_MAX_ATTEMPTS = 5
-
 
 class SMSService:
     """Wrapper around smsoffice.ge API."""
 
-    BASE_URL = "https://smsoffice.ge/api/v2"
+    def __init__(self):
+        self.base_url = settings.SMS_GATEWAY_URL
 
     @staticmethod
     def generate_code() -> str:
         """Generate a 6-digit OTP code."""
-        return "".join(random.choices(string.digits, k=6))
+        return "".join(secrets.choice(string.digits) for _ in range(6))
 
-    def create_otp(self, phone_number: str) -> SMSOTPRequest:
-        """Create an OTP record."""
-        code = self.generate_code()
-        expires_at = timezone.now() + timedelta(minutes=OTP_EXPIRY_MINUTES)
+    def send_sms(self, phone_number: str, message: str) -> dict | None:
+        """
+        Send SMS via smsoffice.ge API over the pooled gateway session.
 
-        return SMSOTPRequest.objects.create(
-            phone_number=phone_number,
-            code=code,
-            expires_at=expires_at,
-        )
+        Called by the outbox worker (apps.verification.outbox); web requests
+        queue messages with enqueue_sms() instead.
+
+        Raises:
+            requests.RequestException: On network errors or non-2xx responses
+        """
+        from .outbox import get_gateway_session
 
-    def send_sms(self, phone_number: str, message: str) -> dict | None:
-        """Send SMS via smsoffice.ge API."""
         if not settings.SMS_API_KEY:
             logger.warning("SMS_API_KEY not configured, skipping SMS send")
             return None
 
-        response = requests.post(
-            f"{self.BASE_URL}/send/",
+        response = get_gateway_session().post(
+            f"{self.base_url}/send/",
             json={
                 "key": settings.SMS_API_KEY,
                 "destination": phone_number,
@@ -55,48 +60,42 @@ class SMSService:
         response.raise_for_status()
         return response.json()
 
-    def send_otp(self, phone_number: str) -> SMSOTPRequest:
-        """Generate OTP, persist it, send via SMS."""
-        otp = self.create_otp(phone_number)
-        message = f"Your Girchi verification code: {otp.code}"
+    def send_otp(self, phone_number: str) -> IssuedOTP:
+        """Issue an OTP in the configured store and queue its SMS."""
+        from django.db import transaction
 
-        try:
-            result = self.send_sms(phone_number, message)
-            if result:
-                otp.reference = str(result.get("MessageId", ""))
-                otp.save(update_fields=["reference"])
-        except requests.RequestException:
-            logger.exception("Failed to send OTP SMS to %s", phone_number)
+        from .outbox import enqueue_sms
+
+        expires_at = timezone.now() + timedelta(minutes=OTP_EXPIRY_MINUTES)
+        with transaction.atomic():
+            otp = get_otp_store().issue(phone_number, self.generate_code(), expires_at)
+            enqueue_sms(
+                phone_number,
+                f"Your Girchi verification code: {otp.code}",
+                kind=SMSOutbox.Kind.OTP,
+                otp=otp.record,
+                expires_at=expires_at,
+            )
 
+        record_audit_event(phone_number, OTPAuditEvent.Event.ISSUED)
         return otp
 
     @staticmethod
     def verify_otp(phone_number: str, code: str) -> tuple[bool, str]:
-        """Validate OTP code against stored record."""
-        try:
-            otp = SMSOTPRequest.objects.filter(
-                phone_number=phone_number,
-                is_verified=False,
-            ).latest("created_at")
-        except SMSOTPRequest.DoesNotExist:
-            return False, "No OTP found for this phone number."
-
-        if otp.is_expired:
-            return False, "OTP has expired. Please request a new one."
-
-        if otp.attempts >= OTP_MAX_ATTEMPTS:
-            return False, "Too many attempts. Please request a new OTP."
-
-        otp.attempts += 1
-
-        if otp.code != code:
-            otp.save(update_fields=["attempts"])
-            remaining = OTP_MAX_ATTEMPTS - otp.attempts
+        """Validate OTP code against the configured store."""
+        result = get_otp_store().verify(phone_number, code)
+        record_audit_event(phone_number, result.status, result.attempts)
+
+        if result.status == OTPStatus.VERIFIED:
+            return True, "Phone number verified."
+        if result.status == OTPStatus.INVALID:
+            remaining = OTP_MAX_ATTEMPTS - result.attempts
             return False, f"Invalid code. {remaining} attempts remaining."
-
-        otp.is_verified = True
-        otp.save(update_fields=["attempts", "is_verified"])
-        return True, "Phone number verified."
+        if result.status == OTPStatus.LOCKED:
+            return False, "Too many attempts. Please request a new OTP."
+        if result.status == OTPStatus.EXPIRED:
+            return False, "OTP has expired. Please request a new one."
+        return False, "No OTP found for this phone number."
 
 
 class GeDService:
@@ -157,26 +156,40 @@ class GeDService:
 
 
 class DeviceFingerprintService:
-    """Analyze device fingerprints for duplicate/suspicious patterns."""
+    """Record device fingerprints; suspicion is precomputed by the clustering job."""
 
     @staticmethod
     def check_and_save(
         user, fingerprint_hash: str, device_data: dict, ip_address: str | None = None
     ) -> tuple[DeviceFingerprint, bool]:
         """
-        Store fingerprint and check for suspicious duplicates.
+        Upsert the (user, fingerprint_hash) row and return its precomputed flag.
+
+        New rows inherit the flag of the user's other devices until the next
+        clustering run (apps.verification.clustering).
         Returns (fingerprint, is_suspicious) tuple.
         """
-        is_suspicious = DeviceFingerprint.objects.filter(
-            fingerprint_hash=fingerprint_hash,
-        ).exclude(user=user).exists()
-
-        fingerprint = DeviceFingerprint.objects.create(
-            user=user,
-            fingerprint_hash=fingerprint_hash,
-            device_data=device_data,
-            ip_address=ip_address,
-            is_flagged=is_suspicious,
-        )
-
-        return fingerprint, is_suspicious
+        from django.db import IntegrityError, transaction
+        from django.db.models import F
+
+        seen = {"device_data": device_data, "ip_address": ip_address, "last_seen": timezone.now()}
+        fingerprints = DeviceFingerprint.objects.filter(user=user, fingerprint_hash=fingerprint_hash)
+
+        if not fingerprints.update(seen_count=F("seen_count") + 1, **seen):
+            try:
+                with transaction.atomic():
+                    fingerprint = DeviceFingerprint.objects.create(
+                        user=user,
+                        fingerprint_hash=fingerprint_hash,
+                        is_flagged=DeviceFingerprint.objects.filter(
+                            user=user, is_flagged=True
+                        ).exists(),
+                        **seen,
+                    )
+                return fingerprint, fingerprint.is_flagged
+            except IntegrityError:
+                # Created by a concurrent submission
+                fingerprints.update(seen_count=F("seen_count") + 1, **seen)
+
+        fingerprint = fingerprints.get()
+        return fingerprint, fingerprint.is_flagged
@@ -9,18 +9,107 @@ logger = logging.getLogger(__name__)
 
 @shared_task
 def send_otp_sms(phone_number: str):
-    """Send OTP via SMS asynchronously."""
+    """Create an OTP and queue its SMS."""
     from .services import SMSService
 
     sms_service = SMSService()
     sms_service.send_otp(phone_number)
 
 
+@shared_task
+def deliver_sms_outbox():
+    """
+    Drain due messages from the SMS outbox (routed to the "sms" queue).
+
+    Re-queues itself while full batches keep coming.
+    """
+    from .outbox import OUTBOX_BATCH_SIZE, deliver_outbox
+
+    summary = deliver_outbox()
+    if sum(summary.values()) >= OUTBOX_BATCH_SIZE:
+        deliver_sms_outbox.delay()
+    if summary["failed"] or summary["retry"]:
+        logger.warning(f"deliver_sms_outbox: {summary}")
+
+
+@shared_task
+def sweep_sms_outbox():
+    """
+    Requeue orphaned outbox messages, retry due ones and purge old rows.
+
+    Periodic task (runs every 30 seconds via Celery Beat).
+    """
+    from .outbox import sweep_outbox
+
+    summary = sweep_outbox()
+    if summary["due"]:
+        deliver_sms_outbox.delay()
+    if summary["requeued"] or summary["purged"]:
+        logger.info(
+            f"sweep_sms_outbox: {summary['requeued']} requeued, {summary['purged']} purged."
+        )
+
+
+@shared_task
+def record_otp_event(phone_number: str, event: str, attempts: int, occurred_at: str):
+    """Append an OTPAuditEvent (queued by otp_store.record_audit_event)."""
+    from django.utils.dateparse import parse_datetime
+
+    from .models import OTPAuditEvent
+
+    OTPAuditEvent.objects.create(
+        phone_number=phone_number,
+        event=event,
+        attempts=attempts,
+        occurred_at=parse_datetime(occurred_at),
+    )
+
+
 @shared_task
 def cleanup_expired_otps():
-    """Delete OTP records older than 24 hours."""
+    """
+    Delete OTP records older than 24 hours (database OTP store).
+
+    Periodic task (runs every hour via Celery Beat).
+    """
     from .models import SMSOTPRequest
 
     cutoff = timezone.now() - timedelta(hours=24)
     deleted_count, _ = SMSOTPRequest.objects.filter(created_at__lt=cutoff).delete()
     logger.info("Cleaned up %d expired OTP records", deleted_count)
+
+
+@shared_task
+def sync_ged_data():
+    """
+    Re-fetch GeD data of verified users from girchi.com (GP-065).
+
+    Periodic task (runs every 6 hours via Celery Beat); see
+    apps.verification.ged_sync.
+    """
+    from .ged_sync import sync_ged_data as run_sync
+
+    summary = run_sync()
+    if summary is None:
+        logger.info("sync_ged_data: another sync is running, skipped.")
+        return
+    logger.info(
+        f"sync_ged_data: {summary['synced']} synced, {summary['flagged']} flagged for review, "
+        f"{summary['errors']} errors."
+    )
+
+
+@shared_task
+def cluster_device_fingerprints():
+    """
+    Cluster users by device signals and refresh fingerprint flags.
+
+    Periodic task (runs daily via Celery Beat); see apps.verification.clustering.
+    """
+    from .clustering import analyze_devices, store_device_clusters
+
+    summary = store_device_clusters(analyze_devices())
+    logger.info(
+        f"cluster_device_fingerprints: {summary['stored']} clusters, "
+        f"{summary['flagged']} users flagged, {summary['unflagged']} unflagged."
+    )
@@ -4,7 +4,12 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.throttling import OTPRateThrottle
+from common.throttling import (
+    OTPIPRateThrottle,
+    OTPRateThrottle,
+    OTPVerifyIPRateThrottle,
+    OTPVerifyRateThrottle,
+)
 
 from .serializers import (
     DeviceFingerprintSerializer,
@@ -22,7 +27,7 @@ class SendOTPView(APIView):
     """Send OTP to a phone number."""
 
     permission_classes = [AllowAny]
-    throttle_classes = [OTPRateThrottle]
+    throttle_classes = [OTPRateThrottle, OTPIPRateThrottle]
 
     def post(self, request):
         serializer = SendOTPSerializer(data=request.data)
@@ -41,6 +46,7 @@ class VerifyOTPView(APIView):
     """Verify an OTP code."""
 
     permission_classes = [AllowAny]
+    throttle_classes = [OTPVerifyRateThrottle, OTPVerifyIPRateThrottle]
 
     def post(self, request):
         serializer = VerifyOTPSerializer(data=request.data)
@@ -83,12 +83,11 @@ class IsAtistavi(BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        # Check if user holds any tier=10 position
+        # Check if user holds any tier=10 position (request-scoped capability profile)
+        from apps.accounts.capabilities import get_capabilities
         from apps.governance.models import GovernanceTier
 
-        return request.user.held_positions.filter(
-            tier=GovernanceTier.ATISTAVI, is_active=True
-        ).exists()
+        return get_capabilities(request.user, request.auth).holds_tier(GovernanceTier.ATISTAVI)
 
 
 class IsLeaderAtTier(BasePermission):
@@ -132,14 +131,10 @@ class IsLeaderAtTier(BasePermission):
         if not request.user.is_authenticated:
             return False
 
-        # Check if user holds any position at min_tier or higher
-        from apps.governance.models import LeaderPosition
+        # Check if user holds any position at min_tier or higher (request-scoped capability profile)
+        from apps.accounts.capabilities import get_capabilities
 
-        return LeaderPosition.objects.filter(
-            holder=request.user,
-            tier__gte=self.min_tier,  # Greater than or equal
-            is_active=True,
-        ).exists()
+        return get_capabilities(request.user, request.auth).is_leader_at_least(self.min_tier)
 
 
 # Convenience aliases for common tier requirements
@@ -1,7 +1,106 @@
+"""
+Redis-backed request throttling.
+
+RedisRateThrottle replaces DRF's SimpleRateThrottle (which rewrites a list
+of timestamps in the cache on every request) with GCRA, the generic cell rate
+algorithm: each key stores a single "theoretical arrival time" and one Lua
+script checks and advances it atomically, so the limit holds across workers
+at O(1) per request. A "5/hour" rate allows bursts of up to 5 requests and then
+one request every 12 minutes.
+
+Rates are configured per scope in REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"].
+Denied requests get DRF's 429 response with a Retry-After header. Allowed and
+denied counts are kept per scope (get_throttle_metrics, served to staff by
+common.views.ThrottleMetricsView).
+
+If Redis is unreachable requests are allowed (fail open) and logged.
+"""
+
+import logging
+import math
+
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from rest_framework.permissions import SAFE_METHODS
 from rest_framework.throttling import SimpleRateThrottle
 
+logger = logging.getLogger(__name__)
+
+THROTTLE_METRICS_KEY = "throttle:metrics"
+
+# KEYS[1]: throttle key; KEYS[2]: metrics hash
+# ARGV[1]: emission interval (ms); ARGV[2]: period (ms); ARGV[3]: scope
+# Returns {allowed, wait_ms}
+GCRA_SCRIPT = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local period = tonumber(ARGV[2])
+
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+
+-- Allowed while the backlog (tat - now) leaves room for one more request
+local wait = tat + interval - period - now
+if wait > 0 then
+    redis.call('HINCRBY', KEYS[2], ARGV[3] .. ':denied', 1)
+    return {0, wait}
+end
+
+tat = tat + interval
+redis.call('SET', KEYS[1], tat, 'PX', math.ceil(tat - now))
+redis.call('HINCRBY', KEYS[2], ARGV[3] .. ':allowed', 1)
+return {1, 0}
+"""
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """GCRA throttle in Redis; subclasses set scope and get_cache_key()."""
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        period_ms = self.duration * 1000
+        try:
+            conn = get_redis_connection("default")
+            allowed, wait_ms = conn.register_script(GCRA_SCRIPT)(
+                keys=[self.key, THROTTLE_METRICS_KEY],
+                args=[period_ms / self.num_requests, period_ms, self.scope],
+            )
+        except RedisError:
+            logger.exception(f"Throttle backend unavailable, allowing request ({self.scope})")
+            return True
 
-class OTPRateThrottle(SimpleRateThrottle):
+        self.wait_ms = float(wait_ms)
+        return bool(allowed)
+
+    def wait(self):
+        """Seconds until the next request is allowed (Retry-After)."""
+        return math.ceil(self.wait_ms / 1000)
+
+
+class AnonRateThrottle(RedisRateThrottle):
+    """Rate limit anonymous requests per client IP."""
+
+    scope = "anon"
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class OTPRateThrottle(RedisRateThrottle):
     """Rate limit OTP requests: 5 per hour per phone number."""
 
     scope = "otp"
@@ -14,3 +113,65 @@ class OTPRateThrottle(SimpleRateThrottle):
             "scope": self.scope,
             "ident": phone,
         }
+
+
+class OTPIPRateThrottle(RedisRateThrottle):
+    """Rate limit OTP requests per client IP (one IP cycling phone numbers)."""
+
+    scope = "otp_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class OTPVerifyRateThrottle(OTPRateThrottle):
+    """Rate limit OTP guesses per phone number across re-issued codes."""
+
+    scope = "otp_verify"
+
+
+class OTPVerifyIPRateThrottle(OTPIPRateThrottle):
+    """Rate limit OTP guesses per client IP (one IP cycling phone numbers)."""
+
+    scope = "otp_verify_ip"
+
+
+class WriteRateThrottle(RedisRateThrottle):
+    """Rate limit a user's writes (unsafe methods); subclasses set scope."""
+
+    def get_cache_key(self, request, view):
+        if request.method in SAFE_METHODS or not request.user.is_authenticated:
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": request.user.pk,
+        }
+
+
+class VoteRateThrottle(WriteRateThrottle):
+    scope = "vote"
+
+
+class SignRateThrottle(WriteRateThrottle):
+    scope = "sign"
+
+
+class EndorseRateThrottle(WriteRateThrottle):
+    scope = "endorse"
+
+
+def get_throttle_metrics():
+    """
+    Return allowed / denied request counts per throttle scope.
+
+    Returns:
+        dict: {scope: {"allowed": int, "denied": int}}
+    """
+    metrics = {}
+    for field, value in get_redis_connection("default").hgetall(THROTTLE_METRICS_KEY).items():
+        scope, _, outcome = field.decode().rpartition(":")
+        metrics.setdefault(scope, {"allowed": 0, "denied": 0})[outcome] = int(value)
+    return metrics
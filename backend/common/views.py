@@ -0,0 +1,19 @@
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .throttling import get_throttle_metrics
+
+
+class ThrottleMetricsView(APIView):
+    """
+    Cumulative allowed / denied request counts per throttle scope.
+
+    Permissions: IsAdminUser
+    """
+
+    permission_classes = [IsAdminUser]
+    throttle_classes = []
+
+    def get(self, request):
+        return Response(get_throttle_metrics())
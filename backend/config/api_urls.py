@@ -1,5 +1,7 @@
 from django.urls import include, path
 
+from common.views import ThrottleMetricsView
+
 urlpatterns = [
     path("auth/", include("apps.accounts.urls")),
     path("verification/", include("apps.verification.urls")),
@@ -9,4 +11,5 @@ urlpatterns = [
     path("sos/", include("apps.sos.urls")),
     path("initiatives/", include("apps.initiatives.urls")),
     path("arbitration/", include("apps.arbitration.urls")),
+    path("throttle-metrics/", ThrottleMetricsView.as_view(), name="throttle-metrics"),
 ]
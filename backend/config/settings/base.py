@@ -136,11 +136,18 @@ REST_FRAMEWORK = {
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
+        "common.throttling.AnonRateThrottle",
     ],
+    # Per-scope rates for common.throttling (GCRA: bursts up to the count)
     "DEFAULT_THROTTLE_RATES": {
         "anon": "100/hour",
         "otp": "5/hour",
+        "otp_ip": "20/hour",
+        "otp_verify": "10/hour",
+        "otp_verify_ip": "30/hour",
+        "vote": "10/minute",
+        "sign": "30/minute",
+        "endorse": "20/hour",
     },
 }
 
@@ -158,8 +165,13 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    "TOKEN_OBTAIN_SERIALIZER": "apps.accounts.capabilities.CapabilityTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "apps.accounts.capabilities.CapabilityTokenRefreshSerializer",
 }
 
+# Embed the capability profile (role, status, held positions) in access tokens
+JWT_CAPABILITY_CLAIMS = env.bool("JWT_CAPABILITY_CLAIMS", default=True)
+
 # --- CORS ---
 
 CORS_ALLOWED_ORIGINS = env.list("CORS_ALLOWED_ORIGINS", default=[])
@@ -187,11 +199,42 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
+# SMS delivery runs on its own queue so a slow gateway never delays other tasks
+CELERY_TASK_ROUTES = {
+    "apps.verification.tasks.deliver_sms_outbox": {"queue": "sms"},
+}
+
 CELERY_BEAT_SCHEDULE = {
-    # Governance: auto-transition elections every 15 minutes
+    # Governance: safety-net sweep for election transitions (exact-time
+    # transitions are one-off clocked entries per election)
     "close-expired-elections": {
         "task": "apps.governance.tasks.close_expired_elections",
-        "schedule": 60 * 15,  # 15 minutes
+        "schedule": 60 * 60,  # 1 hour
+    },
+    # Governance: drain buffered ballots into Vote rows
+    "ingest-buffered-ballots": {
+        "task": "apps.governance.tasks.ingest_buffered_ballots",
+        "schedule": 5,  # 5 seconds
+    },
+    # Verification: purge old OTP rows (database OTP store)
+    "cleanup-expired-otps": {
+        "task": "apps.verification.tasks.cleanup_expired_otps",
+        "schedule": 60 * 60,  # 1 hour
+    },
+    # Verification: re-fetch GeD data of verified users (GP-065)
+    "sync-ged-data": {
+        "task": "apps.verification.tasks.sync_ged_data",
+        "schedule": 60 * 60 * 6,  # 6 hours
+    },
+    # Verification: device fingerprint clustering and flags daily
+    "cluster-device-fingerprints": {
+        "task": "apps.verification.tasks.cluster_device_fingerprints",
+        "schedule": 60 * 60 * 24,  # 24 hours
+    },
+    # Verification: retry due SMS and requeue orphaned ones
+    "sweep-sms-outbox": {
+        "task": "apps.verification.tasks.sweep_sms_outbox",
+        "schedule": 30,  # 30 seconds
     },
     # SOS: auto-escalate stale reports every hour
     "escalate-sos-timeout": {
@@ -203,6 +246,16 @@ CELERY_BEAT_SCHEDULE = {
         "task": "apps.initiatives.tasks.check_initiative_thresholds",
         "schedule": 60 * 30,  # 30 minutes
     },
+    # Communities: repair endorsement quota counters from active endorsements
+    "reconcile-endorsement-quotas": {
+        "task": "apps.communities.tasks.reconcile_endorsement_quotas",
+        "schedule": 60 * 60,  # 1 hour
+    },
+    # Communities: endorsement graph fraud-ring analysis daily
+    "analyze-endorsement-fraud": {
+        "task": "apps.communities.tasks.analyze_endorsement_fraud",
+        "schedule": 60 * 60 * 24,  # 24 hours
+    },
     # Arbitration: auto-close decided cases daily
     "auto-close-decided-cases": {
         "task": "apps.arbitration.tasks.auto_close_decided_cases",
@@ -224,7 +277,24 @@ SPECTACULAR_SETTINGS = {
 
 SMS_API_KEY = env("SMS_API_KEY", default="")
 SMS_SENDER = env("SMS_SENDER", default="Girchi")
+# Point at scripts/sms_gateway_stub.py for load testing
+SMS_GATEWAY_URL = env("SMS_GATEWAY_URL", default="https://smsoffice.ge/api/v2")
+# Outbox delivery: messages per second and parallel requests per worker
+SMS_GATEWAY_RATE = env.float("SMS_GATEWAY_RATE", default=20.0)
+SMS_DELIVERY_CONCURRENCY = env.int("SMS_DELIVERY_CONCURRENCY", default=4)
+
+# --- OTP ---
+# Storage backend: apps.verification.otp_store.RedisOTPStore or DatabaseOTPStore
+OTP_STORE = env("OTP_STORE", default="apps.verification.otp_store.RedisOTPStore")
+# Append every OTP issue / verification outcome to OTPAuditEvent (async)
+OTP_AUDIT_TRAIL = env.bool("OTP_AUDIT_TRAIL", default=False)
 
 # --- GeD (girchi.com) ---
 
 GIRCHI_API_BASE_URL = env("GIRCHI_API_BASE_URL", default="https://dev-admin.girchi.com")
+# Strapi API token for server-side reads (periodic GeD sync); point the base
+# URL at scripts/fake_strapi.py for load testing
+GIRCHI_API_TOKEN = env("GIRCHI_API_TOKEN", default="")
+# GeD sync: requests per second and parallel requests
+GED_SYNC_RATE = env.float("GED_SYNC_RATE", default=10.0)
+GED_SYNC_CONCURRENCY = env.int("GED_SYNC_CONCURRENCY", default=8)
@@ -0,0 +1,88 @@
+"""
+Fake girchi.com Strapi API for testing the GeD sync.
+
+Serves GET /api/users-permissions/users/{id} with a deterministic GeD
+balance per id. Every MISSING_EVERY-th id answers 404, every ZERO_EVERY-th
+has no GeD, FAILURE_RATE of the requests fail with HTTP 503, and each
+request sleeps LATENCY_MS. Prints throughput every few seconds.
+
+Usage:
+  PORT=1337 LATENCY_MS=100 FAILURE_RATE=0.01 python scripts/fake_strapi.py
+
+  # then run the sync against it:
+  GIRCHI_API_BASE_URL=http://<host>:1337 GIRCHI_API_TOKEN=fake \
+    python manage.py sync_ged_data --force
+"""
+import json
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = int(os.environ.get("PORT", "1337"))
+LATENCY_MS = int(os.environ.get("LATENCY_MS", "100"))
+FAILURE_RATE = float(os.environ.get("FAILURE_RATE", "0"))
+MISSING_EVERY = int(os.environ.get("MISSING_EVERY", "50"))
+ZERO_EVERY = int(os.environ.get("ZERO_EVERY", "20"))
+REPORT_SECONDS = 5
+
+USER_PATH = re.compile(r"^/api/users-permissions/users/(\d+)/?$")
+
+served = {"count": 0}
+served_lock = threading.Lock()
+
+
+class StrapiHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        match = USER_PATH.match(self.path)
+        if not match:
+            return self._reply(404, {"error": {"status": 404, "name": "NotFoundError"}})
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            return self._reply(401, {"error": {"status": 401, "name": "UnauthorizedError"}})
+
+        time.sleep(LATENCY_MS / 1000)
+        with served_lock:
+            served["count"] += 1
+        if random.random() < FAILURE_RATE:
+            return self._reply(503, {"error": {"status": 503, "name": "ServiceUnavailable"}})
+
+        user_id = int(match.group(1))
+        if user_id % MISSING_EVERY == 0:
+            return self._reply(404, {"error": {"status": 404, "name": "NotFoundError"}})
+        balance = 0 if user_id % ZERO_EVERY == 0 else (user_id * 37) % 1000 + 1
+        self._reply(
+            200,
+            {"id": user_id, "username": f"user{user_id}", "ged_balance": f"{balance}.00"},
+        )
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def report():
+    previous = 0
+    while True:
+        time.sleep(REPORT_SECONDS)
+        with served_lock:
+            count = served["count"]
+        print(f"served={count} rate={(count - previous) / REPORT_SECONDS:.1f}/s", flush=True)
+        previous = count
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("0.0.0.0", PORT), StrapiHandler)
+    threading.Thread(target=report, daemon=True).start()
+    print(f"Fake Strapi on :{PORT} (latency {LATENCY_MS}ms, failure rate {FAILURE_RATE})")
+    server.serve_forever()
@@ -0,0 +1,120 @@
+"""
+Load-test buffered ballot ingestion.
+
+Creates a throwaway parliamentary election with buffered_ingestion enabled,
+casts BALLOTS votes through the vote view from CONCURRENCY threads, then
+drains the ballot stream and reports throughput for both phases. All data
+created by the script is deleted at the end.
+
+Usage:
+  docker-compose exec -T -e BALLOTS=20000 -e CONCURRENCY=32 web \
+    python manage.py shell < scripts/load_ballots.py
+"""
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.accounts.models import User
+from apps.governance.ballots import drain_ballot_stream
+from apps.governance.models import Candidacy, Election, ElectionStatus, ElectionType
+from apps.governance.views import ElectionViewSet
+
+BALLOTS = int(os.environ.get("BALLOTS", "5000"))
+CONCURRENCY = int(os.environ.get("CONCURRENCY", "16"))
+CANDIDATES = 5
+
+run_id = uuid.uuid4().hex[:8]
+now = timezone.now()
+
+# --- Fixtures ---
+print(f"Creating {BALLOTS} voters and {CANDIDATES} candidates (run {run_id})...")
+User.objects.bulk_create(
+    [
+        User(
+            phone_number=f"+load{run_id}{i:07d}",
+            role=User.Role.GEDER,
+            member_status=User.MemberStatus.ACTIVE,
+            is_phone_verified=True,
+            onboarding_completed=True,
+        )
+        for i in range(BALLOTS + CANDIDATES)
+    ],
+    batch_size=2000,
+)
+users = list(User.objects.filter(phone_number__startswith=f"+load{run_id}").order_by("id"))
+voters, candidates = users[:BALLOTS], users[BALLOTS:]
+
+election = Election.objects.create(
+    election_type=ElectionType.PARLIAMENTARY,
+    status=ElectionStatus.NOMINATION,
+    nomination_start=now - timedelta(days=2),
+    nomination_end=now - timedelta(days=1),
+    voting_start=now - timedelta(minutes=1),
+    voting_end=now + timedelta(hours=1),
+    buffered_ingestion=True,
+)
+candidacies = [
+    Candidacy.objects.create(election=election, candidate=candidate, is_approved=True)
+    for candidate in candidates
+]
+Election.open_due_voting([election.id])
+election.refresh_from_db()
+print(f"Election {election.id}: voter roll frozen with {election.eligible_voter_count} entries")
+
+# --- Enqueue phase ---
+vote_view = ElectionViewSet.as_view({"post": "vote"})
+factory = APIRequestFactory()
+
+
+def cast(index):
+    request = factory.post(
+        f"/api/v1/governance/elections/{election.id}/vote/",
+        {"candidacy_id": candidacies[index % CANDIDATES].id},
+        format="json",
+    )
+    force_authenticate(request, user=voters[index])
+    response = vote_view(request, pk=election.id)
+    close_old_connections()
+    return response.status_code
+
+
+started = time.perf_counter()
+with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+    codes = list(executor.map(cast, range(BALLOTS)))
+enqueue_seconds = time.perf_counter() - started
+
+accepted = codes.count(202)
+print(
+    f"Enqueue: {accepted}/{BALLOTS} accepted in {enqueue_seconds:.2f}s "
+    f"({BALLOTS / enqueue_seconds:.0f} ballots/s, concurrency={CONCURRENCY})"
+)
+if accepted != BALLOTS:
+    print(f"  Unexpected status codes: { {c: codes.count(c) for c in set(codes) if c != 202} }")
+
+# --- Drain phase ---
+started = time.perf_counter()
+processed = 0
+while batch := drain_ballot_stream():
+    processed += batch
+drain_seconds = time.perf_counter() - started
+print(
+    f"Drain: {processed} ballots ingested in {drain_seconds:.2f}s "
+    f"({processed / max(drain_seconds, 1e-9):.0f} ballots/s)"
+)
+
+stored = election.votes.count()
+counted = election.total_votes
+print(f"Votes stored: {stored}, counter total: {counted}")
+if stored != accepted or counted != accepted:
+    print("  MISMATCH between accepted ballots, stored votes and counters")
+
+# --- Cleanup ---
+election.delete()
+User.objects.filter(phone_number__startswith=f"+load{run_id}").delete()
+print("Cleaned up load-test data.")
@@ -4,6 +4,8 @@ Seed dummy territory data for testing.
 Usage:
   docker-compose exec -T web python manage.py shell < scripts/seed_territories.py
 """
+from django.core.management import call_command
+
 from apps.territories.models import District, Precinct, Region
 
 # --- Regions ---
@@ -111,3 +113,6 @@ for data in precincts_data:
     print(f"  [{status}] Precinct: {precinct.name} ({precinct.cec_code})")
 
 print(f"\nDone! {Region.objects.count()} regions, {District.objects.count()} districts, {Precinct.objects.count()} precincts")
+
+# Prebuild the mobile territory bundle for the new data
+call_command("build_territory_bundle")
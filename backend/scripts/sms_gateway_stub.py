@@ -0,0 +1,77 @@
+"""
+Stub smsoffice.ge gateway for load-testing SMS outbox delivery.
+
+Accepts POST /send/, sleeps LATENCY_MS, fails FAILURE_RATE of the requests
+with HTTP 503 and answers the rest like the real gateway. Prints throughput
+every few seconds.
+
+Usage:
+  PORT=8025 LATENCY_MS=150 FAILURE_RATE=0.05 python scripts/sms_gateway_stub.py
+
+  # then point the workers at it (and set any non-empty SMS_API_KEY):
+  SMS_GATEWAY_URL=http://<host>:8025 SMS_API_KEY=stub
+"""
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PORT = int(os.environ.get("PORT", "8025"))
+LATENCY_MS = int(os.environ.get("LATENCY_MS", "150"))
+FAILURE_RATE = float(os.environ.get("FAILURE_RATE", "0"))
+REPORT_SECONDS = 5
+
+message_ids = itertools.count(1)
+counters = {"sent": 0, "failed": 0}
+counters_lock = threading.Lock()
+
+
+class GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if self.path.rstrip("/") != "/send":
+            return self._reply(404, {"Success": False, "Message": "Not found"})
+
+        time.sleep(LATENCY_MS / 1000)
+        if random.random() < FAILURE_RATE:
+            with counters_lock:
+                counters["failed"] += 1
+            return self._reply(503, {"Success": False, "Message": "Service unavailable"})
+
+        with counters_lock:
+            counters["sent"] += 1
+        self._reply(200, {"Success": True, "MessageId": next(message_ids)})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def report():
+    previous = 0
+    while True:
+        time.sleep(REPORT_SECONDS)
+        with counters_lock:
+            sent, failed = counters["sent"], counters["failed"]
+        print(f"sent={sent} failed={failed} rate={(sent - previous) / REPORT_SECONDS:.1f}/s", flush=True)
+        previous = sent
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("0.0.0.0", PORT), GatewayHandler)
+    threading.Thread(target=report, daemon=True).start()
+    print(f"SMS gateway stub on :{PORT} (latency {LATENCY_MS}ms, failure rate {FAILURE_RATE})")
+    server.serve_forever()